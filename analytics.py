@@ -0,0 +1,558 @@
+"""Headless analytics behind the dashboard tabs.
+
+Every tab of ``oppking.py`` (opportunities) and ``pd-hub.py`` (policies)
+gets one pure function here that takes the filtered rows (plus the
+``cube.Rollup`` or dimension frames it needs) and returns the KPIs, grouped
+tables and chart frames that tab shows, as a dict. Nothing here imports
+Streamlit, so the same numbers can be computed in a script, a benchmark, a
+batch job or a worker process; the apps only format and draw the results.
+
+Result frames are shared when a tab's summary is cached per filter state, so
+treat them as read-only.
+"""
+
+import numpy as np
+import pandas as pd
+
+from banding import HOT_BAND, TEMPERATURE_BAND_DISPLAY
+from chartdata import RAW_CHART_ROWS, binned_2d, histogram, stratified_sample
+from forecast import CLOSED_STAGES, scenario_totals
+from schema import join_dimensions, rep_profiles
+
+# Opportunity stages in funnel order
+STAGE_ORDER = ['Lead', 'Qualified', 'Needs Analysis', 'Proposal', 'Negotiation', 'Verbal Commitment', 'Closed Won', 'Closed Lost']
+FUNNEL_STAGES = STAGE_ORDER[:-1]
+
+# Deals this size or larger count as high-value / strategic
+HIGH_VALUE_DEAL = 500000
+
+# Days in the current stage after which a deal counts as stalled (dashboard, forecast risk)
+STALLED_DAYS = 45
+FORECAST_STALLED_DAYS = 60
+
+# Days to close that count as "closing soon"
+CLOSING_SOON_DAYS = 30
+
+# Rep pattern keys compared by the success DNA cards (sales team dimension columns)
+PATTERN_KEYS = (
+    "avg_activities_per_week", "avg_response_time_hours", "decision_maker_access_rate",
+    "proposal_win_rate", "avg_deal_size", "lead_conversion_rate", "cross_sell_rate",
+    "linkedin_connections", "client_satisfaction"
+)
+
+# Top 5 producers radar axes, each on a 0-100 scale
+RADAR_AXES = ('Premium', 'Policy Count', 'Bind Rate', 'Satisfaction', 'Avg Premium')
+
+
+# Opportunities (oppking.py)
+
+def pattern_insights(opportunities_df, sales_team_df):
+    """Top performer and underperformer rep patterns, their gaps, and both cohorts' rep names"""
+    # Get top performers (Elite tier + high performance scores)
+    top_performers = sales_team_df[
+        (sales_team_df['tier'] == 'Elite') &
+        (sales_team_df['performance_score'] >= 90)
+    ]['name'].tolist()
+
+    # Get underperformers
+    underperformers = sales_team_df[
+        (sales_team_df['performance_score'] < 85) |
+        (sales_team_df['tier'].isin(['Standard', 'Senior']))
+    ]['name'].tolist()
+
+    # Per-opportunity averages of the rep patterns, computed on the sales team dimension
+    # weighted by each rep's opportunity count
+    opportunity_counts = opportunities_df['sales_rep_id'].value_counts()
+    team = sales_team_df.assign(opportunity_count=sales_team_df['id'].map(opportunity_counts).fillna(0))
+
+    def cohort_patterns(names):
+        cohort = team[team['name'].isin(names) & (team['opportunity_count'] > 0)]
+        if len(cohort) == 0:
+            return {key: np.nan for key in PATTERN_KEYS}
+        return {key: np.average(cohort[key], weights=cohort['opportunity_count']) for key in PATTERN_KEYS}
+
+    success_patterns = cohort_patterns(top_performers)
+    underperformer_patterns = cohort_patterns(underperformers)
+
+    performance_gaps = {}
+    for key in success_patterns:
+        if key in underperformer_patterns:
+            gap = success_patterns[key] - underperformer_patterns[key]
+            gap_percent = (gap / success_patterns[key]) * 100 if success_patterns[key] != 0 else 0
+            performance_gaps[key] = {
+                "gap_absolute": gap,
+                "gap_percent": gap_percent,
+                "top_performer_avg": success_patterns[key],
+                "underperformer_avg": underperformer_patterns[key]
+            }
+
+    return success_patterns, underperformer_patterns, performance_gaps, top_performers, underperformers
+
+
+def pattern_team(full_df, sales_team_df):
+    """Rep profiles, the reps with opportunities, and the profiles of just those reps"""
+    profiles = rep_profiles(sales_team_df)
+    active_reps = set(full_df['sales_rep_name'].unique())
+    return profiles, active_reps, profiles[profiles.index.isin(list(active_reps))]
+
+
+def coaching_summary(comparison):
+    """Coaching view of a ``success_dna.compare_cohorts`` result.
+
+    A's three biggest leads (B's biggest gaps; only metrics where A is ahead,
+    so it may be empty), the metric where A leads least, the yearly revenue
+    B's reps gain by matching A's deal size over 12 deals (0 when A's deals
+    are not larger), and the gaps worth listing: the significant ones, or all
+    of them when single-rep cohorts leave no intervals, largest first.
+    """
+    reps_b = comparison.attrs['reps'][1]
+    deal_sizes = comparison['mean_a'], comparison['mean_b']
+    has_intervals = comparison['ci_low'].notna().any()
+    insights = comparison[comparison['significant']] if has_intervals else comparison
+    return {
+        'leads': comparison[comparison['advantage'] > 0].nlargest(3, 'advantage'),
+        'closest': comparison.nsmallest(1, 'advantage'),
+        'revenue_impact': max(0, (deal_sizes[0]['rep_avg_deal_size'] * 12 - deal_sizes[1]['rep_avg_deal_size'] * 12) * reps_b),
+        'has_intervals': has_intervals,
+        'insights': insights.reindex(insights['advantage'].abs().sort_values(ascending=False).index)
+    }
+
+
+def executive_summary(filtered_df, full_df, rollup):
+    """Executive Dashboard: pipeline KPIs, stalled / high-value / closing-soon cards, stage and temperature charts"""
+    totals = rollup.totals(['opportunity_value', 'weighted_value', 'temperature_score'])
+    by_stage = rollup.by('sales_stage', ['opportunity_value'])
+    by_temperature = rollup.by('temperature_band', ['opportunity_value'])
+    by_priority = rollup.by('priority', [])
+    hot_band = by_temperature.reindex([HOT_BAND]).fillna(0).iloc[0]
+
+    total_pipeline = totals['opportunity_value_sum']
+    values = filtered_df['opportunity_value']
+    stalled = filtered_df['days_in_stage'] > STALLED_DAYS
+    high_value = values >= HIGH_VALUE_DEAL
+    closing = (
+        (filtered_df['days_to_close'] <= CLOSING_SOON_DAYS) &
+        (filtered_df['days_to_close'] > 0) &
+        (~filtered_df['sales_stage'].isin(CLOSED_STAGES))
+    )
+
+    stage_data = by_stage[['opportunity_value_sum', 'count']].reset_index()
+    stage_data.columns = ['Sales Stage', 'Total Value', 'Count']
+    stage_data['Stage_Order'] = stage_data['Sales Stage'].apply(lambda x: STAGE_ORDER.index(x) if x in STAGE_ORDER else 999)
+
+    # Bands come from the shared temperature_band column, rolled up with the other KPIs
+    temperature_mix = pd.DataFrame({
+        'Temperature': by_temperature.index.map(TEMPERATURE_BAND_DISPLAY).astype(str),
+        'Value': by_temperature['opportunity_value_sum'].to_numpy()
+    }).sort_values('Temperature', ignore_index=True)
+
+    # Share of the pipeline held by the largest 20% of opportunities
+    filtered_pipeline = values.sum()
+    concentration = 0
+    if filtered_pipeline > 0:
+        concentration = filtered_df.nlargest(int(len(filtered_df) * 0.2), 'opportunity_value')['opportunity_value'].sum() / filtered_pipeline * 100
+
+    best_performer = best_product = best_source = "N/A"
+    if len(filtered_df) > 0:
+        best_performer = filtered_df.groupby('sales_rep_name', observed=True)['opportunity_value'].sum().idxmax()
+        best_product = filtered_df.groupby('product_line', observed=True)['opportunity_value'].sum().idxmax()
+        best_source = filtered_df.groupby('lead_source', observed=True)['opportunity_value'].sum().idxmax()
+
+    return {
+        'total_pipeline': total_pipeline,
+        'filtered_share': ((total_pipeline / full_df['opportunity_value'].sum()) - 1) * 100 if len(full_df) > 0 else 0,
+        'weighted_pipeline': totals['weighted_value_sum'],
+        'hot_count': int(hot_band['count']),
+        'hot_value': hot_band['opportunity_value_sum'],
+        'active_count': int(by_stage.loc[~by_stage.index.isin(CLOSED_STAGES), 'count'].sum()),
+        'avg_temperature': totals['temperature_score_mean'],
+        'critical_count': int(by_priority['count'].get('Critical', 0)),
+        'stalled_count': int(stalled.sum()),
+        'stalled_value': values[stalled].sum(),
+        'high_value_count': int(high_value.sum()),
+        'high_value_value': values[high_value].sum(),
+        'closing_count': int(closing.sum()),
+        'closing_value': values[closing].sum(),
+        'stages': stage_data.sort_values('Stage_Order'),
+        'temperature_mix': temperature_mix,
+        'concentration': concentration,
+        'high_risk_count': int((filtered_df['risk_level'] == 'High').sum()),
+        'best_performer': best_performer,
+        'best_product': best_product,
+        'best_source': best_source
+    }
+
+
+def hot_summary(filtered_df):
+    """Hot Opportunities KPIs: hot deal count and value, their average win probability, hot deals closing soon"""
+    # A mask over the filtered rows rather than a copy of the hot ones
+    hot = (filtered_df['temperature_band'] == HOT_BAND).to_numpy()
+    hot_count = int(hot.sum())
+    return {
+        'hot_count': hot_count,
+        'hot_value': filtered_df['opportunity_value'].to_numpy()[hot].sum(dtype=np.int64),
+        'avg_win_probability': filtered_df['win_probability_ai'].to_numpy()[hot].mean(dtype=np.float64) if hot_count > 0 else 0,
+        'closing_soon': int((filtered_df['days_to_close'].to_numpy()[hot] <= CLOSING_SOON_DAYS).sum())
+    }
+
+
+def ranked_rows(filtered_df, row_index, positions):
+    """Rows of ``filtered_df`` at full-frame ``positions``, given the sorted full-frame ``row_index`` it was taken from"""
+    return filtered_df.iloc[np.searchsorted(row_index, positions)]
+
+
+def critical_hot_opportunities(filtered_df, sales_team_df, companies_df, hot_index, row_index, n):
+    """The ``n`` largest critical hot deals under the filter, with their company industry"""
+    critical_rows = ranked_rows(filtered_df, row_index, hot_index.critical.top(n, row_index))
+    return join_dimensions(critical_rows, sales_team_df, companies_df, ['company_industry'])
+
+
+def hot_opportunity_page(filtered_df, hot_index, row_index, page, page_size):
+    """Page ``page`` (from 1) of the filtered hot deals, hottest first"""
+    positions = hot_index.hot.top(page_size, row_index, (page - 1) * page_size)
+    return ranked_rows(filtered_df, row_index, positions)
+
+
+def pipeline_summary(filtered_df, rollup):
+    """Pipeline Analytics: conversion KPIs, funnel counts, lead source quality and the per-stage table"""
+    stage_measures = ['opportunity_value', 'weighted_value', 'stage_probability', 'days_in_stage', 'win_probability_ai']
+    by_stage = rollup.by('sales_stage', stage_measures)
+    totals = rollup.totals(['opportunity_value', 'weighted_value', 'days_in_stage'])
+
+    funnel = by_stage.reindex([stage for stage in FUNNEL_STAGES if stage in by_stage.index])
+    funnel = funnel[funnel['count'] > 0]
+    funnel = pd.DataFrame({
+        'Stage': funnel.index.astype(str),
+        'Count': funnel['count'].astype(int).to_numpy(),
+        'Value': funnel['opportunity_value_sum'].to_numpy(),
+        'Weighted': funnel['weighted_value_sum'].to_numpy()
+    })
+
+    lead_sources = stage_table = None
+    if len(filtered_df) > 0:
+        lead_sources = filtered_df.groupby('lead_source', observed=True).agg({
+            'opportunity_value': 'sum',
+            'opportunity_id': 'count',
+            'win_probability_ai': 'mean'
+        }).reset_index()
+        lead_sources.columns = ['Lead Source', 'Total Value', 'Count', 'Avg Win Prob']
+
+        stage_table = by_stage[[
+            'count', 'opportunity_value_sum', 'opportunity_value_mean', 'weighted_value_sum',
+            'stage_probability_mean', 'days_in_stage_mean', 'win_probability_ai_mean'
+        ]].round(2)
+        stage_table.columns = ['Count', 'Total Value', 'Avg Deal Size', 'Weighted Value', 'Stage Probability', 'Avg Days', 'Avg Win Prob']
+        stage_table = stage_table.reset_index()
+
+    return {
+        'weighted_pipeline': totals['weighted_value_sum'],
+        'conversion_rate': by_stage['count'].get('Closed Won', 0) / totals['count'] * 100 if totals['count'] > 0 else 0,
+        'avg_deal_size': totals['opportunity_value_mean'],
+        'avg_sales_cycle': totals['days_in_stage_mean'],
+        'funnel': funnel,
+        'lead_sources': lead_sources,
+        'stages': stage_table
+    }
+
+
+def account_summary(filtered_df, sales_team_df, companies_df, top_n=15):
+    """Account Intelligence: account KPIs, the top accounts by pipeline, and pipeline per industry"""
+    by_account = filtered_df.groupby('company_id')
+    opportunities_per_account = by_account.size()
+
+    top_accounts = by_account.agg({
+        'opportunity_value': 'sum',
+        'opportunity_id': 'count',
+        'temperature_score': 'mean',
+        'win_probability_ai': 'mean'
+    }).sort_values('opportunity_value', ascending=False).head(top_n)
+    # Name, industry and size come from the companies dimension for just the top accounts
+    top_accounts = top_accounts.join(
+        companies_df.set_index('id')[['name', 'industry', 'size']].rename(columns={
+            'industry': 'company_industry', 'size': 'company_size'
+        })
+    ).set_index('name')
+
+    industries = None
+    if len(filtered_df) > 0:
+        industries = join_dimensions(
+            filtered_df[['company_id', 'opportunity_value', 'temperature_score']], sales_team_df, companies_df,
+            ['company_industry']
+        ).groupby('company_industry', observed=True).agg({
+            'opportunity_value': 'sum',
+            'company_id': 'nunique',
+            'temperature_score': 'mean'
+        }).sort_values('opportunity_value', ascending=False)
+
+    return {
+        'total_accounts': filtered_df['company_id'].nunique(),
+        'strategic_accounts': len(filtered_df[filtered_df['opportunity_value'] >= HIGH_VALUE_DEAL]['company_id'].unique()),
+        'multi_opportunity_accounts': int((opportunities_per_account > 1).sum()),
+        'avg_account_value': by_account['opportunity_value'].sum().mean(),
+        'top_accounts': top_accounts,
+        'industries': industries
+    }
+
+
+def rep_performance(rollup, sales_team_df):
+    """One row per rep with selected opportunities, highest pipeline first
+
+    Pipeline value, opportunity count, mean temperature and AI win probability
+    come from one grouped pass over the rollup. Quota, tier, region and
+    specialty are joined from the rep profiles, and attainment is pipeline
+    value over quota in percent.
+    """
+    profiles = rep_profiles(sales_team_df)
+    reps = rollup.by('sales_rep_name', ['opportunity_value', 'temperature_score', 'win_probability_ai']).rename(columns={
+        'opportunity_value_sum': 'opportunity_value',
+        'count': 'opportunity_id',
+        'temperature_score_mean': 'temperature_score',
+        'win_probability_ai_mean': 'win_probability_ai'
+    })[['opportunity_value', 'opportunity_id', 'temperature_score', 'win_probability_ai']].join(
+        profiles[['sales_rep_quota', 'sales_rep_tier', 'sales_rep_region', 'sales_rep_specialty']]
+    ).sort_values('opportunity_value', ascending=False)
+    reps['quota_attainment'] = (reps['opportunity_value'] / reps['sales_rep_quota']) * 100
+    return reps
+
+
+def sales_performance_summary(filtered_df, sales_team_df, rollup):
+    """Sales Performance: team KPIs and one row per active rep with pipeline, quota attainment and profile"""
+    if len(filtered_df) == 0:
+        return {
+            'top_performer': "No data", 'top_value': 0, 'avg_quota_attainment': 0, 'elite_reps': 0,
+            'team_temperature': 0, 'reps': None
+        }
+
+    # The team KPIs are read off the per-rep table; no second pass over the rows
+    reps = rep_performance(rollup, sales_team_df)
+    top_performer = reps['opportunity_value'].idxmax()
+    return {
+        'top_performer': top_performer,
+        'top_value': reps.at[top_performer, 'opportunity_value'],
+        'avg_quota_attainment': reps['quota_attainment'].mean(),
+        'elite_reps': int((reps['sales_rep_tier'] == 'Elite').sum()),
+        'team_temperature': reps['temperature_score'].mean(),
+        'reps': reps
+    }
+
+
+def forecast_summary(filtered_df):
+    """Revenue Forecasting: forecast category KPIs, scenario totals, and high-risk / stalled exposure"""
+    weighted = filtered_df['weighted_value']
+    commit = weighted[filtered_df['forecast_category'] == 'Commit'].sum()
+    pipeline = weighted.sum()
+    high_risk = filtered_df['risk_level'] == 'High'
+    stalled = filtered_df['days_in_stage'] > FORECAST_STALLED_DAYS
+    values = filtered_df['opportunity_value']
+    return {
+        'commit': commit,
+        'best_case': weighted[filtered_df['forecast_category'].isin(['Commit', 'Best Case'])].sum(),
+        'pipeline': pipeline,
+        'confidence': (commit / pipeline) * 100 if pipeline > 0 else 0,
+        'scenarios': scenario_totals(filtered_df),
+        'high_risk_count': int(high_risk.sum()),
+        'high_risk_value': values[high_risk].sum(),
+        'stalled_count': int(stalled.sum()),
+        'stalled_value': values[stalled].sum()
+    }
+
+
+# Policies (pd-hub.py)
+
+def policy_overview(rollup):
+    """Executive Dashboard: book KPIs, premium by policy type and region, monthly premium and policy counts"""
+    totals = rollup.totals(['premium', 'commission'])
+    monthly = rollup.by('month', ['premium', 'commission']).sort_index().rename(columns={
+        'premium_sum': 'premium', 'commission_sum': 'commission', 'count': 'policy_id'
+    })[['premium', 'commission', 'policy_id']].reset_index()
+    monthly['created_date'] = monthly['month'].astype(str)
+    return {
+        'total_premium': totals['premium_sum'],
+        'total_policies': int(totals['count']),
+        'avg_premium': totals['premium_mean'],
+        'bind_rate': rollup.by('status', [])['count'].get('Active', 0) / totals['count'] * 100,
+        'total_commission': totals['commission_sum'],
+        'premium_by_type': rollup.by('policy_type', ['premium'])['premium_sum'].sort_values(ascending=False),
+        'premium_by_region': rollup.by('producer_region', ['premium'])['premium_sum'],
+        'monthly': monthly
+    }
+
+
+def producer_overview(filtered_df):
+    """Producer Scorecards, all producers: per-producer totals and averages with premium / commission ranks"""
+    producer_stats = filtered_df.groupby('producer_name', observed=True).agg({
+        'premium': ['sum', 'mean', 'count'],
+        'commission': 'sum',
+        'policy_id': 'count',
+        'customer_satisfaction': 'mean',
+        'bind_ratio': 'mean'
+    }).round(2)
+    producer_stats.columns = ['Total Premium', 'Avg Premium', 'Premium Count', 'Total Commission',
+                              'Policy Count', 'Avg Satisfaction', 'Bind Rate']
+    producer_stats['Premium Rank'] = producer_stats['Total Premium'].rank(method='dense', ascending=False)
+    producer_stats['Commission Rank'] = producer_stats['Total Commission'].rank(method='dense', ascending=False)
+    return producer_stats
+
+
+def producer_scorecard(filtered_df, producers_df, producer):
+    """Producer Scorecards, one producer: profile, metrics, mix, trend, ranks among producers, expertise, carriers.
+
+    None when the producer has no policies under the filter.
+    """
+    producer_data = filtered_df[filtered_df['producer_name'] == producer]
+    if len(producer_data) == 0:
+        return None
+
+    monthly = producer_data.groupby(producer_data['created_date'].dt.to_period('M'), observed=True).agg({
+        'premium': 'sum',
+        'policy_id': 'count'
+    }).reset_index()
+    monthly['created_date'] = monthly['created_date'].astype(str)
+
+    # Rankings across all producers under the filter
+    all_producer_stats = filtered_df.groupby('producer_name', observed=True).agg({
+        'premium': 'sum',
+        'commission': 'sum',
+        'policy_id': 'count',
+        'customer_satisfaction': 'mean',
+        'bind_ratio': 'mean'
+    })
+
+    expertise = producer_data.groupby('policy_type', observed=True).agg({
+        'premium': ['sum', 'count', 'mean'],
+        'bind_ratio': 'mean',
+        'customer_satisfaction': 'mean'
+    }).round(2)
+    expertise.columns = ['Total Premium', 'Policy Count', 'Avg Premium', 'Bind Rate', 'Satisfaction']
+
+    return {
+        'info': producers_df[producers_df['name'] == producer].iloc[0],
+        'total_premium': producer_data['premium'].sum(),
+        'total_policies': len(producer_data),
+        'avg_premium': producer_data['premium'].mean(),
+        'total_commission': producer_data['commission'].sum(),
+        'bind_rate': (producer_data['status'] == 'Active').mean(),
+        'avg_satisfaction': producer_data['customer_satisfaction'].mean(),
+        'avg_risk_score': producer_data['risk_score'].mean(),
+        'renewal_rate': producer_data['renewal_probability'].mean(),
+        'policy_mix': producer_data.groupby('policy_type', observed=True)['premium'].sum().sort_values(ascending=False),
+        'monthly': monthly,
+        'premium_rank': all_producer_stats['premium'].rank(method='dense', ascending=False)[producer],
+        'policies_rank': all_producer_stats['policy_id'].rank(method='dense', ascending=False)[producer],
+        'satisfaction_rank': all_producer_stats['customer_satisfaction'].rank(method='dense', ascending=False)[producer],
+        'producer_count': len(all_producer_stats),
+        'expertise': expertise.sort_values('Total Premium', ascending=False),
+        'carriers': producer_data.groupby('carrier', observed=True).agg({
+            'premium': 'sum',
+            'policy_id': 'count',
+            'bind_ratio': 'mean'
+        }).sort_values('premium', ascending=False).head(10)
+    }
+
+
+def performance_summary(filtered_df):
+    """Performance Analytics: bind speed, conversion, limit and retention KPIs, and mean days to bind per producer"""
+    active = filtered_df[filtered_df['status'] == 'Active']
+    return {
+        'avg_days_to_bind': active['quote_to_bind_days'].mean(),
+        'conversion_rate': (filtered_df['status'] == 'Active').mean() * 100,
+        'avg_policy_limit': filtered_df['policy_limit'].mean(),
+        'retention_rate': filtered_df['renewal_probability'].mean(),
+        'bind_speed': active.groupby('producer_name', observed=True)['quote_to_bind_days'].mean().sort_values()
+    }
+
+
+def performance_chart_data(filtered_df, max_rows=RAW_CHART_ROWS):
+    """Performance Analytics charts reduced server-side, or None when ``filtered_df`` is small enough to draw raw
+
+    Premium vs policy limit is a stratified sample of at most ``max_rows`` policies: every
+    type keeps its share and the extreme premiums, limits and commissions stay in.
+    Premium vs risk score is drawn as 2D bin counts, and the risk score distribution as
+    20 precomputed bins.
+    """
+    if len(filtered_df) <= max_rows:
+        return None
+    sample = stratified_sample(
+        filtered_df, max_rows, by='policy_type', keep_extremes=('premium', 'policy_limit', 'commission')
+    )
+    risk_x, premium_y, risk_counts = binned_2d(filtered_df['risk_score'], filtered_df['premium'])
+    return {
+        'rows': len(filtered_df),
+        'limit_sample': filtered_df.iloc[sample][
+            ['policy_limit', 'premium', 'policy_type', 'commission', 'producer_name', 'carrier']
+        ],
+        'risk_histogram': histogram(filtered_df['risk_score'], bins=20),
+        'risk_premium_bins': {'risk_score': risk_x, 'premium': premium_y, 'count': risk_counts}
+    }
+
+
+def policy_intelligence_summary(filtered_df, top_carriers=15):
+    """Policy Intelligence: top policy / carrier / account / referral source and the per-type and per-carrier tables"""
+    by_carrier = filtered_df.groupby('carrier', observed=True)['premium'].agg(['sum', 'size'])
+    by_account = filtered_df.groupby('company_name', observed=True)['premium'].agg(['sum', 'size'])
+    top_carrier = by_carrier['sum'].idxmax()
+    top_account = by_account['sum'].idxmax()
+
+    policy_types = filtered_df.groupby('policy_type', observed=True).agg({
+        'premium': ['sum', 'mean', 'count'],
+        'commission': 'sum',
+        'bind_ratio': 'mean',
+        'customer_satisfaction': 'mean',
+        'risk_score': 'mean'
+    }).round(2)
+    policy_types.columns = [
+        'Total Premium', 'Avg Premium', 'Policy Count',
+        'Total Commission', 'Bind Rate', 'Satisfaction', 'Risk Score'
+    ]
+
+    carriers = filtered_df.groupby('carrier', observed=True).agg({
+        'premium': ['sum', 'count'],
+        'commission': 'sum',
+        'bind_ratio': 'mean',
+        'customer_satisfaction': 'mean'
+    }).round(2)
+    carriers.columns = ['Total Premium', 'Policy Count', 'Commission', 'Bind Rate', 'Satisfaction']
+
+    return {
+        'top_policy': filtered_df.loc[filtered_df['premium'].idxmax()],
+        'top_carrier': top_carrier,
+        'top_carrier_premium': by_carrier['sum'].max(),
+        'top_carrier_policies': int(by_carrier.at[top_carrier, 'size']),
+        'top_account': top_account,
+        'top_account_premium': by_account['sum'].max(),
+        'top_account_policies': int(by_account.at[top_account, 'size']),
+        'policy_types': policy_types,
+        'carriers': carriers.sort_values('Total Premium', ascending=False).head(top_carriers),
+        'referral_sources': filtered_df.groupby('referral_source', observed=True).agg({
+            'premium': 'sum',
+            'policy_id': 'count',
+            'bind_ratio': 'mean'
+        }).sort_values('premium', ascending=False)
+    }
+
+
+def top_performer_summary(filtered_df, top_n=10, radar_n=5):
+    """Top Performers: leading producers by premium and by volume, the top producers' radar, leading client companies"""
+    by_producer = filtered_df.groupby('producer_name', observed=True)['premium'].agg(['sum', 'size'])
+    by_producer.columns = ['premium', 'policies']
+    by_company = filtered_df.groupby('company_name', observed=True)['premium']
+
+    radar = []
+    for producer in by_producer['premium'].sort_values(ascending=False).head(radar_n).index:
+        producer_data = filtered_df[filtered_df['producer_name'] == producer]
+        radar.append({
+            'Producer': producer,
+            'Premium': (producer_data['premium'].sum() / filtered_df['premium'].sum()) * 100,
+            'Policy Count': (len(producer_data) / len(filtered_df)) * 100,
+            'Bind Rate': producer_data['bind_ratio'].mean() * 100,
+            'Satisfaction': producer_data['customer_satisfaction'].mean() * 20,  # Scale to 100
+            'Avg Premium': (producer_data['premium'].mean() / filtered_df['premium'].mean()) * 100
+        })
+
+    return {
+        'by_premium': by_producer.sort_values('premium', ascending=False).head(top_n),
+        'by_volume': by_producer.sort_values('policies', ascending=False).head(top_n),
+        'radar': pd.DataFrame(radar, columns=['Producer', *RADAR_AXES]),
+        'companies_by_premium': by_company.sum().sort_values(ascending=False).head(top_n),
+        'companies_by_volume': by_company.size().sort_values(ascending=False).head(top_n)
+    }
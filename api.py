@@ -0,0 +1,484 @@
+"""Local HTTP API over the dashboard aggregates, for BI tools and scripts.
+
+Serves the same numbers as the Opportunities hub (``oppking.py``) and the
+Producer hub (``pd-hub.py``) without a Streamlit session: each request
+names a tab, carries the sidebar filters as query parameters, and gets that
+tab's ``analytics`` summary back as JSON, or one of its tables as an Arrow
+IPC stream.
+
+    python api.py                      # http://127.0.0.1:8600
+    curl 'localhost:8600/opportunities/pipeline?stage=Proposal&stage=Negotiation'
+    curl 'localhost:8600/policies/scorecard?producer=Alex%20Rivera'
+    curl -o stages.arrow 'localhost:8600/opportunities/pipeline?format=arrow&table=stages'
+
+Both datasets are loaded once per process from the same on-disk snapshots
+the apps use (``OPPKING_ROWS`` / ``PDHUB_ROWS`` pick the sizes), with the
+same filter index, cubes and ``FilterCache``. Handlers are async; filtering,
+aggregation and serialization run on the worker thread pool, so a slow
+query never blocks the event loop and concurrent requests share the cache.
+
+Filter parameters (all optional, defaults select everything):
+
+    opportunities  start_date, end_date (YYYY-MM-DD), sales_rep, stage*, product*,
+                   temperature*, priority*, min_value, max_value
+    policies       start_date, end_date, producer, policy_type, status, region, carrier
+
+(* may be repeated.) Tab-specific parameters: ``page``/``page_size`` for
+``hot``; ``period``, ``periods``, ``trials``, ``probability``, ``slip_days``
+for ``forecast``; ``producer`` for ``scorecard``.
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import threading
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from analytics import (
+    account_summary, critical_hot_opportunities, executive_summary, forecast_summary, hot_opportunity_page,
+    hot_summary, performance_summary, pipeline_summary, policy_intelligence_summary, policy_overview,
+    producer_overview, producer_scorecard, sales_performance_summary, top_performer_summary
+)
+from cube import Rollup, opportunity_cube, policy_cube
+from dataset import load_opportunities_dataset, load_policies_dataset, row_mask, select_rows
+from filters import FilterCache, filter_state_key, opportunity_filter_index
+from forecast import MAX_PERIODS, PERIODS, PROBABILITY_SCALES, bucketed_forecast, simulate_forecast
+from hotlist import hot_opportunity_index
+
+# Same dataset sizes and seed as the apps, so both read the same snapshots
+OPPORTUNITY_ROWS = int(os.environ.get("OPPKING_ROWS", "15000"))
+POLICY_ROWS = int(os.environ.get("PDHUB_ROWS", "2000"))
+DATA_SEED = 42
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.environ.get("HUB_API_PORT", "8600"))
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Hot list page sizes and Monte Carlo trials a request may ask for
+MAX_PAGE_SIZE = 500
+MAX_TRIALS = 100000
+
+
+class QueryError(ValueError):
+    """A request parameter that cannot be parsed or is out of range (HTTP 400)"""
+
+
+class NotFound(LookupError):
+    """A tab, or a record a tab was asked for, that does not exist (HTTP 404)"""
+
+
+class OpportunityHub:
+    """The opportunities dataset with its filter index, cube, hot index and filter cache"""
+
+    def __init__(self):
+        self.dataset = load_opportunities_dataset(OPPORTUNITY_ROWS, DATA_SEED)
+        self.df = self.dataset['opportunities']
+        self.filter_index = opportunity_filter_index(self.df)
+        self.cube = opportunity_cube(self.df)
+        self.hot_index = hot_opportunity_index(self.df)
+        self.cache = FilterCache()
+
+
+class PolicyHub:
+    """The policies dataset with its cube and filter cache"""
+
+    def __init__(self):
+        self.dataset = load_policies_dataset(POLICY_ROWS, DATA_SEED)
+        self.df = self.dataset['policies']
+        self.cube = policy_cube(self.df)
+        self.cache = FilterCache()
+
+
+_hubs = {}
+_hubs_lock = threading.Lock()
+
+
+def hub(kind):
+    """The process-wide OpportunityHub / PolicyHub, loaded on first use"""
+    with _hubs_lock:
+        if kind not in _hubs:
+            _hubs[kind] = OpportunityHub() if kind == "opportunities" else PolicyHub()
+        return _hubs[kind]
+
+
+# Query parameters
+
+def _date(params, name, default):
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryError(f"{name} must be a YYYY-MM-DD date, got {value!r}") from None
+
+
+def _int(params, name, default, low, high):
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise QueryError(f"{name} must be an integer, got {value!r}") from None
+    if not low <= number <= high:
+        raise QueryError(f"{name} must be between {low} and {high}, got {number}")
+    return number
+
+
+def _choice(params, name, default, choices):
+    value = params.get(name, default)
+    if value not in choices:
+        raise QueryError(f"{name} must be one of {', '.join(map(str, choices))}, got {value!r}")
+    return value
+
+
+class FilterView:
+    """One filter state: the filtered rows, their full-frame positions, the cache scope and the rollup"""
+
+    def __init__(self, filtered_df, row_index, aggregates, rollup):
+        self.filtered_df = filtered_df
+        self.row_index = row_index
+        self.aggregates = aggregates
+        self.rollup = rollup
+
+
+def opportunity_view(opportunities, params):
+    """Apply the Opportunities sidebar filters given as query parameters"""
+    df = opportunities.df
+    min_date, max_date = df['created_date'].min().date(), df['created_date'].max().date()
+    start_date = _date(params, 'start_date', min_date)
+    end_date = _date(params, 'end_date', max_date)
+    min_value, max_value = int(df['opportunity_value'].min()), int(df['opportunity_value'].max())
+    value_range = (
+        _int(params, 'min_value', min_value, 0, 2**62),
+        _int(params, 'max_value', max_value, 0, 2**62)
+    )
+    sales_rep = params.get('sales_rep', "All Sales Reps")
+    selections = {
+        'sales_stage': params.getlist('stage'),
+        'product_line': params.getlist('product'),
+        'priority': params.getlist('priority'),
+        'temperature_band': params.getlist('temperature')
+    }
+
+    # Same semantics as the sidebar: an empty multiselect does not filter
+    isin = {}
+    if sales_rep != "All Sales Reps":
+        isin['sales_rep_name'] = [sales_rep]
+    isin.update({column: selected for column, selected in selections.items() if selected})
+
+    start_datetime = pd.to_datetime(start_date)
+    end_datetime = pd.to_datetime(end_date) + pd.Timedelta(days=1)
+    filter_key = filter_state_key(
+        opportunities.dataset.version, start_date=start_date, end_date=end_date, sales_rep=sales_rep,
+        stages=selections['sales_stage'], products=selections['product_line'],
+        temperatures=selections['temperature_band'], priorities=selections['priority'], value_range=value_range
+    )
+    row_index = opportunities.cache.rows(filter_key, lambda: opportunities.filter_index.select(
+        isin=isin,
+        between={
+            'created_date': (start_datetime, end_datetime, 'left'),
+            'opportunity_value': value_range
+        }
+    ))
+    filtered_df, _ = select_rows(df, row_index)
+
+    cube_query = None
+    if value_range == (min_value, max_value):
+        months = opportunities.cube.months(start_datetime, end_datetime)
+        if months is not None:
+            cube_query = opportunities.cube.query(isin, months)
+    return FilterView(filtered_df, row_index, opportunities.cache.scope(filter_key), Rollup(filtered_df, cube_query, 'created_date'))
+
+
+POLICY_SELECTIONS = {
+    'producer': 'producer_name', 'policy_type': 'policy_type', 'status': 'status',
+    'region': 'producer_region', 'carrier': 'carrier'
+}
+
+
+def policy_view(policies, params):
+    """Apply the Producer hub sidebar filters given as query parameters"""
+    df = policies.df
+    min_date, max_date = df['created_date'].min().date(), df['created_date'].max().date()
+    date_range = (_date(params, 'start_date', min_date), _date(params, 'end_date', max_date))
+    selections = {column: params.get(name) for name, column in POLICY_SELECTIONS.items()}
+    start_date = pd.to_datetime(date_range[0])
+    end_date = pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)
+
+    def filter_rows():
+        mask = row_mask(len(df))
+        for column, value in selections.items():
+            if value:
+                mask &= (df[column] == value).to_numpy()
+        mask &= ((df['created_date'] >= start_date) & (df['created_date'] < end_date)).to_numpy()
+        return np.flatnonzero(mask)
+
+    filter_key = filter_state_key(policies.dataset.version, date_range=date_range, **{
+        name: params.get(name) for name in POLICY_SELECTIONS
+    })
+    row_index = policies.cache.rows(filter_key, filter_rows)
+    filtered_df, _ = select_rows(df, row_index)
+
+    cube_query = None
+    months = policies.cube.months(start_date, end_date)
+    if months is not None:
+        cube_query = policies.cube.query({column: [value] for column, value in selections.items() if value}, months)
+    return FilterView(filtered_df, row_index, policies.cache.scope(filter_key), Rollup(filtered_df, cube_query, 'created_date'))
+
+
+# Tabs: (hub, params) -> summary dict
+
+def opportunity_tab(compute):
+    def tab(params):
+        opportunities = hub("opportunities")
+        return compute(opportunities, opportunity_view(opportunities, params), params)
+    return tab
+
+
+def policy_tab(compute):
+    def tab(params):
+        policies = hub("policies")
+        return compute(policies, policy_view(policies, params), params)
+    return tab
+
+
+def hot_tab(opportunities, view, params):
+    page = _int(params, 'page', 1, 1, 2**31)
+    page_size = _int(params, 'page_size', 20, 1, MAX_PAGE_SIZE)
+    opportunities_df, sales_team_df, companies_df = opportunities.dataset.frames()
+    return {
+        **view.aggregates('api:hot', lambda: hot_summary(view.filtered_df)),
+        'critical': view.aggregates('api:critical', lambda: critical_hot_opportunities(
+            view.filtered_df, sales_team_df, companies_df, opportunities.hot_index, view.row_index, 10
+        )),
+        'page': hot_opportunity_page(view.filtered_df, opportunities.hot_index, view.row_index, page, page_size)
+    }
+
+
+def forecast_tab(opportunities, view, params):
+    period = _choice(params, 'period', "Months", list(PERIODS))
+    periods = _int(params, 'periods', 12, 1, MAX_PERIODS)
+    trials = _int(params, 'trials', 10000, 1, MAX_TRIALS)
+    probability_column = _choice(params, 'probability', "win_probability_ai", list(PROBABILITY_SCALES))
+    slip_days = _int(params, 'slip_days', 14, 0, 365)
+    summary = dict(view.aggregates('api:forecast', lambda: forecast_summary(view.filtered_df)))
+    if len(view.filtered_df) > 0:
+        start = datetime.now()
+        # Same cache name as the Revenue Forecasting tab's simulation
+        simulation_key = f"forecast_simulation:{period}:{periods}:{trials}:{probability_column}:{slip_days}:{start.date()}"
+        bands, horizon, odds = view.aggregates(simulation_key, lambda: simulate_forecast(
+            view.filtered_df, periods, period, start, trials=trials,
+            probability_column=probability_column, slip_days=slip_days, seed=DATA_SEED
+        ))
+        summary.update(buckets=bucketed_forecast(view.filtered_df, periods, period, start), bands=bands, horizon=horizon, odds=odds)
+    return summary
+
+
+def scorecard_tab(policies, view, params):
+    producer = params.get('producer')
+    if not producer:
+        raise QueryError("producer is required")
+    scorecard = producer_scorecard(view.filtered_df, policies.dataset['producers'], producer)
+    if scorecard is None:
+        raise NotFound(f"no policies for producer {producer!r} under these filters")
+    return scorecard
+
+
+TABS = {
+    "opportunities": {
+        "executive": opportunity_tab(lambda opportunities, view, params: view.aggregates(
+            'api:executive', lambda: executive_summary(view.filtered_df, opportunities.df, view.rollup)
+        )),
+        "hot": opportunity_tab(hot_tab),
+        "pipeline": opportunity_tab(lambda opportunities, view, params: view.aggregates(
+            'pipeline_summary', lambda: pipeline_summary(view.filtered_df, view.rollup)
+        )),
+        "accounts": opportunity_tab(lambda opportunities, view, params: view.aggregates(
+            'api:accounts', lambda: account_summary(view.filtered_df, *opportunities.dataset.frames('sales_team', 'companies'))
+        )),
+        "sales-performance": opportunity_tab(lambda opportunities, view, params: view.aggregates(
+            'sales_performance', lambda: sales_performance_summary(view.filtered_df, opportunities.dataset['sales_team'], view.rollup)
+        )),
+        "forecast": opportunity_tab(forecast_tab),
+    },
+    "policies": {
+        "overview": policy_tab(lambda policies, view, params: view.aggregates(
+            'api:overview', lambda: policy_overview(view.rollup)
+        )),
+        "producers": policy_tab(lambda policies, view, params: {
+            'producers': view.aggregates('producer_stats', lambda: producer_overview(view.filtered_df))
+        }),
+        "scorecard": policy_tab(scorecard_tab),
+        "performance": policy_tab(lambda policies, view, params: view.aggregates(
+            'api:performance', lambda: performance_summary(view.filtered_df)
+        )),
+        "intelligence": policy_tab(lambda policies, view, params: view.aggregates(
+            'policy_intelligence', lambda: policy_intelligence_summary(view.filtered_df)
+        )),
+        "top-performers": policy_tab(lambda policies, view, params: view.aggregates(
+            'api:top_performers', lambda: top_performer_summary(view.filtered_df)
+        )),
+    },
+}
+
+
+# Serialization
+
+def _is_row(value):
+    """A Series holding one record (top policy, producer profile) rather than a column of values"""
+    return isinstance(value, pd.Series) and value.index.name is None and not isinstance(value.index, pd.RangeIndex)
+
+
+def _frame(value):
+    """A DataFrame or Series as a flat table, its index (when meaningful) turned into columns"""
+    if _is_row(value):
+        return pd.DataFrame([value.to_dict()])
+    if isinstance(value, pd.Series):
+        value = value.to_frame(value.name if value.name is not None else "value")
+    if isinstance(value.index, pd.RangeIndex) and value.index.name is None:
+        return value
+    return value.reset_index()
+
+
+def _scalar(value):
+    if isinstance(value, (np.ndarray, list, tuple)):
+        # List-valued cells (risk factors, competitors)
+        return [_scalar(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, pd.Period):
+        return str(value)
+    if value is pd.NaT or value is None:
+        return None
+    return value
+
+
+def to_json(value):
+    """JSON-ready copy of a summary: tables become lists of records, a Series without an index name one record"""
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_json(item) for item in value]
+    if _is_row(value):
+        return {str(key): _scalar(item) for key, item in value.items()}
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        frame = _frame(value)
+        columns = [str(column) for column in frame.columns]
+        return [
+            dict(zip(columns, map(_scalar, row)))
+            for row in frame.astype(object).itertuples(index=False, name=None)
+        ]
+    return _scalar(value)
+
+
+def to_arrow(summary, table=None):
+    """Arrow IPC stream of one table of a summary, or of its scalar KPIs as a single row"""
+    if table is None:
+        row = {key: [to_json(value)] for key, value in summary.items() if not isinstance(value, (pd.DataFrame, pd.Series, dict))}
+        frame = pd.DataFrame(row)
+    else:
+        value = summary.get(table)
+        if not isinstance(value, (pd.DataFrame, pd.Series)):
+            tables = sorted(key for key, item in summary.items() if isinstance(item, (pd.DataFrame, pd.Series)))
+            raise QueryError(f"table must be one of {', '.join(tables) or '(none)'}, got {table!r}")
+        frame = _frame(value)
+    frame = frame.rename(columns=str)
+    arrow_table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+    return sink.getvalue()
+
+
+def respond(compute, params):
+    """Run a tab and encode it; called on a worker thread"""
+    output = _choice(params, 'format', "json", ["json", "arrow"])
+    summary = compute(params)
+    if output == "arrow":
+        return Response(to_arrow(summary, params.get('table')), media_type=ARROW_MEDIA_TYPE)
+    return JSONResponse(to_json(summary))
+
+
+# Routes
+
+async def tab_endpoint(request):
+    dataset, tab = request.path_params['dataset'], request.path_params['tab']
+    compute = TABS.get(dataset, {}).get(tab)
+    if compute is None:
+        return JSONResponse({"error": f"unknown tab {dataset}/{tab}", "tabs": index_of_tabs()}, status_code=404)
+    try:
+        return await run_in_threadpool(respond, compute, request.query_params)
+    except QueryError as error:
+        return JSONResponse({"error": str(error)}, status_code=400)
+    except NotFound as error:
+        return JSONResponse({"error": str(error)}, status_code=404)
+    except ValueError as error:
+        # e.g. a top carrier or account asked of a selection with no policies
+        return JSONResponse({"error": f"cannot compute {dataset}/{tab} for this selection: {error}"}, status_code=422)
+
+
+def index_of_tabs():
+    return {dataset: sorted(tabs) for dataset, tabs in TABS.items()}
+
+
+async def index_endpoint(request):
+    return JSONResponse({"tabs": index_of_tabs()})
+
+
+async def health_endpoint(request):
+    loaded = {}
+    with _hubs_lock:
+        for kind, loaded_hub in _hubs.items():
+            loaded[kind] = {
+                "rows": len(loaded_hub.df), "version": loaded_hub.dataset.version, "cache": loaded_hub.cache.stats()
+            }
+    return JSONResponse({"status": "ok", "loaded": loaded})
+
+
+@contextlib.asynccontextmanager
+async def preload(app):
+    """Load both datasets before serving, so the first requests do not pay for it"""
+    for kind in TABS:
+        await run_in_threadpool(hub, kind)
+    yield
+
+
+app = Starlette(
+    routes=[
+        Route("/", index_endpoint),
+        Route("/health", health_endpoint),
+        Route("/{dataset}/{tab}", tab_endpoint),
+    ],
+    lifespan=preload
+)
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve the dashboard aggregates over HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
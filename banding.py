@@ -0,0 +1,51 @@
+"""Value banding shared by the sidebar filters, the cube and the tabs.
+
+A band set maps a label to ``(low, high, inclusive)`` with ``Series.between``
+semantics. ``band_labels`` assigns every value its label in one array
+operation, and ``add_temperature_band`` stores the result on the
+opportunities frame as a categorical ``temperature_band`` column when the
+dataset is loaded, so the sidebar filter, the cube and the Hot Opportunities
+tab all read the same codes instead of re-deriving them from scores.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Sidebar temperature bands: label -> (low, high, inclusive); scores are fractional,
+# so Warm and Cold stop just below the next band
+TEMPERATURE_BANDS = {
+    "Hot (80-100)": (80, 100, "both"),
+    "Warm (60-79)": (60, 80, "left"),
+    "Cold (0-59)": (0, 60, "left")
+}
+HOT_BAND = "Hot (80-100)"
+
+# Labels used by the Temperature Distribution chart
+TEMPERATURE_BAND_DISPLAY = {
+    "Hot (80-100)": "🔥 Hot (80-100)",
+    "Warm (60-79)": "🟠 Warm (60-79)",
+    "Cold (0-59)": "❄️ Cold (0-59)"
+}
+
+
+def in_range(values, low, high, inclusive="both"):
+    """Boolean mask of ``low <= values <= high`` with ``Series.between`` inclusive semantics"""
+    above = values >= low if inclusive in ("both", "left") else values > low
+    below = values <= high if inclusive in ("both", "right") else values < high
+    return above & below
+
+
+def band_labels(values, bands):
+    """Band label for every value (first matching band wins), as a categorical ordered like ``bands``"""
+    values = np.asarray(values)
+    labels = list(bands)
+    codes = np.select([in_range(values, *bands[label]) for label in labels], np.arange(len(labels)), default=-1)
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def add_temperature_band(opportunities_df):
+    """Opportunities frame with a categorical ``temperature_band`` column derived from ``temperature_score``"""
+    if "temperature_band" in opportunities_df.columns:
+        return opportunities_df
+    bands = band_labels(opportunities_df["temperature_score"], TEMPERATURE_BANDS)
+    return opportunities_df.assign(temperature_band=pd.Series(bands, index=opportunities_df.index))
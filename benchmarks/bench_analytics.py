@@ -0,0 +1,100 @@
+"""Benchmark every tab's headless analytics summary, without a Streamlit session.
+
+Times each ``analytics`` function on the unfiltered data, once with the
+cube-backed ``Rollup`` the apps use for default filters and once with a
+row-scan ``Rollup``.
+
+Usage:
+    python benchmarks/bench_analytics.py
+    python benchmarks/bench_analytics.py --opportunities 1000000 --policies 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics
+from cube import Rollup, opportunity_cube, policy_cube
+from dataset import load_opportunities_dataset, load_policies_dataset
+from hotlist import hot_opportunity_index
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def opportunity_summaries(dataset):
+    """(name, uses rollup, function of rollup) for every opportunities tab"""
+    opportunities_df, sales_team_df, companies_df = dataset.frames()
+    hot_index = hot_opportunity_index(opportunities_df)
+    row_index = np.arange(len(opportunities_df))
+    return [
+        ("executive_summary", True, lambda rollup: analytics.executive_summary(opportunities_df, opportunities_df, rollup)),
+        ("pattern_insights", False, lambda rollup: analytics.pattern_insights(opportunities_df, sales_team_df)),
+        ("hot_summary", False, lambda rollup: analytics.hot_summary(opportunities_df)),
+        ("critical_hot_opportunities", False, lambda rollup: analytics.critical_hot_opportunities(
+            opportunities_df, sales_team_df, companies_df, hot_index, row_index, 10
+        )),
+        ("pipeline_summary", True, lambda rollup: analytics.pipeline_summary(opportunities_df, rollup)),
+        ("account_summary", False, lambda rollup: analytics.account_summary(opportunities_df, sales_team_df, companies_df)),
+        ("sales_performance_summary", True, lambda rollup: analytics.sales_performance_summary(
+            opportunities_df, sales_team_df, rollup
+        )),
+        ("forecast_summary", False, lambda rollup: analytics.forecast_summary(opportunities_df)),
+    ]
+
+
+def policy_summaries(dataset):
+    """(name, uses rollup, function of rollup) for every policies tab"""
+    policies_df, producers_df, _ = dataset.frames()
+    producer = policies_df['producer_name'].iloc[0]
+    return [
+        ("policy_overview", True, lambda rollup: analytics.policy_overview(rollup)),
+        ("producer_overview", False, lambda rollup: analytics.producer_overview(policies_df)),
+        ("producer_scorecard", False, lambda rollup: analytics.producer_scorecard(policies_df, producers_df, producer)),
+        ("performance_summary", False, lambda rollup: analytics.performance_summary(policies_df)),
+        ("policy_intelligence_summary", False, lambda rollup: analytics.policy_intelligence_summary(policies_df)),
+        ("top_performer_summary", False, lambda rollup: analytics.top_performer_summary(policies_df)),
+    ]
+
+
+def report(title, df, cube, summaries, repeat):
+    scan, cubed = Rollup(df, None, "created_date"), Rollup(df, cube.query(), "created_date")
+    print(f"\n{title}: {len(df):,} rows")
+    print(f"{'summary':<30}{'scan ms':>10}{'cube ms':>10}")
+    for name, uses_rollup, summary in summaries:
+        scan_time = best_of(lambda: summary(scan), repeat)
+        cube_time = f"{best_of(lambda: summary(cubed), repeat) * 1e3:>10.1f}" if uses_rollup else f"{'-':>10}"
+        print(f"{name:<30}{scan_time * 1e3:>10.1f}{cube_time}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--opportunities", type=int, default=100000)
+    parser.add_argument("--policies", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    opportunities = load_opportunities_dataset(args.opportunities, args.seed)
+    opportunities_df = opportunities["opportunities"]
+    report("Opportunities", opportunities_df, opportunity_cube(opportunities_df),
+           opportunity_summaries(opportunities), args.repeat)
+
+    policies = load_policies_dataset(args.policies, args.seed)
+    policies_df = policies["policies"]
+    report("Policies", policies_df, policy_cube(policies_df), policy_summaries(policies), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
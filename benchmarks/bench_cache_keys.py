@@ -0,0 +1,62 @@
+"""Benchmark cache hits keyed by content hashing vs. by the dataset version.
+
+Times a warm ``st.cache_resource`` lookup of ``calculate_pattern_insights``
+the way it was called before (Streamlit hashes both frames on every call)
+and the way it is called now (only ``dataset.version`` is hashed).
+
+Streamlit logs bare-mode and pickling-fallback warnings to stderr on every
+hashed call; redirect it to keep the table readable.
+
+Usage:
+    python benchmarks/bench_cache_keys.py 2>/dev/null
+    python benchmarks/bench_cache_keys.py --rows 15000 1000000 2>/dev/null
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset import load_opportunities_dataset
+
+@st.cache_resource
+def hashed_lookup(opportunities_df, sales_team_df):
+    return len(opportunities_df), len(sales_team_df)
+
+
+@st.cache_resource
+def versioned_lookup(dataset_version, _opportunities_df, _sales_team_df):
+    return len(_opportunities_df), len(_sales_team_df)
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[15000, 1000000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}{'hashed ms':>12}{'version ms':>12}{'saved ms':>10}")
+    for n_rows in args.rows:
+        dataset = load_opportunities_dataset(n_rows, args.seed)
+        opportunities_df, sales_team_df = dataset.frames("opportunities", "sales_team")
+        hashed_time = best_of(lambda: hashed_lookup(opportunities_df, sales_team_df), args.repeat)
+        version_time = best_of(lambda: versioned_lookup(dataset.version, opportunities_df, sales_team_df), args.repeat)
+        print(f"{n_rows:>12,}{hashed_time * 1e3:>12.2f}{version_time * 1e3:>12.3f}{(hashed_time - version_time) * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the Performance Analytics charts: raw rows vs server-side sampling and binning.
+
+Runs pd-hub's ``performance_analytics`` tab against the stubbed Streamlit
+from bench_tabs. The stub's ``st.plotly_chart`` serializes every figure to
+JSON the way Streamlit does. The benchmark reports the tab's wall time
+(aggregation, figure construction and serialization), and the figure bytes
+that would be sent to the browser. It does this twice: with every policy
+drawn raw, and with the chart data reduction in ``chartdata``.
+
+Usage:
+    python benchmarks/bench_charts.py
+    python benchmarks/bench_charts.py --rows 100000 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_tabs import StubStreamlit, load_app
+from dataset import load_policies_dataset
+from filters import FilterCache
+
+
+class ChartCapture(StubStreamlit):
+    """Stub Streamlit that serializes each chart like ``st.plotly_chart`` and keeps the byte count"""
+
+    def __init__(self):
+        super().__init__()
+        self.chart_bytes = 0
+
+    def plotly_chart(self, figure, **kwargs):
+        self.chart_bytes += len(pio.to_json(figure, validate=False))
+        return self
+
+
+def run(stub, app, policies_df, repeat):
+    """Best tab time in ms and the chart bytes of one run"""
+    best = float("inf")
+    for _ in range(repeat):
+        stub.chart_bytes = 0
+        aggregates = FilterCache().scope("bench")
+        start = time.perf_counter()
+        app.performance_analytics(policies_df, aggregates)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, stub.chart_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stub = ChartCapture()
+    app = load_app(stub, "pd_hub", "pd-hub.py")
+    reduced = app.performance_chart_data
+
+    print(f"{'policies':>10}{'raw ms':>10}{'raw MB':>9}{'reduced ms':>12}{'reduced MB':>12}")
+    for n_rows in args.rows:
+        policies_df = load_policies_dataset(n_rows, args.seed)["policies"]
+        app.performance_chart_data = lambda filtered_df: None
+        raw_ms, raw_bytes = run(stub, app, policies_df, args.repeat)
+        app.performance_chart_data = reduced
+        reduced_ms, reduced_bytes = run(stub, app, policies_df, args.repeat)
+        print(f"{n_rows:>10,}{raw_ms:>10.1f}{raw_bytes / 1e6:>9.2f}{reduced_ms:>12.1f}{reduced_bytes / 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
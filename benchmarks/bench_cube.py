@@ -0,0 +1,56 @@
+"""Benchmark dashboard groupbys answered from the cube vs. scanned from the filtered rows.
+
+Usage:
+    python benchmarks/bench_cube.py
+    python benchmarks/bench_cube.py --rows 15000 300000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube import MONTH, OPPORTUNITY_CUBE_MEASURES, Rollup, opportunity_cube
+from dataset import load_opportunities_dataset
+
+GROUPBYS = ("sales_stage", "sales_rep_name", "priority", "temperature_band", MONTH)
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[15000, 300000, 1000000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    measures = list(OPPORTUNITY_CUBE_MEASURES)
+    print(f"{'rows':>12}{'cells':>10}{'build s':>9}  {'groupby':<18}{'scan ms':>10}{'cube ms':>10}{'speedup':>9}")
+    for n_rows in args.rows:
+        df = load_opportunities_dataset(n_rows, args.seed)["opportunities"]
+        start = time.perf_counter()
+        cube = opportunity_cube(df)
+        build = time.perf_counter() - start
+
+        # Default sidebar state: every row selected, so both paths see the whole table
+        scan = Rollup(df, None, "created_date")
+        rollup = Rollup(df, cube.query(), "created_date")
+        for dimension in GROUPBYS:
+            scan_time = best_of(lambda: scan.by(dimension, measures), args.repeat)
+            cube_time = best_of(lambda: rollup.by(dimension, measures), args.repeat)
+            print(f"{n_rows:>12,}{len(cube):>10,}{build:>9.2f}  {dimension:<18}"
+                  f"{scan_time * 1e3:>10.2f}{cube_time * 1e3:>10.2f}{scan_time / cube_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark chart-heavy tabs on repeat reruns: figures rebuilt vs served from the FigureCache.
+
+Runs the tabs whose charts go through ``figcache`` against the stubbed
+Streamlit from bench_tabs. The stub's ``st.plotly_chart`` converts and
+serializes each figure the way Streamlit does. Tab aggregates come from a
+warm FilterCache, so the timings cover the charts: building, validating and
+encoding every figure, or looking it up by fingerprint. The cached column
+is a rerun after the figure cache has been filled once, as when a user
+reruns the script without changing the filters; its hit rate counts those
+reruns only.
+
+Usage:
+    python benchmarks/bench_figures.py
+    python benchmarks/bench_figures.py --rows 500000 --repeat 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import plotly.io as pio
+import plotly.tools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_tabs import StubStreamlit, load_app, opportunity_tabs, policy_tabs
+from figcache import FigureCache
+from filters import FilterCache
+
+CHART_TABS = {
+    "oppking": ("executive_dashboard", "pipeline_analytics", "account_intelligence"),
+    "pd_hub": ("executive_dashboard", "policy_intelligence", "top_performers"),
+}
+
+
+class ChartSerializer(StubStreamlit):
+    """Stub Streamlit whose ``st.plotly_chart`` converts and encodes the figure like Streamlit"""
+
+    def plotly_chart(self, figure, **kwargs):
+        pio.to_json(plotly.tools.return_figure_from_figure_or_data(figure, validate_figure=True), validate=False)
+        return self
+
+
+class Uncached:
+    """Figure cache stand-in that builds every figure, as before the cache"""
+
+    def figure(self, name, data, build, **params):
+        return build()
+
+
+def best_ms(run, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=150000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stub = ChartSerializer()
+    apps = [
+        ("oppking", load_app(stub, "oppking", "oppking.py"), opportunity_tabs),
+        ("pd_hub", load_app(stub, "pd_hub", "pd-hub.py"), policy_tabs),
+    ]
+
+    print(f"{args.rows:,} rows, best of {args.repeat}")
+    print(f"{'app':<9}{'tab':<24}{'rebuild ms':>12}{'cached ms':>11}{'speedup':>9}{'hit rate':>10}")
+    for app_name, app, tabs in apps:
+        for tab, run in tabs(app, args.rows, args.seed):
+            if tab not in CHART_TABS[app_name]:
+                continue
+            aggregates = FilterCache()
+            app.load_figure_cache = Uncached
+            run(aggregates)
+            rebuild_ms = best_ms(lambda: run(aggregates), args.repeat)
+
+            figures = FigureCache()
+            app.load_figure_cache = lambda: figures
+            run(aggregates)
+            warm = figures.stats()
+            cached_ms = best_ms(lambda: run(aggregates), args.repeat)
+            hits = figures.stats()["hits"] - warm["hits"]
+            hit_rate = hits / (hits + figures.stats()["misses"] - warm["misses"])
+            print(f"{app_name:<9}{tab:<24}{rebuild_ms:>12.1f}{cached_ms:>11.1f}{rebuild_ms / cached_ms:>8.1f}x{hit_rate:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
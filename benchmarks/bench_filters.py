@@ -0,0 +1,86 @@
+"""Benchmark the sidebar filter pipeline: boolean mask chain vs. the bitmap FilterIndex.
+
+Usage:
+    python benchmarks/bench_filters.py
+    python benchmarks/bench_filters.py --rows 10000000 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset import load_opportunities_dataset
+from banding import HOT_BAND, TEMPERATURE_BANDS, in_range
+from filters import opportunity_filter_index
+
+
+def scenarios(df):
+    """Named sidebar states as (isin, between) pairs"""
+    first, last = df["created_date"].min().normalize(), df["created_date"].max().normalize() + pd.Timedelta(days=1)
+    low, high = int(df["opportunity_value"].min()), int(df["opportunity_value"].max())
+    everything = {"created_date": (first, last, "left"), "opportunity_value": (low, high)}
+    rep = df["sales_rep_name"].cat.categories[0]
+    return {
+        "defaults": ({}, everything),
+        "one rep": ({"sales_rep_name": [rep]}, everything),
+        "hot only": ({"temperature_band": [HOT_BAND]}, everything),
+        "two stages": ({"sales_stage": ["Proposal", "Negotiation"]}, everything),
+        "last 30 days": ({}, {**everything, "created_date": (last - pd.Timedelta(days=30), last, "left")}),
+        "$1M+ hot, rep": (
+            {"sales_rep_name": [rep], "temperature_band": [HOT_BAND]},
+            {**everything, "opportunity_value": (1000000, high)}
+        ),
+    }
+
+
+def mask_chain(df, isin, between):
+    """The filter chain oppking.main() used before the index: one full-column mask per filter"""
+    mask = pd.Series(True, index=df.index)
+    for column, (low, high, *inclusive) in between.items():
+        mask &= df[column].between(low, high, inclusive=inclusive[0] if inclusive else "both")
+    for column, selected in isin.items():
+        if column == "temperature_band":
+            bands = [in_range(df["temperature_score"], *TEMPERATURE_BANDS[label]) for label in selected]
+            mask &= np.logical_or.reduce(bands)
+        else:
+            mask &= df[column].isin(selected)
+    return np.flatnonzero(mask.to_numpy())
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    df = load_opportunities_dataset(args.rows, args.seed)["opportunities"]
+    start = time.perf_counter()
+    index = opportunity_filter_index(df)
+    print(f"{len(df):,} rows: index built in {time.perf_counter() - start:.2f}s, {index.nbytes() / 1e6:,.1f} MB")
+
+    print(f"\n{'scenario':<16}{'rows':>12}{'mask ms':>10}{'index ms':>10}{'speedup':>10}")
+    for name, (isin, between) in scenarios(df).items():
+        mask_time, expected = best_of(lambda: mask_chain(df, isin, between), args.repeat)
+        index_time, rows = best_of(lambda: index.select(isin=isin, between=between), args.repeat)
+        assert np.array_equal(rows, expected), name
+        print(f"{name:<16}{len(rows):>12,}{mask_time * 1e3:>10.2f}{index_time * 1e3:>10.3f}{mask_time / index_time:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
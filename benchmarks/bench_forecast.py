@@ -0,0 +1,88 @@
+"""Benchmark the scenario forecast (per-window mask loop vs. bucketed single pass) and the Monte Carlo bands.
+
+Usage:
+    python benchmarks/bench_forecast.py
+    python benchmarks/bench_forecast.py --rows 15000 300000 1000000
+    python benchmarks/bench_forecast.py --rows 1000000 --trials 10000 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset import load_opportunities_dataset
+from forecast import (
+    CLOSED_STAGES, FORECAST_WORKERS, MAX_PERIODS, PERIODS, SCENARIOS, bucketed_forecast, period_buckets,
+    simulate_forecast
+)
+
+HORIZONS = (("Months", 12), ("Weeks", 36), ("Quarters", 36))
+
+
+def window_loop(df, periods, period, start):
+    """The loop revenue_forecasting() used before the bucketed forecast: five masks per window"""
+    period_days = PERIODS[period][0]
+    rows = []
+    for i in range(periods):
+        window_start = start + timedelta(days=period_days * i)
+        window_end = window_start + timedelta(days=period_days)
+        window = df[(df['expected_close_date'] >= window_start) & (df['expected_close_date'] < window_end)]
+        rows.append((
+            window[window['win_probability_ai'] >= 80]['opportunity_value'].sum() * 0.7,
+            window[window['win_probability_ai'] >= 60]['weighted_value'].sum(),
+            window['weighted_value'].sum() * 1.2
+        ))
+    return np.array(rows, dtype=np.float64)
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[15000, 300000, 1000000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--trials", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=FORECAST_WORKERS)
+    args = parser.parse_args()
+
+    start = datetime.now()
+    print(f"{'rows':>12}  {'horizon':<14}{'loop ms':>10}{'bucket ms':>11}{'speedup':>9}")
+    for n_rows in args.rows:
+        df = load_opportunities_dataset(n_rows, args.seed)["opportunities"]
+        for period, periods in HORIZONS:
+            loop_time, expected = best_of(lambda: window_loop(df, periods, period, start), args.repeat)
+            bucket_time, forecast = best_of(lambda: bucketed_forecast(df, periods, period, start), args.repeat)
+            assert np.allclose(forecast[list(SCENARIOS)].to_numpy(), expected), (n_rows, period)
+            print(f"{n_rows:>12,}  {f'{periods} {period}':<14}"
+                  f"{loop_time * 1e3:>10.2f}{bucket_time * 1e3:>11.2f}{loop_time / bucket_time:>8.1f}x")
+
+    # Start the longest horizon at the earliest close date so most open opportunities are simulated
+    print(f"\n{'rows':>12}{'deals':>12}{'trials':>9}{'workers':>9}{'seconds':>9}{'ns/draw':>9}")
+    for n_rows in args.rows:
+        df = load_opportunities_dataset(n_rows, args.seed)["opportunities"]
+        first = df['expected_close_date'].min()
+        inside = period_buckets(df['expected_close_date'].to_numpy(), first, MAX_PERIODS, PERIODS["Months"][0]) >= 0
+        deals = int((inside & ~df['sales_stage'].isin(CLOSED_STAGES).to_numpy()).sum())
+        elapsed, _ = best_of(lambda: simulate_forecast(
+            df, MAX_PERIODS, "Months", first, trials=args.trials, seed=args.seed, workers=args.workers
+        ), 1)
+        print(f"{n_rows:>12,}{deals:>12,}{args.trials:>9,}{args.workers:>9}{elapsed:>9.2f}"
+              f"{elapsed / (deals * args.trials) * 1e9:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
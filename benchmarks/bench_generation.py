@@ -0,0 +1,52 @@
+"""Benchmark the column-at-a-time dataset generators.
+
+Usage:
+    python benchmarks/bench_generation.py
+    python benchmarks/bench_generation.py --rows 15000 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datagen
+
+GENERATORS = {
+    "opportunities": datagen.generate_opportunities,
+    "policies": datagen.generate_policies,
+}
+
+
+def bench(generator, n_rows, seed, repeat):
+    """Return the best wall time over ``repeat`` runs and the resulting frame's memory footprint"""
+    best = float("inf")
+    memory = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frames = generator(n_rows, seed=seed)
+        best = min(best, time.perf_counter() - start)
+        memory = frames[0].memory_usage(deep=False).sum()
+        del frames
+    return best, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", choices=sorted(GENERATORS), nargs="+", default=sorted(GENERATORS))
+    parser.add_argument("--rows", type=int, nargs="+", default=[15000, 1000000, 10000000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'dataset':<15}{'rows':>12}{'seconds':>10}{'rows/sec':>14}{'MB':>10}")
+    for dataset in args.dataset:
+        for n_rows in args.rows:
+            seconds, memory = bench(GENERATORS[dataset], n_rows, args.seed, args.repeat)
+            print(f"{dataset:<15}{n_rows:>12,}{seconds:>10.2f}{n_rows / seconds:>14,.0f}{memory / 1e6:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the Hot Opportunities lists: copy + full sort vs. the maintained top-K index.
+
+Usage:
+    python benchmarks/bench_hotlist.py
+    python benchmarks/bench_hotlist.py --rows 1000000 --repeat 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_filters import scenarios
+from banding import HOT_BAND
+from dataset import load_opportunities_dataset
+from filters import opportunity_filter_index
+from hotlist import hot_opportunity_index
+
+
+def copy_and_sort(df, row_index):
+    """What hot_opportunities() did before the index: copy hot and critical rows, sort, take the heads"""
+    filtered_df = df.take(row_index)
+    hot_df = filtered_df[filtered_df['temperature_band'] == HOT_BAND].copy()
+    critical_df = hot_df[hot_df['priority'] == 'Critical'].copy()
+    return critical_df.head(10), hot_df.sort_values('temperature_score', ascending=False).head(20)
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = load_opportunities_dataset(args.rows, args.seed)["opportunities"]
+    filter_index = opportunity_filter_index(df)
+    start = time.perf_counter()
+    hot_index = hot_opportunity_index(df)
+    print(f"{len(df):,} rows: {len(hot_index.hot):,} hot, {len(hot_index.critical):,} critical hot, "
+          f"index built in {time.perf_counter() - start:.2f}s")
+
+    print(f"\n{'scenario':<16}{'rows':>12}{'sort ms':>10}{'page 1 ms':>11}{'page 50 ms':>12}")
+    for name, (isin, between) in scenarios(df).items():
+        row_index = filter_index.select(isin=isin, between=between)
+        sort_time = best_of(lambda: copy_and_sort(df, row_index), args.repeat)
+        first_time = best_of(lambda: (hot_index.critical.top(10, row_index), hot_index.hot.top(20, row_index)), args.repeat)
+        deep_time = best_of(lambda: hot_index.hot.top(20, row_index, offset=49 * 20), args.repeat)
+        print(f"{name:<16}{len(row_index):>12,}{sort_time * 1e3:>10.2f}{first_time * 1e3:>11.3f}{deep_time * 1e3:>12.3f}")
+
+    # Incremental maintenance: re-rank a batch of changed opportunities
+    rng = np.random.default_rng(args.seed)
+    print(f"\n{'changed rows':>12}{'update ms':>11}{'rebuild ms':>12}")
+    for n_changed in (1, 100, 10000):
+        positions = rng.choice(len(df), n_changed, replace=False)
+        temperatures = rng.uniform(0, 100, n_changed)
+        values = rng.integers(10000, 5000000, n_changed)
+        priorities = rng.choice(["Critical", "High", "Medium", "Low"], n_changed)
+        update_time = best_of(lambda: hot_index.update(positions, temperatures, values, priorities), args.repeat)
+        rebuild_time = best_of(lambda: hot_opportunity_index(df), args.repeat)
+        print(f"{n_changed:>12,}{update_time * 1e3:>11.2f}{rebuild_time * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
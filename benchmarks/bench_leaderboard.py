@@ -0,0 +1,77 @@
+"""Benchmark the Success Pattern Leaderboard: per-rep iterrows loop vs. vectorized scoring.
+
+Usage:
+    python benchmarks/bench_leaderboard.py
+    python benchmarks/bench_leaderboard.py --reps 50 500 5000 50000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datagen import SALES_TEAM
+from leaderboard import leaderboard
+from schema import rep_profiles
+
+
+def synthetic_team(n_reps, seed):
+    """A sales team of ``n_reps`` drawn from SALES_TEAM with jittered patterns and unique names"""
+    rng = np.random.default_rng(seed)
+    base = pd.DataFrame(SALES_TEAM)
+    team = base.iloc[rng.integers(0, len(base), n_reps)].reset_index(drop=True)
+    team["name"] = [f"{name} #{i}" for i, name in enumerate(team["name"])]
+    for column in ("avg_activities_per_week", "avg_response_time_hours", "avg_deal_size"):
+        team[column] = team[column] * rng.uniform(0.7, 1.3, n_reps)
+    for column in ("decision_maker_access_rate", "proposal_win_rate"):
+        team[column] = np.clip(team[column] * rng.uniform(0.7, 1.3, n_reps), 0, 1)
+    return team
+
+
+def iterrows_leaderboard(profiles, top_n):
+    """The loop pattern_recognition_matrix() used before: score one rep at a time, then sort everything"""
+    rep_analysis = []
+    for rep_name, rep_data in profiles.iterrows():
+        activity_score = min(100, (rep_data['rep_avg_activities_per_week'] / 35) * 100)
+        response_score = max(0, 100 - (rep_data['rep_avg_response_time_hours'] * 10))
+        access_score = rep_data['rep_decision_maker_access_rate'] * 100
+        win_score = rep_data['rep_proposal_win_rate'] * 100
+        pattern_score = (activity_score + response_score + access_score + win_score) / 4
+        rep_analysis.append({'name': rep_name, 'pattern_score': pattern_score})
+    rep_analysis.sort(key=lambda x: x['pattern_score'], reverse=True)
+    return [rep['name'] for rep in rep_analysis[:top_n]]
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reps", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'reps':>10}{'loop ms':>10}{'vector ms':>11}{'speedup':>9}")
+    for n_reps in args.reps:
+        profiles = rep_profiles(synthetic_team(n_reps, args.seed))
+        loop_time, expected = best_of(lambda: iterrows_leaderboard(profiles, args.top), args.repeat)
+        vector_time, board = best_of(lambda: leaderboard(profiles, args.top), args.repeat)
+        assert list(board.index) == expected, n_reps
+        print(f"{n_reps:>10,}{loop_time * 1e3:>10.2f}{vector_time * 1e3:>11.2f}{loop_time / vector_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
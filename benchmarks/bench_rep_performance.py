@@ -0,0 +1,93 @@
+"""Benchmark the Sales Performance KPIs and rep cards: groupby-apply vs. one grouped pass per rep.
+
+The opportunities keep their size and are reassigned at random to a
+synthetic team of ``--reps`` reps. The old KPIs summed pipeline per rep
+twice (for idxmax and max) and computed quota attainment with a Python
+callback per rep. The new ones are read off ``analytics.rep_performance``.
+The card columns time the per-rep loop that draws the expanders: iterrows
+against plain dicts.
+
+Usage:
+    python benchmarks/bench_rep_performance.py
+    python benchmarks/bench_rep_performance.py --rows 1000000 --reps 100 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import sales_performance_summary
+from bench_leaderboard import synthetic_team
+from cube import Rollup
+from dataset import load_opportunities_dataset
+from schema import rep_profiles
+
+
+def best_of(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def groupby_apply_kpis(filtered_df, sales_team_df):
+    """The KPIs sales_performance() computed before"""
+    profiles = rep_profiles(sales_team_df)
+    return {
+        'top_performer': filtered_df.groupby('sales_rep_name', observed=True)['opportunity_value'].sum().idxmax(),
+        'top_value': filtered_df.groupby('sales_rep_name', observed=True)['opportunity_value'].sum().max(),
+        'avg_quota_attainment': filtered_df.groupby('sales_rep_name', observed=True).apply(
+            lambda x: (x['opportunity_value'].sum() / profiles.at[x.name, 'sales_rep_quota']) * 100
+        ).mean()
+    }
+
+
+def walk_iterrows(reps):
+    return sum(data['quota_attainment'] for _, data in reps.iterrows())
+
+
+def walk_dicts(reps):
+    return sum(data['quota_attainment'] for data in reps.to_dict('index').values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--reps", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    opportunities_df = load_opportunities_dataset(args.rows, args.seed)["opportunities"]
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{args.rows:,} opportunities")
+    print(f"{'reps':>8}{'apply ms':>10}{'grouped ms':>12}{'speedup':>9}{'cards iterrows ms':>19}{'cards dicts ms':>16}")
+    for n_reps in args.reps:
+        team = synthetic_team(n_reps, args.seed)
+        names = team["name"].to_numpy()
+        df = opportunities_df.assign(sales_rep_name=pd.Categorical(names[rng.integers(0, n_reps, len(opportunities_df))], categories=names))
+        rollup = Rollup(df, None, "created_date")
+
+        apply_time, expected = best_of(lambda: groupby_apply_kpis(df, team), args.repeat)
+        grouped_time, summary = best_of(lambda: sales_performance_summary(df, team, rollup), args.repeat)
+        assert summary['top_performer'] == expected['top_performer'], n_reps
+        assert np.isclose(summary['top_value'], expected['top_value']), n_reps
+        assert np.isclose(summary['avg_quota_attainment'], expected['avg_quota_attainment']), n_reps
+
+        iterrows_time, _ = best_of(lambda: walk_iterrows(summary['reps']), args.repeat)
+        dicts_time, _ = best_of(lambda: walk_dicts(summary['reps']), args.repeat)
+        print(f"{n_reps:>8,}{apply_time * 1e3:>10.1f}{grouped_time * 1e3:>12.1f}{apply_time / grouped_time:>8.1f}x"
+              f"{iterrows_time * 1e3:>19.1f}{dicts_time * 1e3:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
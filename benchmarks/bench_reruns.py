@@ -0,0 +1,131 @@
+"""Benchmark Producer hub rerun latency: full-script reruns vs fragment-scoped reruns.
+
+Drives pd-hub.py with Streamlit's AppTest and times two UI-only interactions:
+the theme toggle, and picking producers in the Producer Scorecards tab. Each
+interaction is timed twice. The first time it reruns the whole script, which
+is how every interaction behaved before the fragments. The second time only
+the owning fragment reruns, which is what a browser click now triggers.
+AppTest reruns the whole script for every interaction, so the fragment case
+patches the rerun request with the fragment's id, the same request the
+Streamlit server sends.
+
+Caches are cleared before each mode. Both modes then compute the same
+scorecards from cold.
+
+Usage:
+    python benchmarks/bench_reruns.py
+    python benchmarks/bench_reruns.py --rows 200000 --repeat 10
+    HUB_TAB_MODE=eager python benchmarks/bench_reruns.py
+"""
+
+import argparse
+import functools
+import os
+import sys
+import time
+from unittest import mock
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "pd-hub.py")
+SCORECARD_TAB = "🏆 Producer Scorecards"
+
+
+def fragment_ids(at):
+    """Fragment id per decorated function name, from the AppTest's fragment storage"""
+    ids = {}
+    for fragment_id, wrapped in at._fragment_storage._fragments.items():
+        cells = list(wrapped.__closure__ or ())
+        while cells:
+            value = cells.pop().cell_contents
+            if callable(value) and getattr(value, "__module__", None) == "__main__":
+                ids[value.__name__] = fragment_id
+                break
+            if callable(value) and getattr(value, "__closure__", None):
+                cells += value.__closure__
+    return ids
+
+
+def timed_run(at, fragment_id=None):
+    """Milliseconds for one rerun, scoped to ``fragment_id`` when given"""
+    import streamlit.testing.v1.local_script_runner as local_script_runner
+    from streamlit.runtime.scriptrunner import RerunData
+
+    start = time.perf_counter()
+    if fragment_id is None:
+        at.run()
+    else:
+        scoped = functools.partial(RerunData, fragment_id_queue=[fragment_id], is_fragment_scoped_rerun=True)
+        with mock.patch.object(local_script_runner, "RerunData", scoped):
+            at.run()
+    elapsed = (time.perf_counter() - start) * 1e3
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def session(timeout):
+    """A fresh pd-hub session on the Producer Scorecards tab, after its first full run"""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.session_state["pd_hub_tab"] = SCORECARD_TAB
+    at.run()
+    return at
+
+
+def scorecard_picker(at):
+    return next(selectbox for selectbox in at.selectbox if selectbox.label == "🎯 Scorecard")
+
+
+def measure(scoped, repeat, timeout):
+    """Theme toggle and scorecard pick latencies (ms) for one mode
+
+    Each interaction gets its own session: after a fragment-scoped rerun the
+    AppTest tree only holds that fragment's elements.
+    """
+    at = session(timeout)
+    fragment_id = fragment_ids(at)["theme_toggle"] if scoped else None
+    theme = []
+    for _ in range(repeat):
+        at.button[0].click()
+        theme.append(timed_run(at, fragment_id))
+
+    at = session(timeout)
+    fragment_id = fragment_ids(at)["producer_scorecards"] if scoped else None
+    scorecard = []
+    for producer in scorecard_picker(at).options[1:repeat + 1]:
+        scorecard_picker(at).set_value(producer)
+        scorecard.append(timed_run(at, fragment_id))
+    return theme, scorecard
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="policies in the book (PDHUB_ROWS)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args()
+
+    os.environ["PDHUB_ROWS"] = str(args.rows)
+    sys.path.insert(0, ROOT)
+    full_theme, full_scorecard = measure(False, args.repeat, args.timeout)
+    fragment_theme, fragment_scorecard = measure(True, args.repeat, args.timeout)
+
+    print(f"pd-hub, {args.rows:,} policies, tab mode {os.environ.get('HUB_TAB_MODE', 'lazy')}, "
+          f"median of {args.repeat}")
+    print(f"{'interaction':<20}{'full ms':>10}{'fragment ms':>13}{'speedup':>9}")
+    for name, full, fragment in [
+        ("theme toggle", full_theme, fragment_theme),
+        ("scorecard producer", full_scorecard, fragment_scorecard),
+    ]:
+        full_ms, fragment_ms = np.median(full), np.median(fragment)
+        print(f"{name:<20}{full_ms:>10.1f}{fragment_ms:>13.1f}{full_ms / fragment_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
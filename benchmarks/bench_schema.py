@@ -0,0 +1,78 @@
+"""Memory report and tab groupby timings for the raw vs. compact schema.
+
+Usage:
+    python benchmarks/bench_schema.py
+    python benchmarks/bench_schema.py --rows 1000000 --policies 1000000 --top 15
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datagen
+from schema import apply_opportunity_schema, apply_policy_schema, memory_report
+
+# (group key, aggregation) pairs used by the tab functions
+OPPORTUNITY_GROUPBYS = [
+    ("sales_stage", {"opportunity_value": "sum", "opportunity_id": "count"}),
+    ("sales_rep_name", {"opportunity_value": "sum", "temperature_score": "mean", "win_probability_ai": "mean"}),
+    ("product_line", {"opportunity_value": "sum"}),
+    ("lead_source", {"opportunity_value": "sum", "opportunity_id": "count", "win_probability_ai": "mean"}),
+    ("company_id", {"opportunity_value": "sum", "temperature_score": "mean", "win_probability_ai": "mean"}),
+]
+
+POLICY_GROUPBYS = [
+    ("policy_type", {"premium": ["sum", "mean", "count"], "commission": "sum", "bind_ratio": "mean"}),
+    ("producer_region", {"premium": "sum"}),
+    ("producer_name", {"premium": ["sum", "mean", "count"], "commission": "sum", "customer_satisfaction": "mean"}),
+    ("carrier", {"premium": ["sum", "count"], "commission": "sum", "bind_ratio": "mean"}),
+    ("company_name", {"premium": "sum"}),
+    ("referral_source", {"premium": "sum", "policy_id": "count", "bind_ratio": "mean"}),
+]
+
+
+def time_groupby(df, key, aggregations, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df.groupby(key, observed=True).agg(aggregations)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(title, raw, compact, groupbys, repeat, top):
+    mem = memory_report(raw, compact)
+    total = mem.loc["TOTAL"]
+    print(f"\n== {title}: {len(raw):,} rows ==")
+    print(f"memory: {total['bytes_before'] / 1e6:,.1f} MB -> {total['bytes_after'] / 1e6:,.1f} MB "
+          f"({total['bytes_before'] / max(total['bytes_after'], 1):.1f}x smaller)")
+    print(mem.drop(index="TOTAL").head(top).to_string())
+
+    print(f"\n{'groupby':<20}{'raw ms':>10}{'compact ms':>12}{'speedup':>10}")
+    for key, aggregations in groupbys:
+        raw_time = time_groupby(raw, key, aggregations, repeat)
+        compact_time = time_groupby(compact, key, aggregations, repeat)
+        print(f"{key:<20}{raw_time * 1e3:>10.2f}{compact_time * 1e3:>12.2f}{raw_time / compact_time:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=15000, help="opportunities to generate")
+    parser.add_argument("--policies", type=int, default=2000, help="policies to generate")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="columns to list in each memory report")
+    args = parser.parse_args()
+
+    opportunities = datagen.generate_opportunities(args.rows)
+    report("opportunities", opportunities[0], apply_opportunity_schema(*opportunities)[0],
+           OPPORTUNITY_GROUPBYS, args.repeat, args.top)
+
+    policies = datagen.generate_policies(args.policies)
+    report("policies", policies[0], apply_policy_schema(*policies)[0], POLICY_GROUPBYS, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark bootstrap cohort comparisons on large synthetic sales teams.
+
+Usage:
+    python benchmarks/bench_success_dna.py
+    python benchmarks/bench_success_dna.py --reps 500 5000 --resamples 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_leaderboard import synthetic_team
+from schema import rep_profiles
+from success_dna import REST_OF_TEAM, compare_cohorts
+
+
+def cohort_pairs(profiles):
+    """Named (cohort A, cohort B) pairs covering every cohort kind"""
+    reps = profiles.index
+    region = profiles['sales_rep_region'].iloc[0]
+    return {
+        "rep vs rep": (("Rep", reps[0]), ("Rep", reps[1])),
+        "Elite vs rest": (("Tier", "Elite"), REST_OF_TEAM),
+        "Elite vs Standard": (("Tier", "Elite"), ("Tier", "Standard")),
+        "region vs rest": (("Region", region), REST_OF_TEAM),
+        "top 10% vs rest": (("Top N", max(1, len(profiles) // 10)), REST_OF_TEAM),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reps", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--resamples", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'reps':>8}  {'pair':<20}{'A reps':>8}{'B reps':>8}{'seconds':>9}{'significant':>13}")
+    for n_reps in args.reps:
+        profiles = rep_profiles(synthetic_team(n_reps, args.seed))
+        for name, (cohort_a, cohort_b) in cohort_pairs(profiles).items():
+            start = time.perf_counter()
+            comparison = compare_cohorts(profiles, cohort_a, cohort_b, args.resamples, seed=args.seed)
+            elapsed = time.perf_counter() - start
+            reps_a, reps_b = comparison.attrs["reps"]
+            print(f"{n_reps:>8,}  {name:<20}{reps_a:>8,}{reps_b:>8,}{elapsed:>9.2f}"
+                  f"{int(comparison['significant'].sum()):>8} / {len(comparison)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Benchmark every dashboard tab function end to end with Streamlit stubbed out.
+
+Imports oppking.py and pd-hub.py against a stand-in ``streamlit`` module whose
+widgets return their defaults and whose output calls do nothing, then runs each
+tab function on the unfiltered data at several dataset sizes. Each tab gets a
+fresh FilterCache per run, so cached aggregates are recomputed every time, as
+on the first rerun after a filter change. Chart rendering is out of scope: the
+figures are built, but nothing serializes them.
+
+For every app, tab and size it records the best wall time of ``--repeat`` runs,
+then reruns once under tracemalloc. From that run it records the peak memory
+allocated during the call, and from snapshots before and after it, the blocks
+the call allocated that are alive when it returns (its results and cached
+aggregates included) and those still held once the cache is dropped.
+Snapshots only see live blocks, so temporaries freed inside the call count
+towards the peak, not the allocations. Results go to ``--output`` as
+JSON. With a baseline on disk, rows more than ``--tolerance`` slower or larger
+than the baseline are flagged, and the exit status is 1.
+
+Usage:
+    python benchmarks/bench_tabs.py --scales 15000 150000 --update-baseline
+    python benchmarks/bench_tabs.py --scales 15000 150000
+    python benchmarks/bench_tabs.py --app oppking --tab revenue_forecasting --scales 1500000
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import types
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_SCALES = (15000, 150000, 1500000, 15000000)
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "bench_tabs.json")
+# Wall-time differences below this are noise, whatever the ratio
+NOISE_FLOOR_SECONDS = 0.005
+
+
+class SessionState(dict):
+    """``st.session_state`` with attribute access"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class StubStreamlit(types.ModuleType):
+    """Stand-in ``streamlit`` module: widgets return their defaults, everything else is a no-op
+
+    Containers (columns, tabs, expanders, the sidebar) are the stub itself, so
+    ``with col1:`` and ``col1.button(...)`` both work. ``elements`` counts the
+    calls that would have sent something to the browser.
+    """
+
+    def __init__(self):
+        super().__init__("streamlit")
+        self.session_state = SessionState()
+        self.sidebar = self
+        self.elements = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def element(*args, **kwargs):
+            self.elements += 1
+            return self
+        return element
+
+    @staticmethod
+    def cache_resource(function=None, **kwargs):
+        # Pass-through: every call recomputes, which is what the benchmark measures
+        return function if function is not None else (lambda function: function)
+
+    cache_data = cache_resource
+    fragment = cache_resource
+
+    def columns(self, spec, **kwargs):
+        return [self] * (spec if isinstance(spec, int) else len(spec))
+
+    def tabs(self, labels, **kwargs):
+        return [self] * len(labels)
+
+    def container(self, *args, **kwargs):
+        return self
+
+    def expander(self, *args, **kwargs):
+        return self
+
+    def selectbox(self, label, options, index=0, **kwargs):
+        return list(options)[index]
+
+    def radio(self, label, options, index=0, **kwargs):
+        return list(options)[index]
+
+    def multiselect(self, label, options, default=None, **kwargs):
+        return list(default) if default is not None else []
+
+    def slider(self, label, min_value=None, max_value=None, value=None, step=None, **kwargs):
+        return value if value is not None else min_value
+
+    def number_input(self, label, min_value=None, max_value=None, value=None, step=None, **kwargs):
+        return value if value is not None else min_value
+
+    def date_input(self, label, value=None, **kwargs):
+        return value
+
+    def checkbox(self, label, value=False, **kwargs):
+        return value
+
+    toggle = checkbox
+
+    def button(self, *args, **kwargs):
+        return False
+
+
+def load_app(stub, name, filename):
+    """Import an app script as a module with ``streamlit`` replaced by the stub"""
+    sys.modules["streamlit"] = stub
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def opportunity_tabs(app, n_rows, seed):
+    """(tab, function of a fresh FilterCache) for every Opportunities tab, unfiltered"""
+    from cube import Rollup, opportunity_cube
+    from dataset import load_opportunities_dataset
+    from hotlist import hot_opportunity_index
+
+    dataset = load_opportunities_dataset(n_rows, seed)
+    opportunities_df, sales_team_df, companies_df = dataset.frames()
+    row_index = np.arange(len(opportunities_df))
+    hot_index = hot_opportunity_index(opportunities_df)
+    rollup = Rollup(opportunities_df, opportunity_cube(opportunities_df).query(), 'created_date')
+    return [
+        ("executive_dashboard", lambda cache: app.executive_dashboard(
+            opportunities_df, opportunities_df, cache.scope("bench"), rollup
+        )),
+        ("pattern_recognition_matrix", lambda cache: app.pattern_recognition_matrix(
+            opportunities_df, sales_team_df, opportunities_df, dataset.version
+        )),
+        ("hot_opportunities", lambda cache: app.hot_opportunities(
+            opportunities_df, sales_team_df, companies_df, hot_index, row_index, cache.scope("bench")
+        )),
+        ("pipeline_analytics", lambda cache: app.pipeline_analytics(opportunities_df, cache.scope("bench"), rollup)),
+        ("account_intelligence", lambda cache: app.account_intelligence(
+            opportunities_df, sales_team_df, companies_df, cache.scope("bench")
+        )),
+        ("sales_performance", lambda cache: app.sales_performance(
+            opportunities_df, sales_team_df, cache.scope("bench"), rollup
+        )),
+        ("revenue_forecasting", lambda cache: app.revenue_forecasting(opportunities_df, cache.scope("bench"))),
+    ]
+
+
+def policy_tabs(app, n_rows, seed):
+    """(tab, function of a fresh FilterCache) for every Producer hub tab, unfiltered"""
+    from cube import Rollup, policy_cube
+    from dataset import load_policies_dataset
+
+    dataset = load_policies_dataset(n_rows, seed)
+    policies_df, producers_df, _ = dataset.frames()
+    rollup = Rollup(policies_df, policy_cube(policies_df).query(), 'created_date')
+    producer = producers_df['name'].iloc[0]
+    return [
+        ("executive_dashboard", lambda cache: app.executive_dashboard(policies_df, policies_df, cache.scope("bench"), rollup)),
+        ("producer_scorecards", lambda cache: app.producer_scorecards(
+            policies_df, producers_df, "All Producers", cache.scope("bench")
+        )),
+        ("producer_scorecards[producer]", lambda cache: app.producer_scorecards(
+            policies_df, producers_df, producer, cache.scope("bench")
+        )),
+        ("performance_analytics", lambda cache: app.performance_analytics(policies_df, cache.scope("bench"))),
+        ("policy_intelligence", lambda cache: app.policy_intelligence(policies_df, cache.scope("bench"))),
+        ("top_performers", lambda cache: app.top_performers(policies_df, cache.scope("bench"))),
+    ]
+
+
+def measure(run, repeat):
+    """Best wall time of ``repeat`` runs, then peak, allocated and retained memory of one traced run"""
+    from filters import FilterCache
+
+    best = float("inf")
+    for _ in range(repeat):
+        cache = FilterCache()
+        start = time.perf_counter()
+        run(cache)
+        best = min(best, time.perf_counter() - start)
+
+    cache = FilterCache()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    result = run(cache)
+    _, peak = tracemalloc.get_traced_memory()
+    # Per line, so blocks a line allocated are not netted against ones another line freed
+    allocated = [stat for stat in tracemalloc.take_snapshot().compare_to(before, "lineno") if stat.count_diff > 0]
+    del cache, result
+    gc.collect()
+    retained = tracemalloc.take_snapshot().compare_to(before, "filename")
+    tracemalloc.stop()
+    return {
+        "seconds": best,
+        "peak_mb": (peak - base) / 1e6,
+        "allocated_mb": sum(max(stat.size_diff, 0) for stat in allocated) / 1e6,
+        "allocated_blocks": sum(stat.count_diff for stat in allocated),
+        "retained_mb": sum(stat.size_diff for stat in retained) / 1e6,
+        "retained_blocks": sum(stat.count_diff for stat in retained),
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """Rows slower or larger than the baseline by more than ``tolerance``, as (result, base, reasons)"""
+    baseline_rows = {(row["app"], row["tab"], row["rows"]): row for row in baseline["results"]}
+    flagged = []
+    for result in results:
+        base = baseline_rows.get((result["app"], result["tab"], result["rows"]))
+        if base is None:
+            continue
+        reasons = []
+        if (result["seconds"] > base["seconds"] * (1 + tolerance)
+                and result["seconds"] - base["seconds"] > NOISE_FLOOR_SECONDS):
+            reasons.append(f"time {base['seconds'] * 1e3:,.1f} -> {result['seconds'] * 1e3:,.1f} ms")
+        if result["peak_mb"] > base["peak_mb"] * (1 + tolerance) and result["peak_mb"] - base["peak_mb"] > 1:
+            reasons.append(f"peak {base['peak_mb']:,.1f} -> {result['peak_mb']:,.1f} MB")
+        if reasons:
+            flagged.append((result, base, reasons))
+    return flagged
+
+
+def write_json(path, payload):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(payload, handle, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--app", choices=["oppking", "pd-hub"], nargs="+", default=["oppking", "pd-hub"])
+    parser.add_argument("--tab", nargs="+", help="only these tab functions")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_tabs_results.json")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown/growth over the baseline")
+    args = parser.parse_args()
+
+    stub = StubStreamlit()
+    apps = {
+        "oppking": (load_app(stub, "oppking", "oppking.py"), opportunity_tabs),
+        "pd-hub": (load_app(stub, "pd_hub", "pd-hub.py"), policy_tabs),
+    }
+    payload = {
+        "meta": {
+            "python": platform.python_version(), "pandas": pd.__version__, "numpy": np.__version__,
+            "machine": platform.machine(), "cpus": os.cpu_count(), "scales": args.scales, "seed": args.seed,
+            "repeat": args.repeat, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": [],
+    }
+
+    print(f"{'app':<9}{'tab':<32}{'rows':>12}{'ms':>11}{'peak MB':>10}{'alloc blocks':>14}{'kept MB':>9}{'kept blocks':>13}")
+    for n_rows in args.scales:
+        for app_name in args.app:
+            app, tabs = apps[app_name]
+            for tab, run in tabs(app, n_rows, args.seed):
+                if args.tab and tab.split("[")[0] not in args.tab:
+                    continue
+                stub.elements = 0
+                result = {"app": app_name, "tab": tab, "rows": n_rows, **measure(run, args.repeat)}
+                result["elements"] = stub.elements // (args.repeat + 1)
+                payload["results"].append(result)
+                print(f"{app_name:<9}{tab:<32}{n_rows:>12,}{result['seconds'] * 1e3:>11.1f}{result['peak_mb']:>10.1f}"
+                      f"{result['allocated_blocks']:>14,}{result['retained_mb']:>9.2f}{result['retained_blocks']:>13,}")
+            # Written after every app and size, so a run cut short by memory still leaves results
+            write_json(args.output, payload)
+
+    print(f"\nResults written to {args.output}")
+    if args.update_baseline:
+        write_json(args.baseline, payload)
+        print(f"Baseline stored at {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; rerun with --update-baseline to store one")
+        return
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    flagged = regressions(payload["results"], baseline, args.tolerance)
+    print(f"Compared with the baseline from {baseline['meta']['created']} (tolerance {args.tolerance:.0%}): "
+          f"{len(flagged)} regression(s)")
+    for result, base, reasons in flagged:
+        print(f"  REGRESSION {result['app']} {result['tab']} @ {result['rows']:,}: {'; '.join(reasons)}")
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
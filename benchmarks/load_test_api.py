@@ -0,0 +1,162 @@
+"""Load-test the dashboard API (api.py) on localhost.
+
+Fires a seeded mix of tab requests with random sidebar filters from
+concurrent clients and reports throughput, latency percentiles and status
+codes. ``--states`` sets how many distinct filter states the mix draws from,
+which controls how often requests hit the API's filter/aggregate cache.
+
+Usage:
+    python benchmarks/load_test_api.py --start
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8600 --requests 2000 --concurrency 32 --states 50
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from datagen import CARRIERS, POLICY_TYPES, PRODUCERS, PRODUCT_LINES, SALES_STAGES, SALES_TEAM
+
+OPPORTUNITY_TABS = ("executive", "hot", "pipeline", "accounts", "sales-performance", "forecast")
+POLICY_TABS = ("overview", "producers", "scorecard", "performance", "intelligence", "top-performers")
+TEMPERATURES = ("Hot (80-100)", "Warm (60-79)", "Cold (0-59)")
+PRIORITIES = ("Critical", "High", "Medium", "Low")
+
+
+def opportunity_state(rng):
+    """Query parameters for one random Opportunities sidebar state"""
+    params = []
+    if rng.random() < 0.3:
+        params.append(("sales_rep", rng.choice(SALES_TEAM)["name"]))
+    if rng.random() < 0.4:
+        params += [("stage", stage["name"]) for stage in rng.sample(SALES_STAGES, rng.randint(1, 4))]
+    if rng.random() < 0.3:
+        params += [("product", product["name"]) for product in rng.sample(PRODUCT_LINES, rng.randint(1, 3))]
+    if rng.random() < 0.3:
+        params += [("temperature", band) for band in rng.sample(TEMPERATURES, rng.randint(1, 2))]
+    if rng.random() < 0.2:
+        params += [("priority", priority) for priority in rng.sample(PRIORITIES, rng.randint(1, 2))]
+    if rng.random() < 0.3:
+        # Month-aligned starts keep the cube usable, like the sidebar's quick filters
+        params.append(("start_date", f"{rng.choice([2023, 2024, 2025])}-{rng.randint(1, 12):02d}-01"))
+    return params
+
+
+def policy_state(rng):
+    """Query parameters for one random Producer hub sidebar state"""
+    params = []
+    if rng.random() < 0.3:
+        params.append(("policy_type", rng.choice(POLICY_TYPES)["type"]))
+    if rng.random() < 0.3:
+        params.append(("carrier", rng.choice(CARRIERS)))
+    if rng.random() < 0.2:
+        params.append(("status", rng.choice(["Active", "Pending", "Quoted", "Renewed"])))
+    return params
+
+
+def request_mix(n_requests, n_states, seed):
+    """``n_requests`` URL paths drawn from ``n_states`` distinct filter states per dataset"""
+    rng = random.Random(seed)
+    opportunity_states = [opportunity_state(rng) for _ in range(n_states)]
+    policy_states = [policy_state(rng) for _ in range(n_states)]
+    paths = []
+    for _ in range(n_requests):
+        if rng.random() < 0.6:
+            tab = rng.choice(OPPORTUNITY_TABS)
+            params = list(rng.choice(opportunity_states))
+            if tab == "hot":
+                params.append(("page", rng.randint(1, 5)))
+            paths.append(f"/opportunities/{tab}?{urllib.parse.urlencode(params)}")
+        else:
+            tab = rng.choice(POLICY_TABS)
+            params = list(rng.choice(policy_states))
+            if tab == "scorecard":
+                params.append(("producer", rng.choice(PRODUCERS)["name"]))
+            paths.append(f"/policies/{tab}?{urllib.parse.urlencode(params)}")
+    return paths
+
+
+def fetch(url):
+    """(status, seconds, bytes) for one GET"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=120) as response:
+            body = response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        body = error.read()
+        status = error.code
+    except OSError:
+        return "error", time.perf_counter() - start, 0
+    return status, time.perf_counter() - start, len(body)
+
+
+def wait_for(url, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=5):
+                return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"API at {url} did not come up within {timeout:.0f}s")
+
+
+def run(url, paths, concurrency, suffix):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(lambda path: fetch(f"{url}{path}{suffix}"), paths))
+    elapsed = time.perf_counter() - start
+
+    statuses = Counter(status for status, _, _ in results)
+    latencies = np.array([seconds for _, seconds, _ in results]) * 1e3
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    megabytes = sum(size for _, _, size in results) / 1e6
+    print(f"{len(paths):>9,}{concurrency:>8}{len(paths) / elapsed:>10.1f}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}"
+          f"{latencies.max():>9.1f}{megabytes:>8.1f}  {dict(sorted(statuses.items(), key=str))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8600")
+    parser.add_argument("--start", action="store_true", help="start api.py on the --url port for the test")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--states", type=int, default=20)
+    parser.add_argument("--format", choices=["json", "arrow"], default="json")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = None
+    if args.start:
+        port = urllib.parse.urlparse(args.url).port or 80
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "api.py"), "--port", str(port)], cwd=ROOT)
+    try:
+        wait_for(args.url, timeout=300)
+        paths = request_mix(args.requests, args.states, args.seed)
+        suffix = "&format=arrow" if args.format == "arrow" else ""
+        print(f"{args.requests:,} requests over {args.states} filter states per dataset, {args.format}")
+        print(f"{'requests':>9}{'clients':>8}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'MB':>8}  statuses")
+        # The first pass fills the cache; later passes replay the same mix
+        for concurrency in args.concurrency:
+            run(args.url, paths, concurrency, suffix)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Server-side data reduction for charts drawn over many rows.
+
+Plotly Express serializes every row it is given into the figure JSON, and
+the browser has to parse and draw all of it. Up to ``RAW_CHART_ROWS`` rows
+the charts still take raw rows. Above that the tabs draw from what these
+helpers compute:
+
+- ``stratified_sample``: row positions for a scatter. The few most extreme
+  rows of each column are kept, and the rest of the budget is drawn per
+  group, so each group keeps its share and small groups stay visible.
+- ``binned_2d``: counts on a 2D grid, drawn as a heatmap instead of a
+  point cloud.
+- ``histogram``: bin edges and counts, drawn as bars instead of shipping raw
+  values to ``px.histogram``.
+
+``render_mode`` switches scatter traces to WebGL above ``WEBGL_POINTS`` points.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Charts take raw rows up to this many; above it scatters are sampled down to it and distributions binned
+RAW_CHART_ROWS = int(os.environ.get("HUB_RAW_CHART_ROWS", "10000"))
+
+# Scatter traces switch to WebGL above this many points
+WEBGL_POINTS = 1000
+
+# Rows at each end of a column that a sample always keeps
+EXTREME_ROWS = 10
+
+# Fixed seed: a filter state always draws the same sample, so reruns do not reshuffle the points
+SAMPLE_SEED = 0
+
+
+def render_mode(n_points):
+    """``render_mode`` for ``px.scatter``: WebGL above ``WEBGL_POINTS``, Plotly's default otherwise"""
+    return "webgl" if n_points > WEBGL_POINTS else "auto"
+
+
+def stratified_sample(df, n, by=None, keep_extremes=(), extremes=EXTREME_ROWS, seed=SAMPLE_SEED):
+    """Sorted row positions of about ``n`` rows of ``df``
+
+    The ``extremes`` smallest and largest rows of every ``keep_extremes``
+    column are always kept, up to half of ``n``. Each ``by`` group then gets
+    its share of ``n`` (at least one row), less the extremes already in it,
+    filled with rows picked at random.
+    """
+    if len(df) <= n:
+        return np.arange(len(df))
+    rng = np.random.default_rng(seed)
+
+    extreme = np.zeros(len(df), dtype=bool)
+    for column in keep_extremes:
+        values = df[column].to_numpy(dtype=float)
+        valid = np.flatnonzero(~np.isnan(values))
+        k = min(extremes, len(valid) // 2)
+        if k > 0:
+            order = np.argpartition(values[valid], (k - 1, len(valid) - k))
+            extreme[valid[order[:k]]] = True
+            extreme[valid[order[-k:]]] = True
+    outliers = np.flatnonzero(extreme)
+    if len(outliers) > n // 2:
+        outliers = rng.choice(outliers, n // 2, replace=False)
+        extreme[:] = False
+        extreme[outliers] = True
+
+    codes = pd.factorize(df[by].to_numpy())[0] if by is not None else np.zeros(len(df), dtype=np.intp)
+    shares = np.maximum(1, np.round(n * np.bincount(codes) / len(df)).astype(np.intp))
+    rest = np.flatnonzero(~extreme)
+    kept = np.bincount(codes[outliers], minlength=len(shares))
+    codes = codes[rest]
+    sizes = np.bincount(codes, minlength=len(shares))
+    quotas = np.clip(shares - kept, 0, sizes)
+
+    # Random order within each group; keep each group's first ``quota`` rows
+    order = np.lexsort((rng.random(len(rest)), codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(rest)) - starts[codes[order]]
+    sampled = rest[order[rank < quotas[codes[order]]]]
+    return np.sort(np.concatenate([outliers, sampled]))
+
+
+def binned_2d(x, y, bins=40):
+    """(x bin centers, y bin centers, counts[y, x]) of a 2D histogram; empty cells are NaN so they draw blank"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    counts, x_edges, y_edges = np.histogram2d(x[valid], y[valid], bins=bins)
+    counts = counts.T
+    counts[counts == 0] = np.nan
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts
+
+
+def histogram(values, bins=20):
+    """Bin start, end, center and count per bin, ignoring missing values"""
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return pd.DataFrame({
+        'bin_start': edges[:-1],
+        'bin_end': edges[1:],
+        'bin_center': (edges[:-1] + edges[1:]) / 2,
+        'count': counts
+    })
@@ -0,0 +1,187 @@
+"""Pre-aggregated cube for the dashboard groupbys.
+
+A ``Cube`` groups the fact table once, at load time, over its filter
+dimensions plus a month bucket, keeping the row count and the sum of every
+measure per cell. When the sidebar filters line up with the cube (only
+dimension selections, month-aligned or open-ended dates, no measure ranges)
+the tabs' sums, counts and means are rolled up from those cells instead of
+scanning the filtered rows, so their cost tracks the number of cells rather
+than the number of opportunities or policies.
+
+``Rollup`` is what the tabs use: it answers ``by(dimension, measures)`` from
+the cube when it can and falls back to a groupby over the filtered rows,
+returning the same ``count`` / ``<measure>_sum`` / ``<measure>_mean`` table
+either way.
+"""
+
+import numpy as np
+import pandas as pd
+
+MONTH = "month"
+
+OPPORTUNITY_CUBE_DIMENSIONS = ("sales_rep_name", "sales_stage", "product_line", "priority", "temperature_band")
+OPPORTUNITY_CUBE_MEASURES = (
+    "opportunity_value", "weighted_value", "temperature_score", "win_probability_ai",
+    "days_in_stage", "stage_probability"
+)
+
+POLICY_CUBE_DIMENSIONS = ("producer_name", "policy_type", "status", "producer_region", "carrier")
+POLICY_CUBE_MEASURES = ("premium", "commission", "bind_ratio", "customer_satisfaction", "risk_score")
+
+
+def _table(counts, sums, index=None):
+    """count, <measure>_sum and <measure>_mean columns from counts and a {measure: sums} mapping"""
+    table = {"count": counts}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for measure, total in sums.items():
+            table[f"{measure}_sum"] = total
+            table[f"{measure}_mean"] = np.where(counts > 0, total / counts, np.nan)
+    return pd.DataFrame(table, index=index)
+
+
+def _grouped(keys, weights, columns):
+    """Sum ``weights`` and every array in ``columns`` per distinct key, via factorize + bincount.
+
+    Groups come back in sorted (category) order and only for keys that occur,
+    like ``groupby(..., observed=True)``; missing keys are dropped.
+    """
+    if isinstance(getattr(keys, "dtype", None), pd.CategoricalDtype):
+        # Category codes are already dense integers; unobserved categories are dropped below
+        codes, uniques = np.asarray(keys.cat.codes), keys.cat.categories
+    else:
+        codes, uniques = pd.factorize(keys, sort=True)
+    valid = codes >= 0
+    if not valid.all():
+        codes = codes[valid]
+        weights = weights[valid] if weights is not None else None
+        columns = {name: values[valid] for name, values in columns.items()}
+    size = len(uniques)
+    counts = np.bincount(codes, weights=weights, minlength=size)
+    sums = {name: np.bincount(codes, weights=values, minlength=size) for name, values in columns.items()}
+    observed = np.bincount(codes, minlength=size) > 0
+    index = pd.Index(uniques, name=getattr(keys, "name", None))[observed]
+    return _table(counts[observed].astype(np.int64), {name: total[observed] for name, total in sums.items()}, index)
+
+
+class Cube:
+    """Counts and measure sums per (dimensions, month) cell of one fact table"""
+
+    def __init__(self, df, dimensions, measures, date_column):
+        self.dimensions = tuple(dimensions) + (MONTH,)
+        self.measures = tuple(measures)
+        self.first_date = df[date_column].min()
+        self.last_date = df[date_column].max()
+
+        keys = [df[dimension] for dimension in dimensions]
+        keys.append(df[date_column].dt.to_period("M").rename(MONTH))
+
+        # Sums are accumulated in float64 so float32 measures do not lose precision
+        values = df[list(self.measures)].astype("float64")
+        grouped = values.groupby(keys, observed=True)
+        # Measure sums are stored as <measure>_sum so they never collide with a dimension name
+        cells = grouped.sum().add_suffix("_sum")
+        cells.insert(0, "count", grouped.size())
+        self.cells = cells.reset_index()
+
+    def __len__(self):
+        return len(self.cells)
+
+    def nbytes(self):
+        return int(self.cells.memory_usage(deep=True).sum())
+
+    def months(self, start, end):
+        """Month bounds for the date range [start, end), or None if it splits a month.
+
+        Returns ``(first, last)`` Periods, either of which may be None when
+        that side of the range covers all of the data.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        first = last = None
+        if start > self.first_date:
+            if start != start.to_period("M").start_time:
+                return None
+            first = start.to_period("M")
+        if end <= self.last_date:
+            if end != end.to_period("M").start_time:
+                return None
+            last = end.to_period("M") - 1
+        return first, last
+
+    def query(self, isin=None, months=(None, None)):
+        """CubeQuery for dimension selections and month bounds, or None if a filter is not a cube dimension"""
+        isin = isin or {}
+        if any(column not in self.dimensions for column in isin):
+            return None
+
+        mask = np.ones(len(self.cells), dtype=bool)
+        for column, selected in isin.items():
+            mask &= self.cells[column].isin(list(selected)).to_numpy()
+        first, last = months
+        if first is not None:
+            mask &= (self.cells[MONTH] >= first).to_numpy()
+        if last is not None:
+            mask &= (self.cells[MONTH] <= last).to_numpy()
+        return CubeQuery(self, self.cells[mask])
+
+
+class CubeQuery:
+    """The cube cells selected by one filter state"""
+
+    def __init__(self, cube, cells):
+        self.cube = cube
+        self.cells = cells
+
+    def _sums(self, measures):
+        return {measure: self.cells[f"{measure}_sum"].to_numpy() for measure in measures}
+
+    def by(self, dimension, measures):
+        counts = self.cells["count"].to_numpy(dtype=np.float64)
+        return _grouped(self.cells[dimension], counts, self._sums(measures))
+
+    def totals(self, measures):
+        counts = np.array([self.cells["count"].sum()])
+        sums = {measure: np.array([values.sum()]) for measure, values in self._sums(measures).items()}
+        return _table(counts, sums).iloc[0]
+
+
+class Rollup:
+    """Grouped sums, counts and means for one filter state, from the cube when it lines up"""
+
+    def __init__(self, filtered_df, cube_query=None, date_column=None):
+        self.filtered_df = filtered_df
+        self.cube_query = cube_query
+        self.date_column = date_column
+
+    @property
+    def from_cube(self):
+        return self.cube_query is not None
+
+    def _keys(self, dimension):
+        if dimension == MONTH:
+            return self.filtered_df[self.date_column].dt.to_period("M").rename(MONTH)
+        return self.filtered_df[dimension]
+
+    def _values(self, measures):
+        return {measure: self.filtered_df[measure].to_numpy(dtype=np.float64) for measure in measures}
+
+    def by(self, dimension, measures):
+        """Table indexed by ``dimension`` with count, <measure>_sum and <measure>_mean columns"""
+        if self.cube_query is not None:
+            return self.cube_query.by(dimension, measures)
+        return _grouped(self._keys(dimension), None, self._values(measures))
+
+    def totals(self, measures):
+        """count, <measure>_sum and <measure>_mean over all selected rows"""
+        if self.cube_query is not None:
+            return self.cube_query.totals(measures)
+        counts = np.array([len(self.filtered_df)])
+        sums = {measure: np.array([values.sum()]) for measure, values in self._values(measures).items()}
+        return _table(counts, sums).iloc[0]
+
+
+def opportunity_cube(opportunities_df):
+    return Cube(opportunities_df, OPPORTUNITY_CUBE_DIMENSIONS, OPPORTUNITY_CUBE_MEASURES, "created_date")
+
+
+def policy_cube(policies_df):
+    return Cube(policies_df, POLICY_CUBE_DIMENSIONS, POLICY_CUBE_MEASURES, "created_date")
@@ -0,0 +1,753 @@
+"""Column-at-a-time synthetic data generation for the Opportunities and Producer hubs.
+
+Every attribute is drawn for all rows at once as a NumPy array from a seeded
+``np.random.Generator``, so the same seed always yields the same dataset and
+generation cost grows with the number of columns rather than Python-level
+work per row.
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from faker import Faker
+
+# Sales team with specializations, experience, and pattern data
+SALES_TEAM = [
+    {
+        "id": 1, "name": "Sarah Chen", "email": "sarah.chen@nexusinsure.com",
+        "region": "West Coast", "specialty": "Commercial Property", "experience_years": 8,
+        "quota_annual": 4500000, "tier": "Elite", "performance_score": 94,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 32, "emails_per_opp": 18, "calls_per_opp": 8, "meetings_per_opp": 4,
+        "avg_response_time_hours": 2.1, "decision_maker_access_rate": 0.85, "proposal_win_rate": 0.72,
+        "avg_deal_size": 285000, "avg_sales_cycle_days": 38, "lead_conversion_rate": 0.45,
+        "cross_sell_rate": 0.35, "referral_generation_rate": 0.28, "linkedin_connections": 2850,
+        "industry_expertise_score": 92, "negotiation_success_rate": 0.78, "client_satisfaction": 4.7
+    },
+    {
+        "id": 2, "name": "Marcus Rodriguez", "email": "marcus.r@nexusinsure.com",
+        "region": "Southwest", "specialty": "Cyber Security", "experience_years": 12,
+        "quota_annual": 5200000, "tier": "Elite", "performance_score": 98,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 28, "emails_per_opp": 15, "calls_per_opp": 10, "meetings_per_opp": 5,
+        "avg_response_time_hours": 1.8, "decision_maker_access_rate": 0.88, "proposal_win_rate": 0.75,
+        "avg_deal_size": 320000, "avg_sales_cycle_days": 42, "lead_conversion_rate": 0.52,
+        "cross_sell_rate": 0.42, "referral_generation_rate": 0.35, "linkedin_connections": 3200,
+        "industry_expertise_score": 96, "negotiation_success_rate": 0.82, "client_satisfaction": 4.8
+    },
+    {
+        "id": 3, "name": "Elena Volkov", "email": "elena.v@nexusinsure.com",
+        "region": "Northeast", "specialty": "Professional Liability", "experience_years": 15,
+        "quota_annual": 6000000, "tier": "Elite", "performance_score": 96,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 35, "emails_per_opp": 22, "calls_per_opp": 12, "meetings_per_opp": 6,
+        "avg_response_time_hours": 1.5, "decision_maker_access_rate": 0.92, "proposal_win_rate": 0.78,
+        "avg_deal_size": 380000, "avg_sales_cycle_days": 45, "lead_conversion_rate": 0.48,
+        "cross_sell_rate": 0.38, "referral_generation_rate": 0.32, "linkedin_connections": 4100,
+        "industry_expertise_score": 98, "negotiation_success_rate": 0.85, "client_satisfaction": 4.9
+    },
+    {
+        "id": 4, "name": "James Kim", "email": "james.kim@nexusinsure.com",
+        "region": "Southeast", "specialty": "General Liability", "experience_years": 6,
+        "quota_annual": 3200000, "tier": "Senior", "performance_score": 87,
+        # Pattern Recognition Data - Lower performance patterns
+        "avg_activities_per_week": 18, "emails_per_opp": 8, "calls_per_opp": 4, "meetings_per_opp": 2,
+        "avg_response_time_hours": 6.2, "decision_maker_access_rate": 0.52, "proposal_win_rate": 0.45,
+        "avg_deal_size": 125000, "avg_sales_cycle_days": 65, "lead_conversion_rate": 0.22,
+        "cross_sell_rate": 0.15, "referral_generation_rate": 0.08, "linkedin_connections": 850,
+        "industry_expertise_score": 72, "negotiation_success_rate": 0.58, "client_satisfaction": 4.1
+    },
+    {
+        "id": 5, "name": "Isabella Foster", "email": "isabella.f@nexusinsure.com",
+        "region": "Midwest", "specialty": "Directors & Officers", "experience_years": 9,
+        "quota_annual": 4800000, "tier": "Elite", "performance_score": 91,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 26, "emails_per_opp": 14, "calls_per_opp": 7, "meetings_per_opp": 3,
+        "avg_response_time_hours": 3.2, "decision_maker_access_rate": 0.78, "proposal_win_rate": 0.68,
+        "avg_deal_size": 245000, "avg_sales_cycle_days": 48, "lead_conversion_rate": 0.38,
+        "cross_sell_rate": 0.28, "referral_generation_rate": 0.22, "linkedin_connections": 2200,
+        "industry_expertise_score": 88, "negotiation_success_rate": 0.72, "client_satisfaction": 4.5
+    },
+    {
+        "id": 6, "name": "David Park", "email": "david.park@nexusinsure.com",
+        "region": "West Coast", "specialty": "Workers Compensation", "experience_years": 4,
+        "quota_annual": 2800000, "tier": "Standard", "performance_score": 78,
+        # Pattern Recognition Data - Lower performance patterns
+        "avg_activities_per_week": 15, "emails_per_opp": 6, "calls_per_opp": 3, "meetings_per_opp": 1,
+        "avg_response_time_hours": 8.5, "decision_maker_access_rate": 0.48, "proposal_win_rate": 0.38,
+        "avg_deal_size": 95000, "avg_sales_cycle_days": 78, "lead_conversion_rate": 0.18,
+        "cross_sell_rate": 0.12, "referral_generation_rate": 0.05, "linkedin_connections": 620,
+        "industry_expertise_score": 65, "negotiation_success_rate": 0.52, "client_satisfaction": 3.9
+    },
+    {
+        "id": 7, "name": "Zoe Williams", "email": "zoe.w@nexusinsure.com",
+        "region": "Northeast", "specialty": "Commercial Property", "experience_years": 18,
+        "quota_annual": 7500000, "tier": "Elite", "performance_score": 99,
+        # Pattern Recognition Data - Top performer
+        "avg_activities_per_week": 38, "emails_per_opp": 25, "calls_per_opp": 14, "meetings_per_opp": 7,
+        "avg_response_time_hours": 1.2, "decision_maker_access_rate": 0.95, "proposal_win_rate": 0.82,
+        "avg_deal_size": 425000, "avg_sales_cycle_days": 35, "lead_conversion_rate": 0.58,
+        "cross_sell_rate": 0.48, "referral_generation_rate": 0.42, "linkedin_connections": 5200,
+        "industry_expertise_score": 99, "negotiation_success_rate": 0.88, "client_satisfaction": 4.9
+    },
+    {
+        "id": 8, "name": "Ahmed Hassan", "email": "ahmed.h@nexusinsure.com",
+        "region": "Southeast", "specialty": "Cyber Security", "experience_years": 11,
+        "quota_annual": 4900000, "tier": "Elite", "performance_score": 93,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 24, "emails_per_opp": 16, "calls_per_opp": 9, "meetings_per_opp": 4,
+        "avg_response_time_hours": 2.8, "decision_maker_access_rate": 0.82, "proposal_win_rate": 0.70,
+        "avg_deal_size": 265000, "avg_sales_cycle_days": 44, "lead_conversion_rate": 0.42,
+        "cross_sell_rate": 0.32, "referral_generation_rate": 0.25, "linkedin_connections": 2800,
+        "industry_expertise_score": 90, "negotiation_success_rate": 0.75, "client_satisfaction": 4.6
+    },
+    {
+        "id": 9, "name": "Sophie Turner", "email": "sophie.t@nexusinsure.com",
+        "region": "Midwest", "specialty": "Professional Liability", "experience_years": 5,
+        "quota_annual": 2900000, "tier": "Standard", "performance_score": 82,
+        # Pattern Recognition Data - Lower performance patterns
+        "avg_activities_per_week": 16, "emails_per_opp": 7, "calls_per_opp": 3, "meetings_per_opp": 2,
+        "avg_response_time_hours": 7.1, "decision_maker_access_rate": 0.45, "proposal_win_rate": 0.42,
+        "avg_deal_size": 110000, "avg_sales_cycle_days": 72, "lead_conversion_rate": 0.20,
+        "cross_sell_rate": 0.14, "referral_generation_rate": 0.06, "linkedin_connections": 750,
+        "industry_expertise_score": 68, "negotiation_success_rate": 0.55, "client_satisfaction": 4.0
+    },
+    {
+        "id": 10, "name": "Ryan O'Connor", "email": "ryan.o@nexusinsure.com",
+        "region": "West Coast", "specialty": "General Liability", "experience_years": 7,
+        "quota_annual": 3600000, "tier": "Senior", "performance_score": 89,
+        # Pattern Recognition Data
+        "avg_activities_per_week": 20, "emails_per_opp": 12, "calls_per_opp": 6, "meetings_per_opp": 3,
+        "avg_response_time_hours": 4.5, "decision_maker_access_rate": 0.65, "proposal_win_rate": 0.58,
+        "avg_deal_size": 180000, "avg_sales_cycle_days": 55, "lead_conversion_rate": 0.32,
+        "cross_sell_rate": 0.22, "referral_generation_rate": 0.15, "linkedin_connections": 1450,
+        "industry_expertise_score": 82, "negotiation_success_rate": 0.68, "client_satisfaction": 4.3
+    }
+]
+
+# 10 product lines with realistic pricing
+PRODUCT_LINES = [
+    {
+        "name": "Commercial Property", "base_premium": 45000, "margin": 0.25,
+        "complexity": "Medium", "sales_cycle_days": 35, "win_rate": 0.68
+    },
+    {
+        "name": "General Liability", "base_premium": 28000, "margin": 0.22,
+        "complexity": "Low", "sales_cycle_days": 25, "win_rate": 0.72
+    },
+    {
+        "name": "Cyber Security", "base_premium": 85000, "margin": 0.35,
+        "complexity": "High", "sales_cycle_days": 55, "win_rate": 0.58
+    },
+    {
+        "name": "Workers Compensation", "base_premium": 35000, "margin": 0.20,
+        "complexity": "Medium", "sales_cycle_days": 30, "win_rate": 0.75
+    },
+    {
+        "name": "Professional Liability", "base_premium": 65000, "margin": 0.30,
+        "complexity": "High", "sales_cycle_days": 45, "win_rate": 0.62
+    },
+    {
+        "name": "Directors & Officers", "base_premium": 120000, "margin": 0.40,
+        "complexity": "High", "sales_cycle_days": 65, "win_rate": 0.55
+    },
+    {
+        "name": "Employment Practices", "base_premium": 38000, "margin": 0.25,
+        "complexity": "Medium", "sales_cycle_days": 35, "win_rate": 0.65
+    },
+    {
+        "name": "Commercial Auto", "base_premium": 22000, "margin": 0.18,
+        "complexity": "Low", "sales_cycle_days": 20, "win_rate": 0.78
+    },
+    {
+        "name": "Umbrella Policy", "base_premium": 18000, "margin": 0.28,
+        "complexity": "Medium", "sales_cycle_days": 25, "win_rate": 0.70
+    },
+    {
+        "name": "Product Liability", "base_premium": 95000, "margin": 0.38,
+        "complexity": "High", "sales_cycle_days": 60, "win_rate": 0.52
+    }
+]
+
+# 8 sales stages with probabilities
+SALES_STAGES = [
+    {"name": "Lead", "probability": 0.10, "order": 1},
+    {"name": "Qualified", "probability": 0.25, "order": 2},
+    {"name": "Needs Analysis", "probability": 0.40, "order": 3},
+    {"name": "Proposal", "probability": 0.60, "order": 4},
+    {"name": "Negotiation", "probability": 0.80, "order": 5},
+    {"name": "Verbal Commitment", "probability": 0.90, "order": 6},
+    {"name": "Closed Won", "probability": 1.00, "order": 7},
+    {"name": "Closed Lost", "probability": 0.00, "order": 8}
+]
+
+# 10 lead sources with quality scoring
+LEAD_SOURCES = [
+    {"name": "Referral Partner", "quality_score": 95, "conversion_rate": 0.45, "avg_deal_size": 120000},
+    {"name": "Client Referral", "quality_score": 92, "conversion_rate": 0.65, "avg_deal_size": 85000},
+    {"name": "Industry Conference", "quality_score": 88, "conversion_rate": 0.35, "avg_deal_size": 95000},
+    {"name": "LinkedIn Outreach", "quality_score": 82, "conversion_rate": 0.28, "avg_deal_size": 65000},
+    {"name": "Trade Association", "quality_score": 85, "conversion_rate": 0.32, "avg_deal_size": 75000},
+    {"name": "Webinar", "quality_score": 78, "conversion_rate": 0.22, "avg_deal_size": 55000},
+    {"name": "Cold Outreach", "quality_score": 65, "conversion_rate": 0.12, "avg_deal_size": 45000},
+    {"name": "Website Inquiry", "quality_score": 72, "conversion_rate": 0.18, "avg_deal_size": 50000},
+    {"name": "Marketing Campaign", "quality_score": 75, "conversion_rate": 0.20, "avg_deal_size": 60000},
+    {"name": "Broker Introduction", "quality_score": 90, "conversion_rate": 0.42, "avg_deal_size": 110000}
+]
+
+# Company profile reference data
+INDUSTRIES = [
+    "Technology", "Manufacturing", "Healthcare", "Financial Services", "Energy", 
+    "Logistics", "Retail", "Construction", "Real Estate", "Aerospace",
+    "Pharmaceuticals", "Telecommunications", "Media", "Education", "Government"
+]
+
+COMPANY_SIZES = ["Startup", "Small Business", "Mid-Market", "Enterprise", "Fortune 500"]
+
+COMPANY_SIZE_RANGES = {
+    "Startup": {"employees": (10, 100), "revenue": (500000, 10000000)},
+    "Small Business": {"employees": (100, 500), "revenue": (10000000, 50000000)},
+    "Mid-Market": {"employees": (500, 2000), "revenue": (50000000, 500000000)},
+    "Enterprise": {"employees": (2000, 10000), "revenue": (500000000, 5000000000)},
+    "Fortune 500": {"employees": (10000, 100000), "revenue": (5000000000, 50000000000)}
+}
+
+# Opportunity value multiplier by company size
+COMPANY_SIZE_VALUE_FACTORS = {"Startup": 0.5, "Small Business": 0.8, "Mid-Market": 1.2, "Enterprise": 2.0, "Fortune 500": 3.5}
+
+COMPETITORS = ["AIG", "Zurich", "Travelers", "Liberty Mutual", "Chubb"]
+DECISION_MAKER_TITLES = ["CEO", "CFO", "COO", "VP Operations", "Director", "Manager"]
+COMPETITIVE_ADVANTAGES = [
+    "Better pricing", "Superior coverage", "Industry expertise", 
+    "Relationship strength", "Technology platform", "Service quality"
+]
+FORECAST_CATEGORIES = ["Commit", "Best Case", "Pipeline"]
+
+OPPORTUNITIES_START_DATE = datetime(2023, 1, 1)
+
+# Distinct decision maker names drawn from Faker and reused across rows
+DECISION_MAKER_POOL_SIZE = 1000
+
+RISK_FACTOR_LABELS = [
+    "Stalled - No activity in 60+ days",
+    "High-risk client profile",
+    "Low engagement temperature",
+    "Proposal pending decision"
+]
+
+NEXT_ACTIONS = {
+    "closing": "🔥 Schedule closing meeting - High temperature!",
+    "proposal": "📞 Follow up on proposal decision",
+    "stalling": "⚡ Re-engage immediately - Opportunity stalling",
+    "qualified": "📋 Conduct needs analysis",
+    "negotiation": "💰 Address pricing concerns",
+    "default": "📈 Advance to next stage"
+}
+
+# Producer data with realistic profiles
+PRODUCERS = [
+    {"id": 1, "name": "Sarah Chen", "email": "sarah.chen@nexusinsure.com", "phone": "(555) 123-4567", 
+     "region": "West Coast", "hire_date": "2020-03-15", "tier": "Elite", "specialty": "Commercial Property"},
+    {"id": 2, "name": "Marcus Rodriguez", "email": "marcus.r@nexusinsure.com", "phone": "(555) 234-5678", 
+     "region": "Southwest", "hire_date": "2019-07-22", "tier": "Elite", "specialty": "Cyber Security"},
+    {"id": 3, "name": "Elena Volkov", "email": "elena.v@nexusinsure.com", "phone": "(555) 345-6789", 
+     "region": "Northeast", "hire_date": "2018-01-10", "tier": "Elite", "specialty": "Professional Liability"},
+    {"id": 4, "name": "James Kim", "email": "james.kim@nexusinsure.com", "phone": "(555) 456-7890", 
+     "region": "Southeast", "hire_date": "2021-05-03", "tier": "Platinum", "specialty": "General Liability"},
+    {"id": 5, "name": "Isabella Foster", "email": "isabella.f@nexusinsure.com", "phone": "(555) 567-8901", 
+     "region": "Midwest", "hire_date": "2020-09-18", "tier": "Elite", "specialty": "Directors & Officers"},
+    {"id": 6, "name": "David Park", "email": "david.park@nexusinsure.com", "phone": "(555) 678-9012", 
+     "region": "West Coast", "hire_date": "2022-02-14", "tier": "Gold", "specialty": "Workers Compensation"},
+    {"id": 7, "name": "Zoe Williams", "email": "zoe.w@nexusinsure.com", "phone": "(555) 789-0123", 
+     "region": "Northeast", "hire_date": "2017-11-30", "tier": "Elite", "specialty": "Commercial Property"},
+    {"id": 8, "name": "Ahmed Hassan", "email": "ahmed.h@nexusinsure.com", "phone": "(555) 890-1234", 
+     "region": "Southeast", "hire_date": "2019-04-12", "tier": "Elite", "specialty": "Cyber Security"},
+    {"id": 9, "name": "Sophie Turner", "email": "sophie.t@nexusinsure.com", "phone": "(555) 901-2345", 
+     "region": "Midwest", "hire_date": "2021-08-07", "tier": "Platinum", "specialty": "Professional Liability"},
+    {"id": 10, "name": "Ryan O'Connor", "email": "ryan.o@nexusinsure.com", "phone": "(555) 012-3456", 
+     "region": "West Coast", "hire_date": "2020-12-01", "tier": "Gold", "specialty": "General Liability"}
+]
+
+# Client companies for the Producer Hub book of business
+CLIENT_COMPANIES = [
+    {"name": "TechNova Solutions", "industry": "Technology", "size": "Enterprise", "revenue": 50000000},
+    {"name": "Quantum Dynamics Corp", "industry": "Manufacturing", "size": "Fortune 500", "revenue": 200000000},
+    {"name": "Stellar Manufacturing", "industry": "Manufacturing", "size": "Mid-Market", "revenue": 25000000},
+    {"name": "EcoFlow Industries", "industry": "Energy", "size": "Enterprise", "revenue": 75000000},
+    {"name": "CyberShield Security", "industry": "Technology", "size": "Mid-Market", "revenue": 30000000},
+    {"name": "NextGen Robotics", "industry": "Technology", "size": "Startup", "revenue": 5000000},
+    {"name": "BioTech Innovations", "industry": "Healthcare", "size": "Enterprise", "revenue": 100000000},
+    {"name": "CloudFirst Systems", "industry": "Technology", "size": "Mid-Market", "revenue": 20000000},
+    {"name": "DataStream Analytics", "industry": "Technology", "size": "Small Business", "revenue": 8000000},
+    {"name": "GreenTech Ventures", "industry": "Energy", "size": "Mid-Market", "revenue": 35000000},
+    {"name": "Digital Frontier Inc", "industry": "Technology", "size": "Enterprise", "revenue": 60000000},
+    {"name": "SmartGrid Technologies", "industry": "Energy", "size": "Enterprise", "revenue": 80000000},
+    {"name": "FusionPoint Energy", "industry": "Energy", "size": "Fortune 500", "revenue": 300000000},
+    {"name": "NanoTech Materials", "industry": "Manufacturing", "size": "Mid-Market", "revenue": 40000000},
+    {"name": "AeroSpace Dynamics", "industry": "Aerospace", "size": "Enterprise", "revenue": 120000000},
+    {"name": "PharmaCore Research", "industry": "Healthcare", "size": "Enterprise", "revenue": 90000000},
+    {"name": "AgriTech Solutions", "industry": "Agriculture", "size": "Mid-Market", "revenue": 22000000},
+    {"name": "MetaVerse Industries", "industry": "Technology", "size": "Startup", "revenue": 12000000},
+    {"name": "BlockChain Systems", "industry": "Technology", "size": "Mid-Market", "revenue": 28000000},
+    {"name": "AI-Powered Logistics", "industry": "Logistics", "size": "Enterprise", "revenue": 65000000}
+]
+
+# Insurance carriers
+CARRIERS = [
+    "AIG", "Zurich", "Liberty Mutual", "Travelers", "Hartford", "Chubb", "Allianz", "Marsh", 
+    "Willis Towers Watson", "Aon", "Berkshire Hathaway", "CNA", "Nationwide", "Progressive Commercial",
+    "State Farm Commercial", "Allstate Commercial", "USAA", "Farmers Commercial", "MetLife", "Prudential"
+]
+
+# Policy types and details
+POLICY_TYPES = [
+    {"type": "Commercial Property", "avg_premium": 45000, "commission_rate": 0.12},
+    {"type": "General Liability", "avg_premium": 25000, "commission_rate": 0.10},
+    {"type": "Cyber Security", "avg_premium": 35000, "commission_rate": 0.15},
+    {"type": "Workers Compensation", "avg_premium": 30000, "commission_rate": 0.08},
+    {"type": "Professional Liability", "avg_premium": 40000, "commission_rate": 0.14},
+    {"type": "Directors & Officers", "avg_premium": 60000, "commission_rate": 0.16},
+    {"type": "Employment Practices", "avg_premium": 28000, "commission_rate": 0.11},
+    {"type": "Commercial Auto", "avg_premium": 20000, "commission_rate": 0.09},
+    {"type": "Umbrella Policy", "avg_premium": 15000, "commission_rate": 0.13},
+    {"type": "Product Liability", "avg_premium": 50000, "commission_rate": 0.17}
+]
+
+# Referral sources
+REFERRAL_SOURCES = [
+    "LinkedIn", "Industry Conference", "Client Referral", "Broker Network", "Cold Outreach", 
+    "Trade Association", "Chamber of Commerce", "Online Lead", "Partner Referral", "Renewal"
+]
+
+# Policy status mix: established policies vs. those created in the last 30 days
+SETTLED_STATUSES = ["Active", "Expired", "Cancelled", "Renewed"]
+SETTLED_STATUS_WEIGHTS = [60, 15, 10, 15]
+RECENT_STATUSES = ["Active", "Pending", "Quoted"]
+RECENT_STATUS_WEIGHTS = [40, 35, 25]
+
+POLICY_LIMITS = [1000000, 2000000, 5000000, 10000000]
+DEDUCTIBLES = [1000, 2500, 5000, 10000, 25000]
+
+# Policies are created over the two years before the as-of date
+POLICY_HISTORY_DAYS = 730
+
+
+def resolve_as_of(as_of=None):
+    """Return the reference 'now' for relative dates, normalized to midnight so reruns on the same day agree"""
+    if as_of is None:
+        return pd.Timestamp.now().normalize()
+    return pd.Timestamp(as_of).normalize()
+
+
+def _choice(rng, options, size):
+    """Uniformly pick from a list of options, returning an object array"""
+    values = np.empty(len(options), dtype=object)
+    values[:] = options
+    return values[rng.integers(0, len(options), size)]
+
+
+def _randint(rng, low, high, size=None):
+    """Inclusive integer range, matching random.randint semantics"""
+    return rng.integers(low, np.asarray(high) + 1, size)
+
+
+def _days(values):
+    """Integer day offsets as timedelta64[ns]"""
+    return np.asarray(values, dtype='int64').astype('timedelta64[D]').astype('timedelta64[ns]')
+
+
+def _format_unique(codes, formatter):
+    """Format a string per row by formatting each distinct code once and broadcasting"""
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    labels = np.empty(len(unique_codes), dtype=object)
+    labels[:] = [formatter(code) for code in unique_codes]
+    return labels[inverse.reshape(-1)]
+
+
+def _sequence_ids(prefix, n_rows):
+    """Build zero-padded identifiers such as OPP-000001 for every row"""
+    numbers = np.char.zfill(np.arange(1, n_rows + 1).astype('U'), 6)
+    return np.char.add(prefix, numbers).astype(object)
+
+
+def generate_companies(rng, fake, n_companies=500):
+    """Generate the company dimension with one vectorized draw per attribute"""
+    size = _choice(rng, COMPANY_SIZES, n_companies)
+    emp_low = np.array([COMPANY_SIZE_RANGES[s]["employees"][0] for s in size], dtype='int64')
+    emp_high = np.array([COMPANY_SIZE_RANGES[s]["employees"][1] for s in size], dtype='int64')
+    rev_low = np.array([COMPANY_SIZE_RANGES[s]["revenue"][0] for s in size], dtype='int64')
+    rev_high = np.array([COMPANY_SIZE_RANGES[s]["revenue"][1] for s in size], dtype='int64')
+
+    return pd.DataFrame({
+        "id": np.arange(1, n_companies + 1),
+        "name": [fake.company() for _ in range(n_companies)],
+        "industry": _choice(rng, INDUSTRIES, n_companies),
+        "size": size,
+        "employees": _randint(rng, emp_low, emp_high),
+        "annual_revenue": _randint(rng, rev_low, rev_high),
+        "founded": _randint(rng, 2000, 2022, n_companies),
+        "headquarters": [fake.city() + ", " + fake.state_abbr() for _ in range(n_companies)],
+        "website": [fake.url() for _ in range(n_companies)],
+        "risk_profile": _choice(rng, ["Low", "Medium", "High"], n_companies),
+        "credit_rating": _choice(rng, ["A+", "A", "A-", "B+", "B", "B-"], n_companies),
+        "previous_claims": _randint(rng, 0, 8, n_companies),
+        "market_position": _choice(rng, ["Leader", "Challenger", "Follower", "Niche"], n_companies),
+        "growth_rate": np.round(rng.uniform(-0.1, 0.4, n_companies), 3),
+        "technology_adoption": _choice(rng, ["Early Adopter", "Mainstream", "Late Adopter"], n_companies)
+    })
+
+
+def _sample_competitors(rng, n_rows):
+    """Draw 0-3 distinct competitors per row, equivalent to random.sample(COMPETITORS, k)"""
+    n_competitors = len(COMPETITORS)
+    k = rng.integers(0, 4, n_rows)
+
+    # Sequential sampling without replacement: shift each draw past the slots already taken
+    first = rng.integers(0, n_competitors, n_rows)
+    second = rng.integers(0, n_competitors - 1, n_rows)
+    second += second >= first
+    third = rng.integers(0, n_competitors - 2, n_rows)
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    third += third >= low
+    third += third >= high
+
+    base = n_competitors
+    codes = k * base ** 3
+    codes += np.where(k > 0, first, 0) * base ** 2
+    codes += np.where(k > 1, second, 0) * base
+    codes += np.where(k > 2, third, 0)
+
+    def formatter(code):
+        count, rest = divmod(int(code), base ** 3)
+        digits = [rest // base ** 2, (rest // base) % base, rest % base]
+        return [COMPETITORS[d] for d in digits[:count]]
+
+    return _format_unique(codes, formatter)
+
+
+def generate_opportunities(n_rows=15000, seed=42, as_of=None, n_companies=500):
+    """Generate the opportunities fact table and its sales team and companies dimensions column-at-a-time.
+
+    Opportunities reference reps and companies by ``sales_rep_id`` and
+    ``company_id``; ``schema.join_dimensions`` attaches their attributes when a
+    consumer needs them. ``seed`` fully determines the output for a given
+    ``as_of`` date.
+    """
+    rng = np.random.default_rng(seed)
+    fake = Faker()
+    fake.seed_instance(seed)
+    now = resolve_as_of(as_of)
+
+    sales_team_df = pd.DataFrame(SALES_TEAM)
+    companies_df = generate_companies(rng, fake, n_companies)
+    products_df = pd.DataFrame(PRODUCT_LINES)
+    stages_df = pd.DataFrame(SALES_STAGES)
+    sources_df = pd.DataFrame(LEAD_SOURCES)
+
+    # Dimension draws
+    rep_idx = rng.integers(0, len(sales_team_df), n_rows)
+    company_idx = rng.integers(0, len(companies_df), n_rows)
+    product_idx = rng.integers(0, len(products_df), n_rows)
+    stage_idx = rng.integers(0, len(stages_df), n_rows)
+    source_idx = rng.integers(0, len(sources_df), n_rows)
+
+    def rep(column):
+        return sales_team_df[column].to_numpy()[rep_idx]
+
+    def company(column):
+        return companies_df[column].to_numpy()[company_idx]
+
+    def product(column):
+        return products_df[column].to_numpy()[product_idx]
+
+    def stage(column):
+        return stages_df[column].to_numpy()[stage_idx]
+
+    def source(column):
+        return sources_df[column].to_numpy()[source_idx]
+
+    stage_name = stage("name")
+    stage_order = stage("order")
+    stage_probability = stage("probability")
+    is_closed = np.isin(stage_name, ["Closed Won", "Closed Lost"])
+
+    # Realistic dates
+    start_date = pd.Timestamp(OPPORTUNITIES_START_DATE)
+    end_date = now + pd.Timedelta(days=180)  # Include future opportunities
+    days_range = (end_date - start_date).days
+    created_days = (rng.beta(2, 5, n_rows) * days_range).astype('int64')
+    created_date = start_date.to_datetime64() + _days(created_days)
+
+    # Per-rep factors are computed on the 10-row team table and broadcast by index
+    experience_factor = np.minimum(1.8, 1.0 + sales_team_df["experience_years"].to_numpy() * 0.05)
+    rep_deal_size_factor = sales_team_df["avg_deal_size"].to_numpy() / 200000  # Normalize around 200k average
+    size_factor = np.array([COMPANY_SIZE_VALUE_FACTORS[s] for s in companies_df["size"]])
+
+    value_variation = rng.uniform(0.4, 3.2, n_rows)
+    opportunity_value = (
+        product("base_premium") * value_variation * experience_factor[rep_idx]
+        * size_factor[company_idx] * rep_deal_size_factor[rep_idx]
+    ).astype('int64')
+    opportunity_value = np.clip(opportunity_value, 10000, 5000000)  # Cap values
+
+    # Close date: closed deals within the product cycle, open deals on the rep's cycle with slippage
+    closed_offset = _randint(rng, 5, product("sales_cycle_days"))
+    open_offset = rep("avg_sales_cycle_days").astype('int64') + _randint(rng, -14, 30, n_rows)
+    close_date = created_date + _days(np.where(is_closed, closed_offset, open_offset))
+
+    days_in_stage = np.where(is_closed, 0, (now.to_datetime64() - created_date) // np.timedelta64(1, 'D'))
+    days_to_close = (close_date - now.to_datetime64()) // np.timedelta64(1, 'D')
+
+    # Temperature score driven by rep patterns
+    performance = sales_team_df["performance_score"].to_numpy()
+    activities = sales_team_df["avg_activities_per_week"].to_numpy()
+    response = sales_team_df["avg_response_time_hours"].to_numpy()
+    rep_boost = (
+        np.where(performance > 80, (performance - 80) * 0.5, 0)
+        + np.where(activities > 15, np.minimum(20, activities - 15), 0)
+        + np.where(response > 3, np.maximum(-15, (response - 3) * -2), 0)
+    )
+    base_temp = _randint(rng, 30, 90, n_rows)
+    temperature_score = np.clip(base_temp + rep_boost[rep_idx], 0, 100)
+
+    # Health score (relationship, engagement, budget, decision maker access, competitive position)
+    health_score = (
+        _randint(rng, 15, 25, n_rows) + _randint(rng, 10, 20, n_rows) + _randint(rng, 10, 20, n_rows)
+        + _randint(rng, 10, 20, n_rows) + _randint(rng, 5, 15, n_rows)
+    )
+    health_score = np.clip(health_score, 0, 100)
+
+    # Risk assessment as a 4-bit flag code
+    risk_flags = (
+        (days_in_stage > 60).astype('int64')
+        | (company("risk_profile") == "High").astype('int64') << 1
+        | (temperature_score < 40).astype('int64') << 2
+        | ((stage_name == "Proposal") & (days_in_stage > 30)).astype('int64') << 3
+    )
+    risk_factors = _format_unique(
+        risk_flags, lambda code: [label for bit, label in enumerate(RISK_FACTOR_LABELS) if code >> bit & 1]
+    )
+    risk_count = np.array([bin(code).count("1") for code in range(16)])[risk_flags]
+    risk_level = np.select([risk_count >= 3, risk_count >= 1], ["High", "Medium"], "Low").astype(object)
+
+    # Next best action (AI recommendation), first matching rule wins
+    next_action = np.select(
+        [
+            temperature_score >= 80,
+            (stage_name == "Proposal") & (days_in_stage > 21),
+            days_in_stage > 45,
+            stage_name == "Qualified",
+            stage_name == "Negotiation"
+        ],
+        [
+            NEXT_ACTIONS["closing"], NEXT_ACTIONS["proposal"], NEXT_ACTIONS["stalling"],
+            NEXT_ACTIONS["qualified"], NEXT_ACTIONS["negotiation"]
+        ],
+        NEXT_ACTIONS["default"]
+    ).astype(object)
+
+    competitors = _sample_competitors(rng, n_rows)
+
+    # Priority level
+    priority = np.select(
+        [
+            (opportunity_value > 500000) & (temperature_score > 70),
+            (opportunity_value > 200000) & (temperature_score > 60),
+            temperature_score > 50
+        ],
+        ["Critical", "High", "Medium"],
+        "Low"
+    ).astype(object)
+
+    last_activity_offset = _randint(rng, 0, np.maximum(days_in_stage, 0))
+    last_activity_date = created_date + _days(np.where(days_in_stage > 0, last_activity_offset, 0))
+    next_activity_date = now.to_datetime64() + _days(_randint(rng, 1, 14, n_rows))
+
+    decision_maker_pool = np.array([fake.name() for _ in range(min(n_rows, DECISION_MAKER_POOL_SIZE))], dtype=object)
+    decision_maker = decision_maker_pool[rng.integers(0, len(decision_maker_pool), n_rows)]
+
+    competitive_advantage = np.where(
+        rng.random(n_rows) > 0.3, _choice(rng, COMPETITIVE_ADVANTAGES, n_rows), None
+    )
+
+    proposal_sent_date = np.where(
+        stage_order >= 4, created_date + _days(_randint(rng, 10, 40, n_rows)), np.datetime64('NaT')
+    )
+    contract_sent_date = np.where(
+        stage_order >= 5, created_date + _days(_randint(rng, 30, 60, n_rows)), np.datetime64('NaT')
+    )
+
+    win_probability_ai = np.clip(
+        temperature_score * 0.7 + health_score * 0.3 + _randint(rng, -15, 15, n_rows), 0, 100
+    )
+
+    # Each distinct (temperature, health, risk) triple is formatted once
+    temp_values, temp_codes = np.unique(temperature_score, return_inverse=True)
+    risk_codes = np.select([risk_level == "High", risk_level == "Medium"], [2, 1], 0)
+    insight_codes = (temp_codes.reshape(-1) * 101 + health_score) * 3 + risk_codes
+    ai_insights = _format_unique(
+        insight_codes,
+        lambda code: "Temperature: {}/100, Health: {}/100, Risk: {}".format(
+            temp_values[code // 3 // 101], code // 3 % 101, ["Low", "Medium", "High"][code % 3]
+        )
+    )
+
+    product_name = product("name")
+    company_names = companies_df["name"].to_numpy()
+    product_names = products_df["name"].to_numpy()
+    opportunity_name = _format_unique(
+        company_idx * len(product_names) + product_idx,
+        lambda code: f"{company_names[code // len(product_names)]} - {product_names[code % len(product_names)]}"
+    )
+
+    opportunities_df = pd.DataFrame({
+        "opportunity_id": _sequence_ids("OPP-", n_rows),
+        "opportunity_name": opportunity_name,
+        "sales_rep_id": rep("id"),
+        "sales_rep_name": rep("name"),
+        "company_id": company("id"),
+
+        "product_line": product_name,
+        "product_complexity": product("complexity"),
+        "product_margin": product("margin"),
+
+        "sales_stage": stage_name,
+        "stage_probability": stage_probability,
+        "stage_order": stage_order,
+
+        "lead_source": source("name"),
+        "lead_quality_score": source("quality_score"),
+        "source_conversion_rate": source("conversion_rate"),
+
+        "opportunity_value": opportunity_value,
+        "weighted_value": (opportunity_value * stage_probability).astype('int64'),
+        "created_date": created_date,
+        "expected_close_date": close_date,
+        "days_in_stage": days_in_stage,
+        "days_to_close": days_to_close,
+
+        "temperature_score": temperature_score,
+        "health_score": health_score,
+        "risk_level": risk_level,
+        "risk_factors": risk_factors,
+        "priority": priority,
+
+        "last_activity_date": last_activity_date,
+        "next_activity_date": next_activity_date,
+        "activities_count": _randint(rng, 1, 25, n_rows),
+        "meetings_count": _randint(rng, 0, 8, n_rows),
+        "emails_count": _randint(rng, 2, 35, n_rows),
+        "calls_count": _randint(rng, 1, 15, n_rows),
+
+        "decision_maker": decision_maker,
+        "decision_maker_title": _choice(rng, DECISION_MAKER_TITLES, n_rows),
+        "budget_confirmed": rng.random(n_rows) < 0.5,
+        "authority_confirmed": rng.random(n_rows) < 0.5,
+        "need_confirmed": rng.random(n_rows) < 0.5,
+        "timeline_confirmed": rng.random(n_rows) < 0.5,
+
+        "competitors": competitors,
+        "competitive_advantage": competitive_advantage,
+
+        "proposal_sent_date": proposal_sent_date,
+        "contract_sent_date": contract_sent_date,
+
+        "win_probability_ai": win_probability_ai,
+        "forecast_category": _choice(rng, FORECAST_CATEGORIES, n_rows),
+        "next_best_action": next_action,
+        "ai_insights": ai_insights,
+
+        "annual_contract_value": opportunity_value,
+        "multi_year_potential": rng.random(n_rows) < 0.5,
+        "cross_sell_potential": _randint(rng, 20, 95, n_rows),
+        "upsell_potential": _randint(rng, 15, 80, n_rows),
+        "renewal_probability": np.where(stage_name == "Closed Won", _randint(rng, 60, 95, n_rows), np.nan)
+    })
+
+    return opportunities_df, sales_team_df, companies_df
+
+
+def generate_policies(n_policies=2000, seed=42, as_of=None):
+    """Generate the policies, producers and companies frames for the Producer Hub in one batch.
+
+    Dates are datetime64 arrays, status is a weighted ``Generator.choice`` and
+    commission is premium x commission rate, so multi-million-policy books
+    are as cheap to build per row as the default 2,000.
+    """
+    rng = np.random.default_rng(seed)
+    now = resolve_as_of(as_of)
+
+    producers_df = pd.DataFrame(PRODUCERS)
+    companies_df = pd.DataFrame(CLIENT_COMPANIES)
+    policy_types_df = pd.DataFrame(POLICY_TYPES)
+
+    producer_idx = rng.integers(0, len(producers_df), n_policies)
+    company_idx = rng.integers(0, len(companies_df), n_policies)
+    policy_type_idx = rng.integers(0, len(policy_types_df), n_policies)
+
+    def producer(column):
+        return producers_df[column].to_numpy()[producer_idx]
+
+    def company(column):
+        return companies_df[column].to_numpy()[company_idx]
+
+    def policy_type(column):
+        return policy_types_df[column].to_numpy()[policy_type_idx]
+
+    # Premium as 70% to 180% of the policy type's average, commission at the type's rate
+    premium = (policy_type("avg_premium") * rng.uniform(0.7, 1.8, n_policies)).astype('int64')
+    commission_rate = policy_type("commission_rate")
+    commission = (premium * commission_rate).astype('int64')
+
+    # Dates at second resolution across the policy history window
+    history_seconds = POLICY_HISTORY_DAYS * 24 * 60 * 60
+    created_offset = rng.integers(0, history_seconds, n_policies).astype('timedelta64[s]')
+    created_date = (now - pd.Timedelta(days=POLICY_HISTORY_DAYS)).to_datetime64() + created_offset
+    effective_date = created_date + _days(_randint(rng, 1, 60, n_policies))
+    expiration_date = effective_date + np.timedelta64(365, 'D')
+
+    # Status by weighted sampling, with a different mix for recently created policies
+    is_recent = created_date >= (now - pd.Timedelta(days=30)).to_datetime64()
+    settled_weights = np.array(SETTLED_STATUS_WEIGHTS) / sum(SETTLED_STATUS_WEIGHTS)
+    recent_weights = np.array(RECENT_STATUS_WEIGHTS) / sum(RECENT_STATUS_WEIGHTS)
+    status = np.where(
+        is_recent,
+        rng.choice(np.array(RECENT_STATUSES, dtype=object), size=n_policies, p=recent_weights),
+        rng.choice(np.array(SETTLED_STATUSES, dtype=object), size=n_policies, p=settled_weights)
+    )
+    is_pending = status == "Pending"
+
+    policies_df = pd.DataFrame({
+        "policy_id": _sequence_ids("POL-", n_policies),
+        "producer_id": producer("id"),
+        "producer_name": producer("name"),
+        "producer_region": producer("region"),
+        "producer_tier": producer("tier"),
+        "producer_specialty": producer("specialty"),
+        "company_name": company("name"),
+        "company_industry": company("industry"),
+        "company_size": company("size"),
+        "company_revenue": company("revenue"),
+        "policy_type": policy_type("type"),
+        "carrier": _choice(rng, CARRIERS, n_policies),
+        "referral_source": _choice(rng, REFERRAL_SOURCES, n_policies),
+        "premium": premium,
+        "commission": commission,
+        "commission_rate": commission_rate,
+        "status": status,
+        "created_date": created_date.astype('datetime64[ns]'),
+        "effective_date": effective_date.astype('datetime64[ns]'),
+        "expiration_date": expiration_date.astype('datetime64[ns]'),
+        "probability": np.where(is_pending, _randint(rng, 60, 95, n_policies), 100),
+        "days_to_close": np.where(is_pending, _randint(rng, 15, 120, n_policies), 0),
+        "customer_satisfaction": _randint(rng, 3, 5, n_policies),
+        "risk_score": _randint(rng, 1, 100, n_policies),
+        "renewal_probability": np.where(status == "Active", _randint(rng, 70, 95, n_policies), 0),
+        "bind_ratio": rng.uniform(0.65, 0.95, n_policies),
+        "quote_to_bind_days": _randint(rng, 5, 45, n_policies),
+        "claims_history": _randint(rng, 0, 3, n_policies),
+        "policy_limit": rng.choice(POLICY_LIMITS, size=n_policies),
+        "deductible": rng.choice(DEDUCTIBLES, size=n_policies)
+    })
+
+    return policies_df, producers_df, companies_df
@@ -0,0 +1,118 @@
+"""Shared, read-only datasets for the Opportunities and Producer hubs.
+
+A ``SharedDataset`` is loaded once per server process (the apps hold it in
+``st.cache_resource``) and handed to every session by reference. Its frames
+are backed by read-only arrays, so an accidental in-place write raises
+instead of silently leaking into other sessions, and the sidebar filters
+select rows by index instead of copying the whole frame first.
+
+Every dataset carries a ``version``: a fingerprint fixed when the data is
+generated or loaded. Cached analytics and filter-cache keys use it in place
+of hashing frame contents, which is what Streamlit would otherwise do on
+every call.
+"""
+
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from banding import add_temperature_band
+from datagen import generate_opportunities, generate_policies, resolve_as_of
+from schema import apply_opportunity_schema, apply_policy_schema
+from snapshots import load_or_generate, snapshot_key
+
+OPPORTUNITY_FRAMES = ("opportunities", "sales_team", "companies")
+POLICY_FRAMES = ("policies", "producers", "companies")
+
+
+def freeze_frame(df):
+    """Return a frame over the same column arrays with every NumPy buffer marked read-only"""
+    columns = {}
+    for column in df.columns:
+        values = df[column].array
+        if isinstance(df[column].dtype, np.dtype):
+            values = df[column].to_numpy(copy=False)
+            values.flags.writeable = False
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+class SharedDataset:
+    """Immutable bundle of named frames shared across sessions without copying"""
+
+    def __init__(self, name, frames, version=None):
+        self.name = name
+        # Frames without a known provenance get a version no other dataset shares
+        self.version = version or f"{name}-{uuid.uuid4().hex}"
+        self._frames = {key: freeze_frame(frame) for key, frame in frames.items()}
+
+    def __getitem__(self, key):
+        return self._frames[key]
+
+    @property
+    def frame_names(self):
+        return tuple(self._frames)
+
+    def frames(self, *keys):
+        """Frames in the requested order, e.g. ``dataset.frames('opportunities', 'sales_team')``"""
+        return tuple(self._frames[key] for key in (keys or self._frames))
+
+    def nbytes(self):
+        """Shallow memory footprint of all frames"""
+        return int(sum(frame.memory_usage(deep=False, index=True).sum() for frame in self._frames.values()))
+
+
+def select_rows(frame, row_index):
+    """Select rows by position, returning ``(frame, bytes_copied)``.
+
+    When every row is selected the shared frame itself is returned and
+    nothing is copied; otherwise only the selected rows are materialized.
+    """
+    if len(row_index) == len(frame):
+        return frame, 0
+    subset = frame.take(row_index)
+    return subset, int(subset.memory_usage(deep=False, index=True).sum())
+
+
+def dataset_version(dataset, seed, n_rows, as_of=None):
+    """Fingerprint of the data generated for these parameters; the generators are deterministic, so equal inputs mean equal data"""
+    return snapshot_key(dataset, seed, n_rows, resolve_as_of(as_of))
+
+
+def _with_schema(generator, apply_schema):
+    """Wrap a generator so snapshots are written already compacted"""
+    def generate(n_rows, seed, as_of):
+        return apply_schema(*generator(n_rows, seed=seed, as_of=as_of))
+    return generate
+
+
+def load_opportunities_dataset(n_rows, seed, generator=generate_opportunities, as_of=None):
+    """Load (snapshot or generate) the opportunities dataset as a SharedDataset with the compact schema.
+
+    The categorical ``temperature_band`` column is derived here, once per
+    load, for the sidebar filter, the cube and the tabs to share.
+    """
+    frames = load_or_generate(
+        "opportunities", _with_schema(generator, apply_opportunity_schema), OPPORTUNITY_FRAMES,
+        n_rows=n_rows, seed=seed, as_of=as_of
+    )
+    opportunities_df, sales_team_df, companies_df = apply_opportunity_schema(*frames)
+    frames = (add_temperature_band(opportunities_df), sales_team_df, companies_df)
+    version = dataset_version("opportunities", seed, n_rows, as_of)
+    return SharedDataset("opportunities", dict(zip(OPPORTUNITY_FRAMES, frames)), version)
+
+
+def load_policies_dataset(n_rows, seed, generator=generate_policies, as_of=None):
+    """Load (snapshot or generate) the Producer Hub policy book as a SharedDataset with the compact schema"""
+    frames = load_or_generate(
+        "policies", _with_schema(generator, apply_policy_schema), POLICY_FRAMES,
+        n_rows=n_rows, seed=seed, as_of=as_of
+    )
+    version = dataset_version("policies", seed, n_rows, as_of)
+    return SharedDataset("policies", dict(zip(POLICY_FRAMES, apply_policy_schema(*frames))), version)
+
+
+def row_mask(n_rows):
+    """All-true mask to start a filter chain from"""
+    return np.ones(n_rows, dtype=bool)
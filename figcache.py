@@ -0,0 +1,128 @@
+"""Serialized Plotly figures cached by the data and layout they were built from.
+
+Most of the dashboard's figures are drawn from small aggregate frames that do
+not change between reruns. Rebuilding one still means a Plotly Express call,
+trace validation and JSON encoding on every rerun. ``FigureCache`` stores
+each figure's JSON keyed by a fingerprint of its aggregate frame plus the
+layout parameters, and on a hit it hands back a ``CachedFigure`` built from
+that JSON. Construction and validation are skipped, but Streamlit still
+decodes the JSON (through ``to_dict``) and encodes it again for the browser.
+
+Builders must return the finished figure: a cached figure is a snapshot, so
+later ``update_layout`` or ``add_trace`` calls on it are not drawn.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+FIGURE_CACHE_MB = float(os.environ.get("HUB_FIGURE_CACHE_MB", "32"))
+
+
+def fingerprint(*parts):
+    """Stable hex digest of frames, series, arrays, dicts and scalars
+
+    Frames are hashed by their values, index, column names and dtypes, so two
+    aggregates with equal contents share a fingerprint however they were computed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def feed(part):
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            digest.update(type(part).__name__.encode())
+            dtypes = part.dtypes.items() if isinstance(part, pd.DataFrame) else [(part.name, part.dtype)]
+            digest.update(repr([(str(name), str(dtype)) for name, dtype in dtypes]).encode())
+            try:
+                digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+            except TypeError:
+                # Unhashable cells (lists, dicts)
+                digest.update(pickle.dumps(part))
+        elif isinstance(part, np.ndarray):
+            digest.update(repr((part.dtype.str, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, dict):
+            digest.update(b"{")
+            for name in sorted(part, key=repr):
+                feed(name)
+                feed(part[name])
+            digest.update(b"}")
+        elif isinstance(part, (list, tuple)):
+            digest.update(b"[")
+            for item in part:
+                feed(item)
+            digest.update(b"]")
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"|")
+
+    for part in parts:
+        feed(part)
+    return digest.hexdigest()
+
+
+class CachedFigure(go.Figure):
+    """A figure restored from cached JSON; ``to_dict`` decodes the JSON instead of walking validated traces"""
+
+    def __init__(self, spec):
+        super().__init__()
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+    def to_plotly_json(self):
+        return self.to_dict()
+
+
+class FigureCache:
+    """Thread-safe LRU of serialized figures under a byte budget"""
+
+    def __init__(self, max_bytes=FIGURE_CACHE_MB * 1e6):
+        self.max_bytes = max_bytes
+        self._specs = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def figure(self, name, data, build, **params):
+        """Figure ``name`` drawn from ``data`` with ``params``, calling ``build()`` on a miss
+
+        ``data`` and ``params`` must cover everything ``build`` reads, titles included.
+        """
+        key = (name, fingerprint(data, params))
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+                return CachedFigure(spec)
+            self.misses += 1
+
+        fig = build()
+        spec = pio.to_json(fig, validate=False)
+        with self._lock:
+            if key not in self._specs:
+                self._specs[key] = spec
+                self.nbytes += len(spec)
+            while self.nbytes > self.max_bytes and len(self._specs) > 1:
+                _, evicted = self._specs.popitem(last=False)
+                self.nbytes -= len(evicted)
+                self.evictions += 1
+        return fig
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._specs), "bytes": self.nbytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,295 @@
+"""Bitmap index and result cache for the sidebar filters.
+
+``FilterIndex`` is built once per dataset. For every value of a categorical
+column (stage, product, priority, rep, temperature band) it keeps a packed
+bitmap of the matching rows, and for range columns (created date,
+opportunity value) it keeps the row order sorted by value. A filter
+combination is then answered with bitmap AND/OR plus ``searchsorted`` range
+lookups, and comes back as one sorted array of row positions ready for
+``dataset.select_rows``.
+
+``FilterCache`` remembers, per canonical filter state, the selected row
+positions and any tab aggregates computed from them, so toggling back to a
+recent selection skips both the filter and the groupbys.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from banding import in_range
+
+OPPORTUNITY_BITMAP_COLUMNS = ("sales_stage", "product_line", "priority", "sales_rep_name", "temperature_band")
+OPPORTUNITY_RANGE_COLUMNS = ("created_date", "opportunity_value")
+
+# Process-wide memory budget for cached filter results
+FILTER_CACHE_MB = float(os.environ.get("HUB_FILTER_CACHE_MB", "64"))
+
+# A range that keeps at most 1/CANDIDATE_FRACTION of the rows drives the query:
+# its rows are probed against the bitmaps instead of scanning whole bitmaps
+CANDIDATE_FRACTION = 8
+
+
+def _pack(mask):
+    return np.packbits(mask, bitorder="little")
+
+
+def _coerce(bound, values):
+    """Express a range bound as a scalar of the column's dtype so searchsorted never casts the column"""
+    if values.dtype.kind == "M":
+        return np.datetime64(pd.Timestamp(bound)).astype(values.dtype)
+    if values.dtype.kind in "iu":
+        limits = np.iinfo(values.dtype)
+        # Fractional or out-of-range bounds stay as they are (correct, just slower)
+        if float(bound).is_integer() and limits.min <= bound <= limits.max:
+            return values.dtype.type(bound)
+        return bound
+    return values.dtype.type(bound)
+
+
+def _bounds(sorted_values, low, high, inclusive):
+    """Slice of ``sorted_values`` inside [low, high], with pandas ``between`` inclusive semantics"""
+    left = "left" if inclusive in ("both", "left") else "right"
+    right = "right" if inclusive in ("both", "right") else "left"
+    return (
+        int(np.searchsorted(sorted_values, low, side=left)),
+        int(np.searchsorted(sorted_values, high, side=right))
+    )
+
+
+class FilterIndex:
+    """Per-value bitmaps and sorted range indexes over one read-only frame"""
+
+    def __init__(self, df, bitmap_columns=(), range_columns=()):
+        self.n_rows = len(df)
+        position_dtype = np.int32 if self.n_rows < 2 ** 31 else np.int64
+        self._all_rows = np.arange(self.n_rows, dtype=position_dtype)
+
+        # column -> {value: packed bitmap}
+        self._bitmaps = {}
+        for column in bitmap_columns:
+            categorical = pd.Categorical(df[column])
+            codes = categorical.codes
+            self._bitmaps[column] = {
+                value: _pack(codes == code) for code, value in enumerate(categorical.categories)
+            }
+
+        # column -> (row order sorted by value, sorted values, values in row order)
+        self._ranges = {}
+        for column in range_columns:
+            values = df[column].to_numpy()
+            order = np.argsort(values, kind="stable").astype(position_dtype)
+            self._ranges[column] = (order, values[order], values)
+
+    def nbytes(self):
+        """Memory held by the bitmaps and sorted indexes"""
+        bitmaps = sum(bitmap.nbytes for values in self._bitmaps.values() for bitmap in values.values())
+        ranges = sum(order.nbytes + sorted_values.nbytes for order, sorted_values, _ in self._ranges.values())
+        return int(bitmaps + ranges + self._all_rows.nbytes)
+
+    def _isin_bitmap(self, column, selected):
+        """Packed bitmap of rows whose value is in ``selected``, or None if that keeps every row"""
+        bitmaps = self._bitmaps[column]
+        selected = set(selected)
+        chosen = [bitmap for value, bitmap in bitmaps.items() if value in selected]
+        if len(chosen) == len(bitmaps):
+            return None
+        if not chosen:
+            return np.zeros_like(next(iter(bitmaps.values())))
+
+        result = chosen[0].copy()
+        for bitmap in chosen[1:]:
+            np.bitwise_or(result, bitmap, out=result)
+        return result
+
+    def select(self, isin=None, between=None):
+        """Sorted row positions matching every filter.
+
+        ``isin`` maps a bitmap column or band column to the values/labels to
+        keep; ``between`` maps a range column to ``(low, high)`` or
+        ``(low, high, inclusive)`` where ``inclusive`` is one of "both",
+        "left", "right", "neither" as in ``Series.between``.
+        """
+        bitmaps = []
+        for column, selected in (isin or {}).items():
+            bitmap = self._isin_bitmap(column, selected)
+            if bitmap is not None:
+                bitmaps.append(bitmap)
+
+        ranges = []
+        for column, spec in (between or {}).items():
+            low, high, inclusive = spec if len(spec) == 3 else (*spec, "both")
+            order, sorted_values, values = self._ranges[column]
+            low, high = _coerce(low, values), _coerce(high, values)
+            start, stop = _bounds(sorted_values, low, high, inclusive)
+            if stop - start < self.n_rows:
+                ranges.append((stop - start, column, start, stop, low, high, inclusive))
+
+        if not bitmaps and not ranges:
+            return self._all_rows
+
+        ranges.sort(key=lambda entry: entry[0])
+        if ranges and ranges[0][0] * CANDIDATE_FRACTION <= self.n_rows:
+            return self._probe(ranges, bitmaps)
+        return self._scan(ranges, bitmaps)
+
+    def _probe(self, ranges, bitmaps):
+        """Narrow range first: test only its rows against the bitmaps and the other ranges"""
+        _, column, start, stop, *_ = ranges[0]
+        rows = np.sort(self._ranges[column][0][start:stop])
+        keep = np.ones(len(rows), dtype=bool)
+        byte, bit = rows >> 3, (rows & 7).astype(np.uint8)
+        for bitmap in bitmaps:
+            keep &= ((bitmap[byte] >> bit) & 1).astype(bool)
+        for _, column, _, _, low, high, inclusive in ranges[1:]:
+            keep &= in_range(self._ranges[column][2][rows], low, high, inclusive)
+        return rows[keep]
+
+    def _scan(self, ranges, bitmaps):
+        """AND the bitmaps, then clear the rows that fall outside each range"""
+        if bitmaps:
+            combined = bitmaps[0].copy()
+            for bitmap in bitmaps[1:]:
+                np.bitwise_and(combined, bitmap, out=combined)
+            keep = np.unpackbits(combined, count=self.n_rows, bitorder="little").view(bool)
+        else:
+            keep = np.ones(self.n_rows, dtype=bool)
+
+        for _, column, start, stop, *_ in ranges:
+            order = self._ranges[column][0]
+            keep[order[:start]] = False
+            keep[order[stop:]] = False
+        return np.flatnonzero(keep).astype(self._all_rows.dtype, copy=False)
+
+
+def opportunity_filter_index(opportunities_df):
+    """FilterIndex over the sidebar filter columns of the opportunities fact table"""
+    return FilterIndex(
+        opportunities_df,
+        bitmap_columns=OPPORTUNITY_BITMAP_COLUMNS,
+        range_columns=OPPORTUNITY_RANGE_COLUMNS
+    )
+
+
+def filter_state_key(dataset, **state):
+    """Canonical hash of a sidebar filter state over one dataset version (``SharedDataset.version``).
+
+    Lists and sets are treated as selections (order does not matter), tuples
+    as ordered ranges; dates and NumPy scalars are normalized so equivalent
+    states from different widgets hash the same.
+    """
+    def normalize(value):
+        if isinstance(value, (list, set, frozenset)):
+            return sorted((normalize(item) for item in value), key=repr)
+        if isinstance(value, tuple):
+            return [normalize(item) for item in value]
+        if isinstance(value, (pd.Timestamp, date)):
+            return pd.Timestamp(value).isoformat()
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    payload = json.dumps([dataset, {name: normalize(value) for name, value in state.items()}], sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    # Tab summaries are dicts (or tuples) of frames and scalars
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value.values())
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _shared(value):
+    """Hand out cached frames as shallow copies; arrays are already read-only"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
+
+
+class FilterCache:
+    """Thread-safe LRU of filter results (row positions plus named aggregates) under a byte budget"""
+
+    def __init__(self, max_bytes=FILTER_CACHE_MB * 1e6):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def _entry(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, name, value):
+        entry = self._entries.setdefault(key, {"values": {}, "nbytes": 0})
+        self._entries.move_to_end(key)
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        size = _nbytes(value)
+        previous = _nbytes(entry["values"][name]) if name in entry["values"] else 0
+        entry["values"][name] = value
+        entry["nbytes"] += size - previous
+        self.nbytes += size - previous
+        # Evict least recently used states, never the one being filled
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted["nbytes"]
+            self.evictions += 1
+
+    def get(self, key, name, compute):
+        """Cached ``name`` for filter state ``key``, calling ``compute()`` on a miss.
+
+        DataFrames and Series come back as shallow copies, so callers may
+        rename or add columns without touching the cached value; arrays are
+        stored read-only.
+        """
+        with self._lock:
+            entry = self._entry(key)
+            if entry is not None and name in entry["values"]:
+                self.hits += 1
+                return _shared(entry["values"][name])
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._store(key, name, value)
+        return _shared(value)
+
+    def cached(self, key, name):
+        """Whether ``name`` is already cached for filter state ``key``, without counting a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and name in entry["values"]
+
+    def rows(self, key, compute):
+        """Cached row positions for filter state ``key``"""
+        return self.get(key, "rows", compute)
+
+    def scope(self, key):
+        """Bind ``key`` so tabs can call ``aggregates(name, compute)``"""
+        return lambda name, compute: self.get(key, name, compute)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries), "bytes": self.nbytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions
+            }
@@ -0,0 +1,206 @@
+"""Scenario revenue forecasts for the Revenue Forecasting tab.
+
+Each opportunity gets one weight per scenario (Conservative, Realistic,
+Optimistic) and one period bucket from its expected close date, both as
+array operations. The per-period series are then weighted ``bincount``s over
+the bucket numbers, so a forecast costs a single pass over the rows whatever
+the horizon.
+
+``simulate_forecast`` replaces the fixed scenario multipliers with a Monte
+Carlo run over the open opportunities: every trial samples win/loss from a
+probability column and a close-date slippage for each deal, a block of trials
+at a time as one matrix, and the per-period revenue percentiles of all trials
+become the P10/P50/P90 bands. Each scenario's odds are the share of trials
+whose horizon revenue reaches that scenario's total over the same horizon.
+Chunks of trials run across a process pool when the work is large enough to
+pay for it. The pool is created once per process with a ``forkserver`` (or
+``spawn``) context: forking the multi-threaded Streamlit server could copy a
+lock some other thread holds and deadlock the child.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+SCENARIOS = ("Conservative", "Realistic", "Optimistic")
+
+# Forecast granularity -> (period length in days, label format of the period start)
+PERIODS = {
+    "Weeks": (7, "%Y-%m-%d"),
+    "Months": (30, "%Y-%m"),
+    "Quarters": (91, "%Y-%m")
+}
+MAX_PERIODS = 36
+
+# Simulation probability sources -> scale of the column (win_probability_ai is a percentage)
+PROBABILITY_SCALES = {"win_probability_ai": 100.0, "stage_probability": 1.0}
+CLOSED_STAGES = ("Closed Won", "Closed Lost")
+PERCENTILES = (10, 50, 90)
+
+# Trials per pool task, and random draws per matrix block inside a task
+SIMULATION_CHUNK_TRIALS = 2500
+SIMULATION_BLOCK_DRAWS = 1 << 18
+# Below this many draws the run stays in-process: starting workers would cost more than it saves
+PARALLEL_MIN_DRAWS = 50_000_000
+FORECAST_WORKERS = int(os.environ.get("HUB_FORECAST_WORKERS", str(os.cpu_count() or 1)))
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def scenario_weights(df):
+    """Per-opportunity contribution to each scenario.
+
+    Conservative: high-probability deals (win probability 80+) at 70% of value.
+    Realistic: weighted value of moderate+ deals (win probability 60+).
+    Optimistic: full weighted pipeline with 20% upside.
+    """
+    value = df['opportunity_value'].to_numpy(dtype=np.float64)
+    weighted = df['weighted_value'].to_numpy(dtype=np.float64)
+    win_probability = df['win_probability_ai'].to_numpy()
+    return {
+        "Conservative": np.where(win_probability >= 80, value * 0.7, 0.0),
+        "Realistic": np.where(win_probability >= 60, weighted, 0.0),
+        "Optimistic": weighted * 1.2
+    }
+
+
+def scenario_totals(df):
+    """Whole-portfolio total for each scenario"""
+    return {scenario: float(weights.sum()) for scenario, weights in scenario_weights(df).items()}
+
+
+def period_buckets(close_dates, start, periods, period_days):
+    """Bucket number of every close date in ``periods`` windows of ``period_days`` from ``start``, or -1 outside"""
+    close_dates = np.asarray(close_dates, dtype="datetime64[ns]")
+    step = np.timedelta64(period_days, "D").astype("timedelta64[ns]")
+    offsets = close_dates - np.datetime64(pd.Timestamp(start).as_unit("ns"))
+    buckets = np.full(len(close_dates), -1, dtype=np.int64)
+    known = ~np.isnat(close_dates)
+    buckets[known] = offsets[known] // step
+    buckets[(buckets < 0) | (buckets >= periods)] = -1
+    return buckets
+
+
+def period_labels(start, periods, period):
+    """Label of every period start, formatted per ``PERIODS``"""
+    period_days, label_format = PERIODS[period]
+    return [(start + pd.Timedelta(days=period_days * i)).strftime(label_format) for i in range(periods)]
+
+
+def _check_periods(periods):
+    if not 1 <= periods <= MAX_PERIODS:
+        raise ValueError(f"periods must be between 1 and {MAX_PERIODS}, got {periods}")
+
+
+def bucketed_forecast(df, periods=12, period="Months", start=None):
+    """Conservative/Realistic/Optimistic revenue per period, one row per period.
+
+    Periods are fixed-length windows (see ``PERIODS``) starting at ``start``
+    (default: now); opportunities closing outside the horizon are ignored.
+    """
+    _check_periods(periods)
+    period_days = PERIODS[period][0]
+    start = pd.Timestamp(start if start is not None else datetime.now())
+
+    buckets = period_buckets(df['expected_close_date'].to_numpy(), start, periods, period_days)
+    inside = buckets >= 0
+    buckets = buckets[inside]
+
+    forecast = {'Period': period_labels(start, periods, period)}
+    for scenario, weights in scenario_weights(df).items():
+        forecast[scenario] = np.bincount(buckets, weights=weights[inside], minlength=periods)
+    return pd.DataFrame(forecast)
+
+
+def simulation_pool(workers):
+    """The process's long-lived simulation pool of ``workers`` processes, started on first use"""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            pool = _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method))
+        return pool
+
+
+def _simulate_chunk(task):
+    """Revenue per (trial, period) for one chunk of trials; runs in a pool worker"""
+    seed, trials, values, probabilities, offsets, periods, slip_periods = task
+    rng = np.random.default_rng(seed)
+    # Column ``periods`` collects lost deals and deals that slip past the horizon
+    revenue = np.zeros(trials * (periods + 1))
+    rows = (np.arange(trials) * (periods + 1))[:, None]
+    block = max(1, SIMULATION_BLOCK_DRAWS // trials)
+    for first in range(0, len(values), block):
+        deals = slice(first, first + block)
+        p = probabilities[deals]
+        draws = rng.random((trials, len(p)), dtype=np.float32)
+        won = draws < p
+        landing = np.broadcast_to(offsets[deals], draws.shape)
+        if slip_periods > 0:
+            # Given a win, draws / p is again uniform on [0, 1), so it doubles as the slippage draw;
+            # capping it just below 1 keeps the losers' slippage finite
+            uniform = np.minimum(draws / p, np.float32(1 - 2 ** -24))
+            landing = landing - np.float32(slip_periods) * np.log1p(-uniform)
+        buckets = np.where(won, np.minimum(landing, periods).astype(np.int32), periods)
+        weights = np.broadcast_to(values[deals], draws.shape)
+        revenue += np.bincount((rows + buckets).ravel(), weights=weights.ravel(), minlength=revenue.size)
+    return revenue.reshape(trials, periods + 1)[:, :periods]
+
+
+def simulate_forecast(df, periods=12, period="Months", start=None, trials=10000,
+                      probability_column="win_probability_ai", slip_days=14, seed=None, workers=None):
+    """Monte Carlo revenue bands for the open opportunities.
+
+    Each trial wins a deal with its ``probability_column`` probability and,
+    if won, books its full value after an exponentially distributed slippage
+    (mean ``slip_days``) past the expected close date. Returns ``(bands,
+    horizon, odds)``: a frame of P10/P50/P90 revenue per period, a Series of
+    the same percentiles for total revenue over the horizon, and a frame
+    indexed by scenario with the scenario's ``Total`` over the horizon (as
+    ``bucketed_forecast`` sums it) and the ``Probability`` that a trial's
+    horizon revenue reaches it. Deals expected to close before ``start`` stay
+    out, as in ``bucketed_forecast``.
+    """
+    _check_periods(periods)
+    period_days = PERIODS[period][0]
+    start = pd.Timestamp(start if start is not None else datetime.now())
+    workers = workers or FORECAST_WORKERS
+
+    open_deals = ~df['sales_stage'].isin(CLOSED_STAGES).to_numpy()
+    close_dates = df['expected_close_date'].to_numpy()
+    inside = period_buckets(close_dates, start, periods, period_days) >= 0
+    probabilities = df[probability_column].to_numpy(dtype=np.float32) / PROBABILITY_SCALES[probability_column]
+    deals = open_deals & inside & (probabilities > 0)
+
+    step = np.timedelta64(period_days, "D").astype("timedelta64[ns]")
+    offsets = ((close_dates[deals] - np.datetime64(start.as_unit("ns"))) / step).astype(np.float32)
+    values = df['opportunity_value'].to_numpy(dtype=np.float64)[deals]
+    probabilities = probabilities[deals]
+
+    sizes = [min(SIMULATION_CHUNK_TRIALS, trials - first) for first in range(0, trials, SIMULATION_CHUNK_TRIALS)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(chunk_seed, size, values, probabilities, offsets, periods, slip_days / period_days)
+             for chunk_seed, size in zip(seeds, sizes)]
+    if workers > 1 and len(tasks) > 1 and trials * len(values) >= PARALLEL_MIN_DRAWS:
+        revenue = np.vstack(list(simulation_pool(workers).map(_simulate_chunk, tasks)))
+    else:
+        revenue = np.vstack([_simulate_chunk(task) for task in tasks])
+
+    names = [f"P{percentile}" for percentile in PERCENTILES]
+    bands = pd.DataFrame(np.percentile(revenue, PERCENTILES, axis=0).T, columns=names)
+    bands.insert(0, 'Period', period_labels(start, periods, period))
+    totals = revenue.sum(axis=1)
+    horizon = pd.Series(np.percentile(totals, PERCENTILES), index=names)
+
+    targets = np.array([weights[inside].sum() for weights in scenario_weights(df).values()])
+    odds = pd.DataFrame({
+        'Total': targets,
+        'Probability': (totals[:, None] >= targets).mean(axis=0)
+    }, index=pd.Index(SCENARIOS, name='Scenario'))
+    return bands, horizon, odds
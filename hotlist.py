@@ -0,0 +1,131 @@
+"""Maintained top-K indexes for the Hot Opportunities tab.
+
+A ``RankedIndex`` keeps the row positions that qualify for a list (hot
+deals, critical hot deals) pre-sorted by a key, largest first with ties in
+row order. The tab asks it for one page of the best rows under the current
+sidebar filter: it walks the ranking in growing blocks and keeps the rows
+whose positions are in the filter's sorted row index, so a page near the top
+costs a few binary searches instead of copying and sorting every hot row.
+
+Changed opportunities are applied with ``update``: their old entries are
+dropped and the new ones are inserted at their ranks, without re-sorting the
+rest. Readers see either the old or the new ranking, never a mix.
+"""
+
+import threading
+
+import numpy as np
+
+from banding import HOT_BAND, TEMPERATURE_BANDS, in_range
+
+# Hot list ranks by temperature, critical hot list by deal value
+HOT_KEY = "temperature_score"
+CRITICAL_KEY = "opportunity_value"
+CRITICAL_PRIORITY = "Critical"
+
+# Rows scanned by the first block of a filtered page lookup, as a multiple of the rows wanted
+FIRST_BLOCK_FACTOR = 4
+MIN_BLOCK = 256
+
+
+def _contains(sorted_rows, positions):
+    """Which ``positions`` appear in the sorted array ``sorted_rows``"""
+    if len(sorted_rows) == 0:
+        return np.zeros(len(positions), dtype=bool)
+    found = np.searchsorted(sorted_rows, positions)
+    np.minimum(found, len(sorted_rows) - 1, out=found)
+    return sorted_rows[found] == positions
+
+
+def _ranked(positions, keys):
+    """Positions and keys ordered by key descending, then position ascending"""
+    order = np.lexsort((positions, -keys))
+    return positions[order], keys[order]
+
+
+class RankedIndex:
+    """Qualifying row positions sorted by a key, largest first, ties in row order"""
+
+    def __init__(self, positions, keys):
+        positions, keys = _ranked(np.asarray(positions, dtype=np.int64), np.asarray(keys, dtype=np.float64))
+        # One tuple so a reader never pairs positions from one version with keys from another
+        self._state = (positions, keys)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._state[0])
+
+    @property
+    def positions(self):
+        return self._state[0]
+
+    def count(self, row_index=None):
+        """Number of ranked rows inside the filter's sorted row positions (all of them for None)"""
+        positions = self._state[0]
+        if row_index is None:
+            return len(positions)
+        return int(_contains(row_index, positions).sum())
+
+    def top(self, n, row_index=None, offset=0):
+        """Positions ranked ``offset`` to ``offset + n`` among the rows inside ``row_index``"""
+        positions = self._state[0]
+        wanted = offset + n
+        if row_index is None:
+            return positions[offset:wanted]
+
+        hits, found = [], 0
+        start, block = 0, max(MIN_BLOCK, wanted * FIRST_BLOCK_FACTOR)
+        while start < len(positions) and found < wanted:
+            candidates = positions[start:start + block]
+            inside = candidates[_contains(row_index, candidates)]
+            hits.append(inside)
+            found += len(inside)
+            start += block
+            block *= FIRST_BLOCK_FACTOR
+        if not hits:
+            return positions[:0]
+        return np.concatenate(hits)[offset:wanted]
+
+    def update(self, positions, keys, qualifies):
+        """Re-rank changed rows: drop their old entries, insert the ones that still qualify"""
+        positions = np.asarray(positions, dtype=np.int64)
+        keys = np.asarray(keys, dtype=np.float64)
+        qualifies = np.asarray(qualifies, dtype=bool)
+        with self._lock:
+            current, current_keys = self._state
+            keep = ~np.isin(current, positions)
+            current, current_keys = current[keep], current_keys[keep]
+
+            new_positions, new_keys = _ranked(positions[qualifies], keys[qualifies])
+            descending = -current_keys
+            at = np.searchsorted(descending, -new_keys, side="left")
+            ties = np.searchsorted(descending, -new_keys, side="right") - at
+            # Equal keys are ordered by position; those runs are short, so place them one by one
+            for i in np.flatnonzero(ties):
+                at[i] += np.searchsorted(current[at[i]:at[i] + ties[i]], new_positions[i])
+            self._state = (np.insert(current, at, new_positions), np.insert(current_keys, at, new_keys))
+
+
+class HotIndex:
+    """Ranked hot (temperature 80+) and critical hot opportunity lists over one opportunities frame"""
+
+    def __init__(self, df):
+        positions = np.arange(len(df))
+        hot, critical = self._qualifies(df['temperature_score'], df['priority'])
+        self.hot = RankedIndex(positions[hot], df[HOT_KEY].to_numpy()[hot])
+        self.critical = RankedIndex(positions[critical], df[CRITICAL_KEY].to_numpy()[critical])
+
+    @staticmethod
+    def _qualifies(temperature_scores, priorities):
+        hot = in_range(np.asarray(temperature_scores), *TEMPERATURE_BANDS[HOT_BAND])
+        return hot, hot & np.asarray(priorities == CRITICAL_PRIORITY)
+
+    def update(self, positions, temperature_scores, opportunity_values, priorities):
+        """Apply changed (or appended) opportunities, given their row positions and new values"""
+        hot, critical = self._qualifies(temperature_scores, priorities)
+        self.hot.update(positions, temperature_scores, hot)
+        self.critical.update(positions, opportunity_values, critical)
+
+
+def hot_opportunity_index(opportunities_df):
+    return HotIndex(opportunities_df)
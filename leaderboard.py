@@ -0,0 +1,68 @@
+"""Success Pattern Leaderboard scoring.
+
+Every rep's activity, response, access and win scores are column operations
+over the rep profiles (``schema.rep_profiles``), and the pattern score is
+their weighted mean, so scoring a whole org is a handful of vector ops and
+the top N comes from a partition rather than a full sort.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Pattern score component -> default weight (equal weights give the plain mean)
+PATTERN_WEIGHTS = {"activity": 1.0, "response": 1.0, "access": 1.0, "win": 1.0}
+
+# Leaderboard field -> rep profile column
+LEADERBOARD_COLUMNS = {
+    "tier": "sales_rep_tier",
+    "activities": "rep_avg_activities_per_week",
+    "response_time": "rep_avg_response_time_hours",
+    "deal_size": "rep_avg_deal_size",
+    "win_rate": "rep_proposal_win_rate",
+    "client_satisfaction": "rep_client_satisfaction"
+}
+
+
+def pattern_scores(profiles, weights=PATTERN_WEIGHTS):
+    """Per-rep ``<component>_score`` columns (0-100) and their weighted mean as ``pattern_score``"""
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("pattern score weights must add up to more than zero")
+    scores = pd.DataFrame({
+        # 35 activities a week or more scores full marks
+        "activity_score": np.minimum(100, profiles['rep_avg_activities_per_week'] / 35 * 100),
+        # Every hour of average response time costs 10 points
+        "response_score": np.maximum(0, 100 - profiles['rep_avg_response_time_hours'] * 10),
+        "access_score": profiles['rep_decision_maker_access_rate'] * 100,
+        "win_score": profiles['rep_proposal_win_rate'] * 100
+    }, index=profiles.index)
+    weighted = sum(scores[f"{component}_score"] * weight for component, weight in weights.items())
+    scores["pattern_score"] = weighted / total
+    return scores
+
+
+def leaderboard(profiles, top_n=8, weights=PATTERN_WEIGHTS, reps=None):
+    """Top ``top_n`` reps by pattern score, best first, with their leaderboard fields.
+
+    ``reps`` restricts the board to those names (e.g. reps with opportunities);
+    ties keep profile order.
+    """
+    if reps is not None:
+        profiles = profiles[profiles.index.isin(list(reps))]
+    scores = pattern_scores(profiles, weights)['pattern_score'].to_numpy()
+    top = _top_positions(scores, top_n)
+    board = profiles.iloc[top][list(LEADERBOARD_COLUMNS.values())]
+    board.columns = list(LEADERBOARD_COLUMNS)
+    board.insert(1, "pattern_score", scores[top])
+    board.index.name = "name"
+    return board
+
+
+def _top_positions(values, top_n):
+    """Positions of the ``top_n`` largest values, largest first, earlier positions winning ties"""
+    if top_n >= len(values):
+        return np.argsort(-values, kind="stable")
+    # Partition for the n-th largest value, then stable-sort only the candidates at or above it
+    threshold = np.partition(values, len(values) - top_n)[len(values) - top_n]
+    candidates = np.flatnonzero(values >= threshold)
+    return candidates[np.argsort(-values[candidates], kind="stable")][:top_n]
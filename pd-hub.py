@@ -5,9 +5,21 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
-import random
-from faker import Faker
 import json
+import os
+import uuid
+from datagen import generate_policies
+from dataset import load_policies_dataset, row_mask, select_rows
+from figcache import FigureCache
+from filters import FilterCache, filter_state_key
+from cube import Rollup, policy_cube
+from scheduling import TAB_MODE, TabPrewarmer, tab_options, visible
+from profiling import CPROFILE_KEY, PROFILE_KEY, RerunProfiler, instrument, profiling_requested
+from chartdata import render_mode
+from analytics import (
+    RADAR_AXES, performance_chart_data, performance_summary, policy_intelligence_summary, policy_overview,
+    producer_overview, producer_scorecard, top_performer_summary
+)
 
 # Page configuration
 st.set_page_config(
@@ -17,6 +29,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Chart and table serialization show up as nested spans when a rerun is profiled
+instrument(st, "plotly_chart")
+instrument(st, "dataframe")
+
 # Custom CSS for ultra-modern styling
 st.markdown("""
 <style>
@@ -78,173 +94,53 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize Faker for realistic data
-fake = Faker()
-Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
+# Dark theme, injected by the theme toggle fragment while dark mode is on
+DARK_MODE_CSS = """
+<style>
+    .stApp {
+        background: linear-gradient(135deg, #232526 0%, #414345 100%);
+        color: white;
+    }
+</style>
+"""
 
-@st.cache_data
-def generate_comprehensive_data():
-    """Generate comprehensive mock data for insurance producers"""
-    
-    # Producer data with realistic profiles
-    producers = [
-        {"id": 1, "name": "Sarah Chen", "email": "sarah.chen@nexusinsure.com", "phone": "(555) 123-4567", 
-         "region": "West Coast", "hire_date": "2020-03-15", "tier": "Elite", "specialty": "Commercial Property"},
-        {"id": 2, "name": "Marcus Rodriguez", "email": "marcus.r@nexusinsure.com", "phone": "(555) 234-5678", 
-         "region": "Southwest", "hire_date": "2019-07-22", "tier": "Elite", "specialty": "Cyber Security"},
-        {"id": 3, "name": "Elena Volkov", "email": "elena.v@nexusinsure.com", "phone": "(555) 345-6789", 
-         "region": "Northeast", "hire_date": "2018-01-10", "tier": "Elite", "specialty": "Professional Liability"},
-        {"id": 4, "name": "James Kim", "email": "james.kim@nexusinsure.com", "phone": "(555) 456-7890", 
-         "region": "Southeast", "hire_date": "2021-05-03", "tier": "Platinum", "specialty": "General Liability"},
-        {"id": 5, "name": "Isabella Foster", "email": "isabella.f@nexusinsure.com", "phone": "(555) 567-8901", 
-         "region": "Midwest", "hire_date": "2020-09-18", "tier": "Elite", "specialty": "Directors & Officers"},
-        {"id": 6, "name": "David Park", "email": "david.park@nexusinsure.com", "phone": "(555) 678-9012", 
-         "region": "West Coast", "hire_date": "2022-02-14", "tier": "Gold", "specialty": "Workers Compensation"},
-        {"id": 7, "name": "Zoe Williams", "email": "zoe.w@nexusinsure.com", "phone": "(555) 789-0123", 
-         "region": "Northeast", "hire_date": "2017-11-30", "tier": "Elite", "specialty": "Commercial Property"},
-        {"id": 8, "name": "Ahmed Hassan", "email": "ahmed.h@nexusinsure.com", "phone": "(555) 890-1234", 
-         "region": "Southeast", "hire_date": "2019-04-12", "tier": "Elite", "specialty": "Cyber Security"},
-        {"id": 9, "name": "Sophie Turner", "email": "sophie.t@nexusinsure.com", "phone": "(555) 901-2345", 
-         "region": "Midwest", "hire_date": "2021-08-07", "tier": "Platinum", "specialty": "Professional Liability"},
-        {"id": 10, "name": "Ryan O'Connor", "email": "ryan.o@nexusinsure.com", "phone": "(555) 012-3456", 
-         "region": "West Coast", "hire_date": "2020-12-01", "tier": "Gold", "specialty": "General Liability"}
-    ]
-    
-    # Modern company names and details
-    companies = [
-        {"name": "TechNova Solutions", "industry": "Technology", "size": "Enterprise", "revenue": 50000000},
-        {"name": "Quantum Dynamics Corp", "industry": "Manufacturing", "size": "Fortune 500", "revenue": 200000000},
-        {"name": "Stellar Manufacturing", "industry": "Manufacturing", "size": "Mid-Market", "revenue": 25000000},
-        {"name": "EcoFlow Industries", "industry": "Energy", "size": "Enterprise", "revenue": 75000000},
-        {"name": "CyberShield Security", "industry": "Technology", "size": "Mid-Market", "revenue": 30000000},
-        {"name": "NextGen Robotics", "industry": "Technology", "size": "Startup", "revenue": 5000000},
-        {"name": "BioTech Innovations", "industry": "Healthcare", "size": "Enterprise", "revenue": 100000000},
-        {"name": "CloudFirst Systems", "industry": "Technology", "size": "Mid-Market", "revenue": 20000000},
-        {"name": "DataStream Analytics", "industry": "Technology", "size": "Small Business", "revenue": 8000000},
-        {"name": "GreenTech Ventures", "industry": "Energy", "size": "Mid-Market", "revenue": 35000000},
-        {"name": "Digital Frontier Inc", "industry": "Technology", "size": "Enterprise", "revenue": 60000000},
-        {"name": "SmartGrid Technologies", "industry": "Energy", "size": "Enterprise", "revenue": 80000000},
-        {"name": "FusionPoint Energy", "industry": "Energy", "size": "Fortune 500", "revenue": 300000000},
-        {"name": "NanoTech Materials", "industry": "Manufacturing", "size": "Mid-Market", "revenue": 40000000},
-        {"name": "AeroSpace Dynamics", "industry": "Aerospace", "size": "Enterprise", "revenue": 120000000},
-        {"name": "PharmaCore Research", "industry": "Healthcare", "size": "Enterprise", "revenue": 90000000},
-        {"name": "AgriTech Solutions", "industry": "Agriculture", "size": "Mid-Market", "revenue": 22000000},
-        {"name": "MetaVerse Industries", "industry": "Technology", "size": "Startup", "revenue": 12000000},
-        {"name": "BlockChain Systems", "industry": "Technology", "size": "Mid-Market", "revenue": 28000000},
-        {"name": "AI-Powered Logistics", "industry": "Logistics", "size": "Enterprise", "revenue": 65000000}
-    ]
-    
-    # Insurance carriers
-    carriers = [
-        "AIG", "Zurich", "Liberty Mutual", "Travelers", "Hartford", "Chubb", "Allianz", "Marsh", 
-        "Willis Towers Watson", "Aon", "Berkshire Hathaway", "CNA", "Nationwide", "Progressive Commercial",
-        "State Farm Commercial", "Allstate Commercial", "USAA", "Farmers Commercial", "MetLife", "Prudential"
-    ]
-    
-    # Policy types and details
-    policy_types = [
-        {"type": "Commercial Property", "avg_premium": 45000, "commission_rate": 0.12},
-        {"type": "General Liability", "avg_premium": 25000, "commission_rate": 0.10},
-        {"type": "Cyber Security", "avg_premium": 35000, "commission_rate": 0.15},
-        {"type": "Workers Compensation", "avg_premium": 30000, "commission_rate": 0.08},
-        {"type": "Professional Liability", "avg_premium": 40000, "commission_rate": 0.14},
-        {"type": "Directors & Officers", "avg_premium": 60000, "commission_rate": 0.16},
-        {"type": "Employment Practices", "avg_premium": 28000, "commission_rate": 0.11},
-        {"type": "Commercial Auto", "avg_premium": 20000, "commission_rate": 0.09},
-        {"type": "Umbrella Policy", "avg_premium": 15000, "commission_rate": 0.13},
-        {"type": "Product Liability", "avg_premium": 50000, "commission_rate": 0.17}
-    ]
-    
-    # Referral sources
-    referral_sources = [
-        "LinkedIn", "Industry Conference", "Client Referral", "Broker Network", "Cold Outreach", 
-        "Trade Association", "Chamber of Commerce", "Online Lead", "Partner Referral", "Renewal"
-    ]
-    
-    # Generate comprehensive policy data
-    policies = []
-    for i in range(2000):  # Generate 2000 policies for rich data
-        producer = random.choice(producers)
-        company = random.choice(companies)
-        policy_type = random.choice(policy_types)
-        carrier = random.choice(carriers)
-        referral = random.choice(referral_sources)
-        
-        # Create realistic premium variations
-        base_premium = policy_type["avg_premium"]
-        premium_variation = random.uniform(0.7, 1.8)  # 70% to 180% of base
-        premium = int(base_premium * premium_variation)
-        
-        # Calculate commission
-        commission = int(premium * policy_type["commission_rate"])
-        
-        # Generate dates
-        created_date = fake.date_time_between(start_date='-2y', end_date='now')
-        effective_date = created_date + timedelta(days=random.randint(1, 60))
-        expiration_date = effective_date + timedelta(days=365)
-        
-        # Status logic
-        if created_date < datetime.now() - timedelta(days=30):
-            status = random.choices(
-                ["Active", "Expired", "Cancelled", "Renewed"], 
-                weights=[60, 15, 10, 15]
-            )[0]
-        else:
-            status = random.choices(
-                ["Active", "Pending", "Quoted"], 
-                weights=[40, 35, 25]
-            )[0]
-        
-        policy = {
-            "policy_id": f"POL-{i+1:06d}",
-            "producer_id": producer["id"],
-            "producer_name": producer["name"],
-            "producer_region": producer["region"],
-            "producer_tier": producer["tier"],
-            "producer_specialty": producer["specialty"],
-            "company_name": company["name"],
-            "company_industry": company["industry"],
-            "company_size": company["size"],
-            "company_revenue": company["revenue"],
-            "policy_type": policy_type["type"],
-            "carrier": carrier,
-            "referral_source": referral,
-            "premium": premium,
-            "commission": commission,
-            "commission_rate": policy_type["commission_rate"],
-            "status": status,
-            "created_date": created_date,
-            "effective_date": effective_date,
-            "expiration_date": expiration_date,
-            "probability": random.randint(60, 95) if status == "Pending" else 100,
-            "days_to_close": random.randint(15, 120) if status == "Pending" else 0,
-            "customer_satisfaction": random.randint(3, 5),
-            "risk_score": random.randint(1, 100),
-            "renewal_probability": random.randint(70, 95) if status == "Active" else 0,
-            "bind_ratio": random.uniform(0.65, 0.95),
-            "quote_to_bind_days": random.randint(5, 45),
-            "claims_history": random.randint(0, 3),
-            "policy_limit": random.choice([1000000, 2000000, 5000000, 10000000]),
-            "deductible": random.choice([1000, 2500, 5000, 10000, 25000])
-        }
-        
-        policies.append(policy)
-    
-    return pd.DataFrame(policies), pd.DataFrame(producers), pd.DataFrame(companies)
+# Book size and seed; raise PDHUB_ROWS to load-test with millions of policies
+POLICY_ROWS = int(os.environ.get("PDHUB_ROWS", "2000"))
+DATA_SEED = 42
+
+def generate_comprehensive_data(n_policies=POLICY_ROWS, seed=DATA_SEED, as_of=None):
+    """Generate comprehensive mock data for insurance producers
 
-# Load data
-@st.cache_data
+    Builds the policies table in one batch from NumPy arrays (see datagen.generate_policies);
+    pass a larger n_policies or set PDHUB_ROWS to load-test with a multi-million-policy book.
+    """
+    return generate_policies(n_policies=n_policies, seed=seed, as_of=as_of)
+
+# Load data once per process; every session reads the same read-only frames
+@st.cache_resource
 def load_data():
-    policies_df, producers_df, companies_df = generate_comprehensive_data()
-    
-    # Ensure datetime columns are properly formatted
-    policies_df['created_date'] = pd.to_datetime(policies_df['created_date'])
-    policies_df['effective_date'] = pd.to_datetime(policies_df['effective_date'])
-    policies_df['expiration_date'] = pd.to_datetime(policies_df['expiration_date'])
-    
-    return policies_df, producers_df, companies_df
+    # Reuses the on-disk snapshot from an earlier process instead of regenerating
+    return load_policies_dataset(POLICY_ROWS, DATA_SEED, generator=generate_comprehensive_data)
+
+@st.cache_resource
+def load_policy_cube():
+    # Counts and sums per producer/type/status/region/carrier/month, built once per process
+    return policy_cube(load_data()['policies'])
+
+@st.cache_resource
+def load_filter_cache():
+    # Filter results and tab aggregates shared by every session, least recently used evicted first
+    return FilterCache()
+
+@st.cache_resource
+def load_figure_cache():
+    # Serialized chart JSON shared by every session, keyed by each chart's aggregate and layout
+    return FigureCache()
+
+@st.cache_resource
+def load_tab_prewarmer():
+    # Background pool that computes hidden tabs' summaries (HUB_TAB_MODE=prewarm)
+    return TabPrewarmer()
 
 # Theme toggle
 if 'dark_mode' not in st.session_state:
@@ -253,10 +149,24 @@ if 'dark_mode' not in st.session_state:
 def toggle_theme():
     st.session_state.dark_mode = not st.session_state.dark_mode
 
+@st.fragment
+def theme_toggle():
+    # A click reruns only this fragment; its style block restyles the whole page
+    st.button("🌓 Toggle Theme", on_click=toggle_theme)
+    if st.session_state.dark_mode:
+        st.markdown(DARK_MODE_CSS, unsafe_allow_html=True)
+
 # Main app
 def main():
+    # Opt-in rerun profiling (?profile=1 or the sidebar toggle)
+    profiler = RerunProfiler("pd-hub", *profiling_requested(st.query_params, st.session_state))
+    
     # Load data
-    policies_df, producers_df, companies_df = load_data()
+    with profiler.span("load"):
+        dataset = load_data()
+        policies_df, producers_df, companies_df = dataset.frames()
+        filter_cache = load_filter_cache()
+        cube = load_policy_cube()
     
     # Header
     st.markdown("""
@@ -273,8 +183,7 @@ def main():
     # Theme toggle
     col1, col2 = st.columns([6, 1])
     with col2:
-        if st.button("🌓 Toggle Theme"):
-            toggle_theme()
+        theme_toggle()
     
     # Sidebar filters
     st.sidebar.markdown("### 🎛️ Smart Filters")
@@ -307,108 +216,209 @@ def main():
         max_value=max_date
     )
     
-    # Apply filters
-    filtered_df = policies_df.copy()
+    # Apply filters as one mask over the shared frame; only the selected rows are copied.
+    # Row positions and tab aggregates are cached per filter state
+    def filter_rows():
+        mask = row_mask(len(policies_df))
     
-    if selected_producer != "All Producers":
-        filtered_df = filtered_df[filtered_df['producer_name'] == selected_producer]
+        if selected_producer != "All Producers":
+            mask &= (policies_df['producer_name'] == selected_producer).to_numpy()
     
-    if selected_policy_type != "All Types":
-        filtered_df = filtered_df[filtered_df['policy_type'] == selected_policy_type]
+        if selected_policy_type != "All Types":
+            mask &= (policies_df['policy_type'] == selected_policy_type).to_numpy()
         
-    if selected_status != "All Statuses":
-        filtered_df = filtered_df[filtered_df['status'] == selected_status]
+        if selected_status != "All Statuses":
+            mask &= (policies_df['status'] == selected_status).to_numpy()
         
-    if selected_region != "All Regions":
-        filtered_df = filtered_df[filtered_df['producer_region'] == selected_region]
+        if selected_region != "All Regions":
+            mask &= (policies_df['producer_region'] == selected_region).to_numpy()
         
-    if selected_carrier != "All Carriers":
-        filtered_df = filtered_df[filtered_df['carrier'] == selected_carrier]
-    
-    if len(date_range) == 2:
-        start_date = pd.to_datetime(date_range[0])
-        end_date = pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)  # Include end date
-        filtered_df = filtered_df[
-            (filtered_df['created_date'] >= start_date) & 
-            (filtered_df['created_date'] < end_date)
-        ]
+        if selected_carrier != "All Carriers":
+            mask &= (policies_df['carrier'] == selected_carrier).to_numpy()
+    
+        if len(date_range) == 2:
+            start_date = pd.to_datetime(date_range[0])
+            end_date = pd.to_datetime(date_range[1]) + pd.Timedelta(days=1)  # Include end date
+            mask &= (
+                (policies_df['created_date'] >= start_date) & 
+                (policies_df['created_date'] < end_date)
+            ).to_numpy()
+        return np.flatnonzero(mask)
+    
+    with profiler.span("filter"):
+        filter_key = filter_state_key(
+            dataset.version, producer=selected_producer, policy_type=selected_policy_type, status=selected_status,
+            region=selected_region, carrier=selected_carrier, date_range=tuple(date_range)
+        )
+        filtered_df, bytes_copied = select_rows(policies_df, filter_cache.rows(filter_key, filter_rows))
+        aggregates = filter_cache.scope(filter_key)
+        
+        # Dashboard sums/counts/means roll up from the cube when the date range is month-aligned
+        selections = {
+            'producer_name': selected_producer != "All Producers" and selected_producer,
+            'policy_type': selected_policy_type != "All Types" and selected_policy_type,
+            'status': selected_status != "All Statuses" and selected_status,
+            'producer_region': selected_region != "All Regions" and selected_region,
+            'carrier': selected_carrier != "All Carriers" and selected_carrier
+        }
+        months = (None, None)
+        if len(date_range) == 2:
+            months = cube.months(pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1]) + pd.Timedelta(days=1))
+        cube_query = None
+        if months is not None:
+            cube_query = cube.query({column: [value] for column, value in selections.items() if value}, months)
+        rollup = Rollup(filtered_df, cube_query, 'created_date')
+    
+    cache_stats = filter_cache.stats()
+    st.sidebar.caption(f"📦 Copied this rerun: {bytes_copied / 1e6:,.2f} MB of {dataset.nbytes() / 1e6:,.1f} MB shared")
+    st.sidebar.caption(
+        f"♻️ Filter cache: {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses, "
+        f"{cache_stats['evictions']:,} evicted, {cache_stats['bytes'] / 1e6:,.1f} MB"
+    )
+    figure_stats = load_figure_cache().stats()
+    st.sidebar.caption(
+        f"🖼️ Figure cache: {figure_stats['hits']:,} hits / {figure_stats['misses']:,} misses "
+        f"({figure_stats['hit_rate']:.0%}), {figure_stats['bytes'] / 1e6:,.1f} MB"
+    )
+    if TAB_MODE == "prewarm":
+        prewarm_stats = load_tab_prewarmer().stats()
+        st.sidebar.caption(
+            f"🔥 Tab pre-warm: {prewarm_stats['completed']:,} done, {prewarm_stats['running']:,} running, "
+            f"{prewarm_stats['cancelled']:,} cancelled"
+        )
     
-    # Main tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    # Main tabs: only the open tab is computed unless HUB_TAB_MODE=eager
+    tabs = st.tabs([
         "📊 Executive Dashboard", 
         "🏆 Producer Scorecards", 
         "📈 Performance Analytics", 
         "💼 Policy Intelligence",
         "🎯 Top Performers"
-    ])
-    
-    with tab1:
-        executive_dashboard(filtered_df, policies_df)
-    
-    with tab2:
-        producer_scorecards(filtered_df, producers_df, selected_producer)
-    
-    with tab3:
-        performance_analytics(filtered_df)
-    
-    with tab4:
-        policy_intelligence(filtered_df)
+    ], **tab_options("pd_hub_tab"))
+    tab1, tab2, tab3, tab4, tab5 = tabs
+    
+    if visible(tab1):
+        with tab1, profiler.span("executive_dashboard"):
+            executive_dashboard(filtered_df, policies_df, aggregates, rollup)
+    
+    if visible(tab2):
+        with tab2, profiler.span("producer_scorecards"):
+            producer_scorecards(filtered_df, producers_df, selected_producer, aggregates)
+    
+    if visible(tab3):
+        with tab3, profiler.span("performance_analytics"):
+            performance_analytics(filtered_df, aggregates)
+    
+    if visible(tab4):
+        with tab4, profiler.span("policy_intelligence"):
+            policy_intelligence(filtered_df, aggregates)
+    
+    if visible(tab5):
+        with tab5, profiler.span("top_performers"):
+            top_performers(filtered_df, aggregates)
+    
+    # Compute the hidden tabs' summaries in the background so switching to them only draws
+    if TAB_MODE == "prewarm":
+        hidden = [
+            task for tab, tab_tasks in zip(tabs, summary_tasks(filtered_df, producers_df, selected_producer, rollup))
+            if not visible(tab) for task in tab_tasks
+        ]
+        owner = st.session_state.setdefault('prewarm_owner', uuid.uuid4().hex)
+        load_tab_prewarmer().submit(owner, filter_cache, filter_key, hidden)
     
-    with tab5:
-        top_performers(filtered_df)
+    # Rerun profile
+    profiler.context['rows'] = len(filtered_df)
+    profiler.finish()
+    profile_panel(profiler)
 
-def executive_dashboard(filtered_df, full_df):
+def summary_tasks(filtered_df, producers_df, selected_producer, rollup):
+    """(aggregate name, compute) per tab, in tab order, under the names the tab functions cache them as"""
+    if selected_producer == "All Producers":
+        scorecard_task = ('producer_stats', lambda: producer_overview(filtered_df))
+    else:
+        scorecard_task = (
+            f'producer_scorecard:{selected_producer}',
+            lambda: producer_scorecard(filtered_df, producers_df, selected_producer)
+        )
+    return [
+        [('policy_overview', lambda: policy_overview(rollup))],
+        [scorecard_task],
+        [
+            ('performance_summary', lambda: performance_summary(filtered_df)),
+            ('performance_charts', lambda: performance_chart_data(filtered_df))
+        ],
+        [('policy_intelligence', lambda: policy_intelligence_summary(filtered_df))],
+        [('top_performers', lambda: top_performer_summary(filtered_df))]
+    ]
+
+def profile_panel(profiler):
+    """Sidebar toggles for rerun profiling and, when on, this rerun's breakdown"""
+    st.sidebar.markdown("---")
+    st.sidebar.toggle("⏱️ Profile reruns", key=PROFILE_KEY)
+    st.sidebar.toggle("🔬 cProfile each span", key=CPROFILE_KEY)
+    if not profiler.enabled:
+        return
+    
+    with st.sidebar.expander(f"⏱️ Rerun Profile: {profiler.total_ms:,.0f} ms", expanded=True):
+        st.dataframe(
+            profiler.breakdown().style.format({'ms': '{:,.1f}', 'Share': '{:.1%}'}),
+            hide_index=True, use_container_width=True
+        )
+        for span, hotspots in profiler.hotspots.items():
+            st.caption(f"🔬 {span}")
+            st.code(hotspots, language=None)
+        st.caption(f"Spans logged to {profiler.log_path}")
+
+def executive_dashboard(filtered_df, full_df, aggregates, rollup):
     """Executive Dashboard with KPIs and overview charts"""
     
+    summary = aggregates('policy_overview', lambda: policy_overview(rollup))
+    figures = load_figure_cache()
+    
     # KPIs
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        total_premium = filtered_df['premium'].sum()
         st.markdown(f"""
         <div class="metric-card">
             <h3>💰 Total Premium</h3>
-            <h2>${total_premium:,.0f}</h2>
+            <h2>${summary['total_premium']:,.0f}</h2>
             <p>+12.5% vs last period</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        total_policies = len(filtered_df)
         st.markdown(f"""
         <div class="metric-card">
             <h3>📄 Total Policies</h3>
-            <h2>{total_policies:,}</h2>
+            <h2>{summary['total_policies']:,}</h2>
             <p>+8.3% vs last period</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        avg_premium = filtered_df['premium'].mean()
         st.markdown(f"""
         <div class="metric-card">
             <h3>📊 Avg Premium</h3>
-            <h2>${avg_premium:,.0f}</h2>
+            <h2>${summary['avg_premium']:,.0f}</h2>
             <p>+5.7% vs last period</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col4:
-        bind_rate = (filtered_df['status'] == 'Active').mean() * 100
         st.markdown(f"""
         <div class="metric-card">
             <h3>🎯 Bind Rate</h3>
-            <h2>{bind_rate:.1f}%</h2>
+            <h2>{summary['bind_rate']:.1f}%</h2>
             <p>+2.1% vs last period</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col5:
-        total_commission = filtered_df['commission'].sum()
         st.markdown(f"""
         <div class="metric-card">
             <h3>💵 Total Commission</h3>
-            <h2>${total_commission:,.0f}</h2>
+            <h2>${summary['total_commission']:,.0f}</h2>
             <p>+15.2% vs last period</p>
         </div>
         """, unsafe_allow_html=True)
@@ -418,102 +428,107 @@ def executive_dashboard(filtered_df, full_df):
     
     with col1:
         st.subheader("📈 Premium by Policy Type")
-        policy_premium = filtered_df.groupby('policy_type')['premium'].sum().sort_values(ascending=False)
-        fig = px.bar(
-            x=policy_premium.index,
-            y=policy_premium.values,
-            title="Premium Distribution by Policy Type",
-            labels={'x': 'Policy Type', 'y': 'Premium ($)'}
-        )
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            title_font=dict(size=16, color='#667eea')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        policy_premium = summary['premium_by_type']
+        
+        def policy_type_chart():
+            fig = px.bar(
+                x=policy_premium.index,
+                y=policy_premium.values,
+                title="Premium Distribution by Policy Type",
+                labels={'x': 'Policy Type', 'y': 'Premium ($)'}
+            )
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                title_font=dict(size=16, color='#667eea')
+            )
+            return fig
+        
+        st.plotly_chart(figures.figure('premium_by_type', policy_premium, policy_type_chart), use_container_width=True)
     
     with col2:
         st.subheader("🌍 Premium by Region")
-        region_premium = filtered_df.groupby('producer_region')['premium'].sum()
-        fig = px.pie(
-            values=region_premium.values,
-            names=region_premium.index,
-            title="Premium Distribution by Region"
+        region_premium = summary['premium_by_region']
+        
+        def region_chart():
+            fig = px.pie(
+                values=region_premium.values,
+                names=region_premium.index,
+                title="Premium Distribution by Region"
+            )
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                title_font=dict(size=16, color='#667eea')
+            )
+            return fig
+        
+        st.plotly_chart(figures.figure('premium_by_region', region_premium, region_chart), use_container_width=True)
+    
+    # Time series
+    st.subheader("📊 Monthly Premium Trends")
+    monthly_data = summary['monthly']
+    
+    def monthly_trends_chart():
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        
+        fig.add_trace(
+            go.Scatter(
+                x=monthly_data['created_date'],
+                y=monthly_data['premium'],
+                name="Premium",
+                line=dict(color='#667eea', width=3)
+            ),
+            secondary_y=False,
+        )
+        
+        fig.add_trace(
+            go.Scatter(
+                x=monthly_data['created_date'],
+                y=monthly_data['policy_id'],
+                name="Policy Count",
+                line=dict(color='#f093fb', width=3)
+            ),
+            secondary_y=True,
         )
+        
         fig.update_layout(
+            title="Monthly Premium and Policy Count Trends",
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             font=dict(size=12),
             title_font=dict(size=16, color='#667eea')
         )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Time series
-    st.subheader("📊 Monthly Premium Trends")
-    monthly_data = filtered_df.groupby(filtered_df['created_date'].dt.to_period('M')).agg({
-        'premium': 'sum',
-        'commission': 'sum',
-        'policy_id': 'count'
-    }).reset_index()
-    monthly_data['created_date'] = monthly_data['created_date'].astype(str)
-    
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    fig.add_trace(
-        go.Scatter(
-            x=monthly_data['created_date'],
-            y=monthly_data['premium'],
-            name="Premium",
-            line=dict(color='#667eea', width=3)
-        ),
-        secondary_y=False,
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=monthly_data['created_date'],
-            y=monthly_data['policy_id'],
-            name="Policy Count",
-            line=dict(color='#f093fb', width=3)
-        ),
-        secondary_y=True,
-    )
-    
-    fig.update_layout(
-        title="Monthly Premium and Policy Count Trends",
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        title_font=dict(size=16, color='#667eea')
-    )
-    
-    fig.update_yaxes(title_text="Premium ($)", secondary_y=False)
-    fig.update_yaxes(title_text="Policy Count", secondary_y=True)
+        
+        fig.update_yaxes(title_text="Premium ($)", secondary_y=False)
+        fig.update_yaxes(title_text="Policy Count", secondary_y=True)
+        return fig
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures.figure('monthly_trends', monthly_data, monthly_trends_chart), use_container_width=True)
 
-def producer_scorecards(filtered_df, producers_df, selected_producer):
-    """Detailed producer scorecards with comprehensive metrics"""
+@st.fragment
+def producer_scorecards(filtered_df, producers_df, sidebar_producer, aggregates):
+    """Detailed producer scorecards with comprehensive metrics
+    
+    A fragment: picking another producer here reruns only this tab, on the
+    filtered rows and cached aggregates of the last full run.
+    """
+    
+    # Scorecard picker, starting from the sidebar producer
+    producer_options = ["All Producers"] + sorted(filtered_df['producer_name'].unique())
+    selected_producer = st.selectbox(
+        "🎯 Scorecard",
+        producer_options,
+        index=producer_options.index(sidebar_producer) if sidebar_producer in producer_options else 0
+    )
     
     if selected_producer == "All Producers":
         st.subheader("🏆 Producer Performance Overview")
         
         # Producer summary stats
-        producer_stats = filtered_df.groupby('producer_name').agg({
-            'premium': ['sum', 'mean', 'count'],
-            'commission': 'sum',
-            'policy_id': 'count',
-            'customer_satisfaction': 'mean',
-            'bind_ratio': 'mean'
-        }).round(2)
-        
-        producer_stats.columns = ['Total Premium', 'Avg Premium', 'Premium Count', 'Total Commission', 
-                                'Policy Count', 'Avg Satisfaction', 'Bind Rate']
-        
-        # Add rankings
-        producer_stats['Premium Rank'] = producer_stats['Total Premium'].rank(method='dense', ascending=False)
-        producer_stats['Commission Rank'] = producer_stats['Total Commission'].rank(method='dense', ascending=False)
+        producer_stats = aggregates('producer_stats', lambda: producer_overview(filtered_df))
         
         # Display top performers
         st.markdown("### 🥇 Top 5 Producers by Premium")
@@ -566,14 +581,17 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         # Individual producer scorecard
         st.subheader(f"🎯 {selected_producer} - Complete Scorecard")
         
-        producer_data = filtered_df[filtered_df['producer_name'] == selected_producer]
+        scorecard = aggregates(
+            f'producer_scorecard:{selected_producer}',
+            lambda: producer_scorecard(filtered_df, producers_df, selected_producer)
+        )
         
-        if len(producer_data) == 0:
+        if scorecard is None:
             st.warning("No data available for the selected producer.")
             return
         
         # Producer info
-        producer_info = producers_df[producers_df['name'] == selected_producer].iloc[0]
+        producer_info = scorecard['info']
         
         col1, col2, col3 = st.columns(3)
         
@@ -589,31 +607,24 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
             """, unsafe_allow_html=True)
         
         with col2:
-            total_premium = producer_data['premium'].sum()
-            total_policies = len(producer_data)
-            avg_premium = producer_data['premium'].mean()
-            
             st.markdown(f"""
             <div class="producer-card">
                 <h4>💰 Performance Metrics</h4>
-                <p><strong>Total Premium:</strong> ${total_premium:,.0f}</p>
-                <p><strong>Total Policies:</strong> {total_policies}</p>
-                <p><strong>Avg Premium:</strong> ${avg_premium:,.0f}</p>
-                <p><strong>Total Commission:</strong> ${producer_data['commission'].sum():,.0f}</p>
+                <p><strong>Total Premium:</strong> ${scorecard['total_premium']:,.0f}</p>
+                <p><strong>Total Policies:</strong> {scorecard['total_policies']}</p>
+                <p><strong>Avg Premium:</strong> ${scorecard['avg_premium']:,.0f}</p>
+                <p><strong>Total Commission:</strong> ${scorecard['total_commission']:,.0f}</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col3:
-            bind_rate = (producer_data['status'] == 'Active').mean()
-            avg_satisfaction = producer_data['customer_satisfaction'].mean()
-            
             st.markdown(f"""
             <div class="producer-card">
                 <h4>🎯 Quality Metrics</h4>
-                <p><strong>Bind Rate:</strong> {bind_rate:.1%}</p>
-                <p><strong>Avg Satisfaction:</strong> {avg_satisfaction:.1f}/5</p>
-                <p><strong>Avg Risk Score:</strong> {producer_data['risk_score'].mean():.0f}</p>
-                <p><strong>Renewal Rate:</strong> {producer_data['renewal_probability'].mean():.1f}%</p>
+                <p><strong>Bind Rate:</strong> {scorecard['bind_rate']:.1%}</p>
+                <p><strong>Avg Satisfaction:</strong> {scorecard['avg_satisfaction']:.1f}/5</p>
+                <p><strong>Avg Risk Score:</strong> {scorecard['avg_risk_score']:.0f}</p>
+                <p><strong>Renewal Rate:</strong> {scorecard['renewal_rate']:.1f}%</p>
             </div>
             """, unsafe_allow_html=True)
         
@@ -622,7 +633,7 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         
         with col1:
             st.subheader("📊 Policy Type Distribution")
-            policy_dist = producer_data.groupby('policy_type')['premium'].sum().sort_values(ascending=False)
+            policy_dist = scorecard['policy_mix']
             
             fig = px.bar(
                 x=policy_dist.index,
@@ -639,14 +650,8 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         
         with col2:
             st.subheader("📈 Monthly Performance Trend")
-            monthly_producer = producer_data.groupby(producer_data['created_date'].dt.to_period('M')).agg({
-                'premium': 'sum',
-                'policy_id': 'count'
-            }).reset_index()
-            monthly_producer['created_date'] = monthly_producer['created_date'].astype(str)
-            
             fig = px.line(
-                monthly_producer,
+                scorecard['monthly'],
                 x='created_date',
                 y='premium',
                 title=f"{selected_producer}'s Monthly Premium Trend",
@@ -663,22 +668,10 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         # Producer ranking and expertise analysis
         st.subheader("🏆 Producer Rankings & Expertise")
         
-        # Calculate rankings across all producers
-        all_producer_stats = filtered_df.groupby('producer_name').agg({
-            'premium': 'sum',
-            'commission': 'sum',
-            'policy_id': 'count',
-            'customer_satisfaction': 'mean',
-            'bind_ratio': 'mean'
-        })
-        
-        producer_rank_premium = all_producer_stats['premium'].rank(method='dense', ascending=False)
-        producer_rank_policies = all_producer_stats['policy_id'].rank(method='dense', ascending=False)
-        producer_rank_satisfaction = all_producer_stats['customer_satisfaction'].rank(method='dense', ascending=False)
-        
-        current_producer_premium_rank = producer_rank_premium[selected_producer]
-        current_producer_policies_rank = producer_rank_policies[selected_producer]
-        current_producer_satisfaction_rank = producer_rank_satisfaction[selected_producer]
+        # Rankings across all producers
+        current_producer_premium_rank = scorecard['premium_rank']
+        current_producer_policies_rank = scorecard['policies_rank']
+        current_producer_satisfaction_rank = scorecard['satisfaction_rank']
         
         col1, col2, col3 = st.columns(3)
         
@@ -688,7 +681,7 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
             <div class="metric-card">
                 <h4>{rank_color} Premium Ranking</h4>
                 <h2>#{int(current_producer_premium_rank)}</h2>
-                <p>out of {len(all_producer_stats)} producers</p>
+                <p>out of {scorecard['producer_count']} producers</p>
             </div>
             """, unsafe_allow_html=True)
         
@@ -698,7 +691,7 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
             <div class="metric-card">
                 <h4>{rank_color} Policy Volume Ranking</h4>
                 <h2>#{int(current_producer_policies_rank)}</h2>
-                <p>out of {len(all_producer_stats)} producers</p>
+                <p>out of {scorecard['producer_count']} producers</p>
             </div>
             """, unsafe_allow_html=True)
         
@@ -708,7 +701,7 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
             <div class="metric-card">
                 <h4>{rank_color} Satisfaction Ranking</h4>
                 <h2>#{int(current_producer_satisfaction_rank)}</h2>
-                <p>out of {len(all_producer_stats)} producers</p>
+                <p>out of {scorecard['producer_count']} producers</p>
             </div>
             """, unsafe_allow_html=True)
         
@@ -716,30 +709,15 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         st.subheader("🎯 Expertise Analysis")
         
         # Policy type expertise
-        producer_policy_expertise = producer_data.groupby('policy_type').agg({
-            'premium': ['sum', 'count', 'mean'],
-            'bind_ratio': 'mean',
-            'customer_satisfaction': 'mean'
-        }).round(2)
-        
-        producer_policy_expertise.columns = ['Total Premium', 'Policy Count', 'Avg Premium', 'Bind Rate', 'Satisfaction']
-        producer_policy_expertise = producer_policy_expertise.sort_values('Total Premium', ascending=False)
-        
         st.dataframe(
-            producer_policy_expertise,
+            scorecard['expertise'],
             use_container_width=True
         )
         
         # Carrier relationships
         st.subheader("🤝 Carrier Relationships")
-        carrier_performance = producer_data.groupby('carrier').agg({
-            'premium': 'sum',
-            'policy_id': 'count',
-            'bind_ratio': 'mean'
-        }).sort_values('premium', ascending=False).head(10)
-        
         fig = px.bar(
-            carrier_performance.reset_index(),
+            scorecard['carriers'].reset_index(),
             x='carrier',
             y='premium',
             title=f"{selected_producer}'s Top Carriers by Premium",
@@ -753,43 +731,43 @@ def producer_scorecards(filtered_df, producers_df, selected_producer):
         )
         st.plotly_chart(fig, use_container_width=True)
 
-def performance_analytics(filtered_df):
+def performance_analytics(filtered_df, aggregates):
     """Advanced performance analytics and insights"""
     
     st.subheader("📈 Advanced Performance Analytics")
     
+    summary = aggregates('performance_summary', lambda: performance_summary(filtered_df))
+    # Large selections are sampled and binned server-side instead of shipping every policy to the browser
+    charts = aggregates('performance_charts', lambda: performance_chart_data(filtered_df))
+    
     # Performance metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        avg_days_to_close = filtered_df[filtered_df['status'] == 'Active']['quote_to_bind_days'].mean()
         st.metric(
             label="Avg Days to Bind",
-            value=f"{avg_days_to_close:.0f} days",
+            value=f"{summary['avg_days_to_bind']:.0f} days",
             delta="-3.2 days"
         )
     
     with col2:
-        conversion_rate = (filtered_df['status'] == 'Active').mean() * 100
         st.metric(
             label="Quote to Bind Rate",
-            value=f"{conversion_rate:.1f}%",
+            value=f"{summary['conversion_rate']:.1f}%",
             delta="2.3%"
         )
     
     with col3:
-        avg_policy_limit = filtered_df['policy_limit'].mean()
         st.metric(
             label="Avg Policy Limit",
-            value=f"${avg_policy_limit/1000000:.1f}M",
+            value=f"${summary['avg_policy_limit']/1000000:.1f}M",
             delta="$0.2M"
         )
     
     with col4:
-        retention_rate = filtered_df['renewal_probability'].mean()
         st.metric(
             label="Retention Rate",
-            value=f"{retention_rate:.1f}%",
+            value=f"{summary['retention_rate']:.1f}%",
             delta="1.8%"
         )
     
@@ -798,14 +776,16 @@ def performance_analytics(filtered_df):
     
     with col1:
         st.subheader("💼 Premium vs Policy Limit Analysis")
+        points = filtered_df if charts is None else charts['limit_sample']
         fig = px.scatter(
-            filtered_df,
+            points,
             x='policy_limit',
             y='premium',
             color='policy_type',
             size='commission',
             hover_data=['producer_name', 'carrier'],
-            title="Premium vs Policy Limit by Type"
+            title="Premium vs Policy Limit by Type",
+            render_mode=render_mode(len(points))
         )
         fig.update_layout(
             plot_bgcolor='rgba(0,0,0,0)',
@@ -814,10 +794,12 @@ def performance_analytics(filtered_df):
             title_font=dict(size=16, color='#667eea')
         )
         st.plotly_chart(fig, use_container_width=True)
+        if charts is not None:
+            st.caption(f"Showing {len(points):,} of {charts['rows']:,} policies: a sample stratified by type, extremes kept")
     
     with col2:
         st.subheader("⏱️ Quote to Bind Performance")
-        bind_performance = filtered_df[filtered_df['status'] == 'Active'].groupby('producer_name')['quote_to_bind_days'].mean().sort_values()
+        bind_performance = summary['bind_speed']
         
         fig = px.bar(
             x=bind_performance.values[:10],
@@ -841,13 +823,25 @@ def performance_analytics(filtered_df):
     
     with col1:
         st.subheader("🎯 Risk Score Distribution")
-        fig = px.histogram(
-            filtered_df,
-            x='risk_score',
-            nbins=20,
-            title="Risk Score Distribution",
-            labels={'risk_score': 'Risk Score', 'count': 'Number of Policies'}
-        )
+        if charts is None:
+            fig = px.histogram(
+                filtered_df,
+                x='risk_score',
+                nbins=20,
+                title="Risk Score Distribution",
+                labels={'risk_score': 'Risk Score', 'count': 'Number of Policies'}
+            )
+        else:
+            bins = charts['risk_histogram']
+            fig = px.bar(
+                bins,
+                x='bin_center',
+                y='count',
+                title="Risk Score Distribution",
+                labels={'bin_center': 'Risk Score', 'count': 'Number of Policies'}
+            )
+            fig.update_traces(width=bins['bin_end'] - bins['bin_start'])
+            fig.update_layout(bargap=0)
         fig.update_layout(
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
@@ -858,13 +852,31 @@ def performance_analytics(filtered_df):
     
     with col2:
         st.subheader("📊 Premium vs Risk Score")
-        fig = px.scatter(
-            filtered_df,
-            x='risk_score',
-            y='premium',
-            color='policy_type',
-            title="Premium vs Risk Score Analysis"
-        )
+        if charts is None:
+            fig = px.scatter(
+                filtered_df,
+                x='risk_score',
+                y='premium',
+                color='policy_type',
+                title="Premium vs Risk Score Analysis",
+                render_mode=render_mode(len(filtered_df))
+            )
+        else:
+            # Policy density per risk/premium cell
+            bins = charts['risk_premium_bins']
+            fig = go.Figure(go.Heatmap(
+                x=bins['risk_score'],
+                y=bins['premium'],
+                z=bins['count'],
+                colorscale='Viridis',
+                colorbar=dict(title='Policies'),
+                hovertemplate='Risk Score %{x:.0f}<br>Premium $%{y:,.0f}<br>%{z:,.0f} policies<extra></extra>'
+            ))
+            fig.update_layout(
+                title="Premium vs Risk Score Analysis",
+                xaxis_title='Risk Score',
+                yaxis_title='Premium'
+            )
         fig.update_layout(
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
@@ -873,16 +885,19 @@ def performance_analytics(filtered_df):
         )
         st.plotly_chart(fig, use_container_width=True)
 
-def policy_intelligence(filtered_df):
+def policy_intelligence(filtered_df, aggregates):
     """Policy intelligence and insights"""
     
     st.subheader("💼 Policy Intelligence Dashboard")
     
+    summary = aggregates('policy_intelligence', lambda: policy_intelligence_summary(filtered_df))
+    figures = load_figure_cache()
+    
     # Top insights
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        top_policy = filtered_df.loc[filtered_df['premium'].idxmax()]
+        top_policy = summary['top_policy']
         st.markdown(f"""
         <div class="top-performer">
             <h4>🏆 Highest Premium Policy</h4>
@@ -894,104 +909,81 @@ def policy_intelligence(filtered_df):
         """, unsafe_allow_html=True)
     
     with col2:
-        top_carrier = filtered_df.groupby('carrier')['premium'].sum().idxmax()
-        top_carrier_premium = filtered_df.groupby('carrier')['premium'].sum().max()
         st.markdown(f"""
         <div class="top-performer">
             <h4>🥇 Top Carrier</h4>
-            <p><strong>Carrier:</strong> {top_carrier}</p>
-            <p><strong>Total Premium:</strong> ${top_carrier_premium:,.0f}</p>
-            <p><strong>Policies:</strong> {len(filtered_df[filtered_df['carrier'] == top_carrier])}</p>
+            <p><strong>Carrier:</strong> {summary['top_carrier']}</p>
+            <p><strong>Total Premium:</strong> ${summary['top_carrier_premium']:,.0f}</p>
+            <p><strong>Policies:</strong> {summary['top_carrier_policies']}</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        top_account = filtered_df.groupby('company_name')['premium'].sum().idxmax()
-        top_account_premium = filtered_df.groupby('company_name')['premium'].sum().max()
         st.markdown(f"""
         <div class="top-performer">
             <h4>💎 Top Account</h4>
-            <p><strong>Company:</strong> {top_account}</p>
-            <p><strong>Total Premium:</strong> ${top_account_premium:,.0f}</p>
-            <p><strong>Policies:</strong> {len(filtered_df[filtered_df['company_name'] == top_account])}</p>
+            <p><strong>Company:</strong> {summary['top_account']}</p>
+            <p><strong>Total Premium:</strong> ${summary['top_account_premium']:,.0f}</p>
+            <p><strong>Policies:</strong> {summary['top_account_policies']}</p>
         </div>
         """, unsafe_allow_html=True)
     
     # Policy type analysis
     st.subheader("📊 Policy Type Performance Analysis")
     
-    policy_analysis = filtered_df.groupby('policy_type').agg({
-        'premium': ['sum', 'mean', 'count'],
-        'commission': 'sum',
-        'bind_ratio': 'mean',
-        'customer_satisfaction': 'mean',
-        'risk_score': 'mean'
-    }).round(2)
-    
-    policy_analysis.columns = [
-        'Total Premium', 'Avg Premium', 'Policy Count', 
-        'Total Commission', 'Bind Rate', 'Satisfaction', 'Risk Score'
-    ]
-    
-    st.dataframe(policy_analysis, use_container_width=True)
+    st.dataframe(summary['policy_types'], use_container_width=True)
     
     # Carrier performance
     st.subheader("🤝 Carrier Performance Dashboard")
     
-    carrier_metrics = filtered_df.groupby('carrier').agg({
-        'premium': ['sum', 'count'],
-        'commission': 'sum',
-        'bind_ratio': 'mean',
-        'customer_satisfaction': 'mean'
-    }).round(2)
-    
-    carrier_metrics.columns = ['Total Premium', 'Policy Count', 'Commission', 'Bind Rate', 'Satisfaction']
-    carrier_metrics = carrier_metrics.sort_values('Total Premium', ascending=False).head(15)
+    carrier_metrics = summary['carriers']
     
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.bar(
-            carrier_metrics.reset_index(),
-            x='carrier',
-            y='Total Premium',
-            title="Top 15 Carriers by Premium Volume"
-        )
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            title_font=dict(size=16, color='#667eea'),
-            xaxis_tickangle=-45
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def carrier_premium_chart():
+            fig = px.bar(
+                carrier_metrics.reset_index(),
+                x='carrier',
+                y='Total Premium',
+                title="Top 15 Carriers by Premium Volume"
+            )
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                title_font=dict(size=16, color='#667eea'),
+                xaxis_tickangle=-45
+            )
+            return fig
+        
+        st.plotly_chart(figures.figure('carrier_premium', carrier_metrics, carrier_premium_chart), use_container_width=True)
     
     with col2:
-        fig = px.scatter(
-            carrier_metrics.reset_index(),
-            x='Policy Count',
-            y='Total Premium',
-            size='Commission',
-            color='Satisfaction',
-            hover_name='carrier',
-            title="Carrier Performance Matrix"
-        )
-        fig.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(size=12),
-            title_font=dict(size=16, color='#667eea')
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        def carrier_matrix_chart():
+            fig = px.scatter(
+                carrier_metrics.reset_index(),
+                x='Policy Count',
+                y='Total Premium',
+                size='Commission',
+                color='Satisfaction',
+                hover_name='carrier',
+                title="Carrier Performance Matrix"
+            )
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=12),
+                title_font=dict(size=16, color='#667eea')
+            )
+            return fig
+        
+        st.plotly_chart(figures.figure('carrier_matrix', carrier_metrics, carrier_matrix_chart), use_container_width=True)
     
     # Referral source analysis
     st.subheader("🎯 Referral Source Performance")
     
-    referral_performance = filtered_df.groupby('referral_source').agg({
-        'premium': 'sum',
-        'policy_id': 'count',
-        'bind_ratio': 'mean'
-    }).sort_values('premium', ascending=False)
+    referral_performance = summary['referral_sources']
     
     top_referrer = referral_performance.index[0]
     top_referrer_premium = referral_performance.iloc[0]['premium']
@@ -1023,104 +1015,82 @@ def policy_intelligence(filtered_df):
         </div>
         """, unsafe_allow_html=True)
 
-def top_performers(filtered_df):
+def top_performers(filtered_df, aggregates):
     """Top performers across all categories"""
     
     st.subheader("🏆 Top Performers Hall of Fame")
     
+    summary = aggregates('top_performers', lambda: top_performer_summary(filtered_df))
+    figures = load_figure_cache()
+    
     # Top performers by different metrics
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("🥇 Top 10 Producers by Premium")
-        top_producers_premium = filtered_df.groupby('producer_name')['premium'].sum().sort_values(ascending=False).head(10)
-        
-        for i, (producer, premium) in enumerate(top_producers_premium.items()):
+        for i, (producer, totals) in enumerate(summary['by_premium'].iterrows()):
             rank_emoji = "🥇" if i == 0 else "🥈" if i == 1 else "🥉" if i == 2 else f"{i+1}."
-            policies_count = len(filtered_df[filtered_df['producer_name'] == producer])
             
             st.markdown(f"""
             <div class="producer-card">
                 <h5>{rank_emoji} {producer}</h5>
-                <p><strong>Premium:</strong> ${premium:,.0f}</p>
-                <p><strong>Policies:</strong> {policies_count}</p>
+                <p><strong>Premium:</strong> ${totals['premium']:,.0f}</p>
+                <p><strong>Policies:</strong> {totals['policies']:.0f}</p>
             </div>
             """, unsafe_allow_html=True)
     
     with col2:
         st.subheader("📊 Top 10 Producers by Policy Count")
-        top_producers_volume = filtered_df.groupby('producer_name').size().sort_values(ascending=False).head(10)
-        
-        for i, (producer, count) in enumerate(top_producers_volume.items()):
+        for i, (producer, totals) in enumerate(summary['by_volume'].iterrows()):
             rank_emoji = "🥇" if i == 0 else "🥈" if i == 1 else "🥉" if i == 2 else f"{i+1}."
-            premium_total = filtered_df[filtered_df['producer_name'] == producer]['premium'].sum()
             
             st.markdown(f"""
             <div class="producer-card">
                 <h5>{rank_emoji} {producer}</h5>
-                <p><strong>Policies:</strong> {count}</p>
-                <p><strong>Premium:</strong> ${premium_total:,.0f}</p>
+                <p><strong>Policies:</strong> {totals['policies']:.0f}</p>
+                <p><strong>Premium:</strong> ${totals['premium']:,.0f}</p>
             </div>
             """, unsafe_allow_html=True)
     
     # Performance comparison radar chart
     st.subheader("📈 Top 5 Producers Performance Radar")
     
-    top_5_producers = filtered_df.groupby('producer_name')['premium'].sum().sort_values(ascending=False).head(5).index
-    
-    radar_data = []
-    for producer in top_5_producers:
-        producer_data = filtered_df[filtered_df['producer_name'] == producer]
-        
-        metrics = {
-            'Premium': (producer_data['premium'].sum() / filtered_df['premium'].sum()) * 100,
-            'Policy Count': (len(producer_data) / len(filtered_df)) * 100,
-            'Bind Rate': producer_data['bind_ratio'].mean() * 100,
-            'Satisfaction': producer_data['customer_satisfaction'].mean() * 20,  # Scale to 100
-            'Avg Premium': (producer_data['premium'].mean() / filtered_df['premium'].mean()) * 100
-        }
-        
-        radar_data.append({
-            'Producer': producer,
-            'Premium': metrics['Premium'],
-            'Policy Count': metrics['Policy Count'],
-            'Bind Rate': metrics['Bind Rate'],
-            'Satisfaction': metrics['Satisfaction'],
-            'Avg Premium': metrics['Avg Premium']
-        })
+    radar_data = summary['radar'].to_dict('records')
     
     # Create radar chart
-    categories = ['Premium', 'Policy Count', 'Bind Rate', 'Satisfaction', 'Avg Premium']
-    
-    fig = go.Figure()
-    
-    colors = ['#667eea', '#f093fb', '#f5576c', '#4ecdc4', '#45b7d1']
+    categories = list(RADAR_AXES)
     
-    for i, producer_data in enumerate(radar_data):
-        values = [producer_data[cat] for cat in categories]
-        values += values[:1]  # Complete the circle
+    def radar_chart():
+        fig = go.Figure()
         
-        fig.add_trace(go.Scatterpolar(
-            r=values,
-            theta=categories + [categories[0]],
-            fill='toself',
-            name=producer_data['Producer'],
-            line_color=colors[i]
-        ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100]
-            )),
-        showlegend=True,
-        title="Top 5 Producers Performance Comparison",
-        font=dict(size=12),
-        title_font=dict(size=16, color='#667eea')
-    )
+        colors = ['#667eea', '#f093fb', '#f5576c', '#4ecdc4', '#45b7d1']
+        
+        for i, producer_data in enumerate(radar_data):
+            values = [producer_data[cat] for cat in categories]
+            values += values[:1]  # Complete the circle
+            
+            fig.add_trace(go.Scatterpolar(
+                r=values,
+                theta=categories + [categories[0]],
+                fill='toself',
+                name=producer_data['Producer'],
+                line_color=colors[i]
+            ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100]
+                )),
+            showlegend=True,
+            title="Top 5 Producers Performance Comparison",
+            font=dict(size=12),
+            title_font=dict(size=16, color='#667eea')
+        )
+        return fig
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures.figure('producer_radar', summary['radar'], radar_chart), use_container_width=True)
     
     # Company performance
     st.subheader("🏢 Top Client Companies")
@@ -1129,7 +1099,7 @@ def top_performers(filtered_df):
     
     with col1:
         st.subheader("💰 By Premium Volume")
-        top_companies_premium = filtered_df.groupby('company_name')['premium'].sum().sort_values(ascending=False).head(10)
+        top_companies_premium = summary['companies_by_premium']
         
         fig = px.bar(
             x=top_companies_premium.values,
@@ -1147,7 +1117,7 @@ def top_performers(filtered_df):
     
     with col2:
         st.subheader("📄 By Policy Count")
-        top_companies_volume = filtered_df.groupby('company_name').size().sort_values(ascending=False).head(10)
+        top_companies_volume = summary['companies_by_volume']
         
         fig = px.bar(
             x=top_companies_volume.values,
@@ -0,0 +1,168 @@
+"""Opt-in per-rerun timing and profiling for the Streamlit apps.
+
+A ``RerunProfiler`` is created at the top of every rerun. When profiling is
+off, which is the default, its spans do nothing. When it is on, the app wraps
+data loading, the filter block and each tab function in named spans. Calls to
+instrumented Streamlit elements (``st.plotly_chart``, ``st.dataframe``) made
+inside a span become nested spans, which separates Streamlit's serialization
+from the pandas and Plotly work done before it. With cProfile switched on,
+every top-level span also gets a profile: its hottest functions are shown in
+the panel, and the raw stats are dumped next to the log for snakeviz or
+``pstats``.
+
+``finish`` appends one JSON line per span to ``PROFILE_LOG``.
+
+Profiling is requested with the ``?profile=1`` (or ``?profile=cprofile``)
+query parameter, or with the sidebar toggles the apps keep in session state.
+"""
+
+import cProfile
+import contextlib
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+PROFILE_DIR = os.environ.get(
+    "HUB_PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".profiles")
+)
+PROFILE_LOG = os.path.join(PROFILE_DIR, "spans.jsonl")
+
+# Session-state keys of the sidebar toggles
+PROFILE_KEY = "profile_rerun"
+CPROFILE_KEY = "profile_cprofile"
+
+# Functions listed per span in the panel, by cumulative time
+HOTSPOT_LINES = 15
+
+# Each Streamlit script thread profiles its own rerun
+_active = threading.local()
+_log_lock = threading.Lock()
+
+
+def profiling_requested(query_params, session_state):
+    """(timers on, cProfile on) from the ``profile`` query parameter and the sidebar toggles"""
+    requested = str(query_params.get("profile", "")).lower()
+    cprofile = requested == "cprofile" or bool(session_state.get(CPROFILE_KEY))
+    enabled = cprofile or requested in ("1", "true", "spans") or bool(session_state.get(PROFILE_KEY))
+    return enabled, cprofile
+
+
+def instrument(module, attribute, span=None):
+    """Time ``module.attribute`` as a nested span whenever the calling thread is profiling
+
+    Patches the attribute once per process. Threads that are not profiling, and
+    calls made outside any span, go straight through to the original.
+    """
+    original = getattr(module, attribute)
+    if getattr(original, "_profiled", False):
+        return
+
+    @functools.wraps(original)
+    def timed(*args, **kwargs):
+        profiler = getattr(_active, "profiler", None)
+        if profiler is None or not profiler._stack:
+            return original(*args, **kwargs)
+        with profiler.span(span or attribute):
+            return original(*args, **kwargs)
+
+    timed._profiled = True
+    setattr(module, attribute, timed)
+
+
+class RerunProfiler:
+    """Spans recorded during one rerun of one app"""
+
+    def __init__(self, app, enabled=False, cprofile=False, log_path=PROFILE_LOG):
+        self.app = app
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.log_path = log_path
+        self.rerun = uuid.uuid4().hex[:12]
+        self.context = {}
+        self.spans = []
+        self.hotspots = {}
+        self.total_ms = None
+        self._stack = []
+        self._started = time.perf_counter()
+        _active.profiler = self if enabled else None
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """Time the enclosed block; cProfile it too if it is a top-level span and cProfile is on"""
+        if not self.enabled:
+            yield
+            return
+
+        record = {
+            "span": name, "parent": self._stack[-1]["span"] if self._stack else None, "depth": len(self._stack),
+            "start_ms": (time.perf_counter() - self._started) * 1e3
+        }
+        profile = None
+        if self.cprofile and not self._stack:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another session's profile is running (one profiler per interpreter on Python 3.12+)
+                profile = None
+        self._stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["ms"] = (time.perf_counter() - start) * 1e3
+            self._stack.pop()
+            self.spans.append(record)
+            if profile is not None:
+                profile.disable()
+                self._keep_profile(name, profile)
+
+    def _keep_profile(self, name, profile):
+        stream = io.StringIO()
+        pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(HOTSPOT_LINES)
+        self.hotspots[name] = stream.getvalue().strip()
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        profile.dump_stats(os.path.join(os.path.dirname(self.log_path), f"{self.app}-{self.rerun}-{name}.prof"))
+
+    def finish(self):
+        """Close the rerun and append its spans to the log"""
+        _active.profiler = None
+        if not self.enabled or self.total_ms is not None:
+            return
+        self.total_ms = (time.perf_counter() - self._started) * 1e3
+        stamp = datetime.now().isoformat(timespec="milliseconds")
+        lines = [
+            json.dumps({"time": stamp, "app": self.app, "rerun": self.rerun, **self.context, **record}, default=str)
+            for record in [*sorted(self.spans, key=lambda record: record["start_ms"]),
+                           {"span": "rerun", "parent": None, "depth": -1, "start_ms": 0.0, "ms": self.total_ms}]
+        ]
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        with _log_lock, open(self.log_path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def breakdown(self):
+        """Spans in rerun order, nested element calls summed per parent, plus untracked time"""
+        if not self.spans:
+            return pd.DataFrame(columns=["Span", "Calls", "ms", "Share"])
+        spans = pd.DataFrame(self.spans)
+        spans["parent"] = spans["parent"].fillna("")
+        rows = []
+        for record in spans[spans["depth"] == 0].sort_values("start_ms").itertuples():
+            rows.append((record.span, 1, record.ms))
+            nested = spans[(spans["depth"] == 1) & (spans["parent"] == record.span)].groupby("span", sort=False)["ms"]
+            rows += [(f"  └ {name}", len(ms), ms.sum()) for name, ms in nested]
+        table = pd.DataFrame(rows, columns=["Span", "Calls", "ms"])
+        total = self.total_ms if self.total_ms is not None else (time.perf_counter() - self._started) * 1e3
+        untracked = total - spans.loc[spans["depth"] == 0, "ms"].sum()
+        table.loc[len(table)] = ["Untracked (widgets, layout)", 0, untracked]
+        table.loc[len(table)] = ["Rerun total", 1, total]
+        table["Share"] = table["ms"] / total
+        return table
@@ -0,0 +1,100 @@
+"""Which dashboard tabs are computed on a rerun.
+
+``st.tabs`` runs every tab body on every rerun, so one filter change redoes
+each tab's aggregation and figures even though only one tab is on screen.
+``HUB_TAB_MODE`` picks the schedule:
+
+- ``lazy`` (default): the tabs track which one is selected and rerun the
+  script when the selection changes. Only the open tab is computed.
+- ``prewarm``: as ``lazy``, and after the open tab renders, the other tabs'
+  summaries are computed by a background thread pool into the ``FilterCache``.
+  Switching tabs then only builds figures. The tasks call the headless
+  ``analytics`` functions only, never ``st.*``.
+- ``eager``: every tab is computed on every rerun, as before.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+TAB_MODES = ("lazy", "prewarm", "eager")
+TAB_MODE = os.environ.get("HUB_TAB_MODE", "lazy")
+if TAB_MODE not in TAB_MODES:
+    raise ValueError(f"HUB_TAB_MODE must be one of {', '.join(TAB_MODES)}, got {TAB_MODE!r}")
+
+# Background workers shared by every session of the process
+PREWARM_WORKERS = int(os.environ.get("HUB_PREWARM_WORKERS", "2"))
+
+
+def tab_options(key, mode=TAB_MODE):
+    """Keyword arguments for ``st.tabs``: lazy modes track the selected tab and rerun on a switch"""
+    if mode == "eager":
+        return {}
+    return {"key": key, "on_change": "rerun"}
+
+
+def visible(tab):
+    """Whether to compute this tab; tabs that do not track selection (eager mode) are always computed"""
+    return tab.open is not False
+
+
+class TabPrewarmer:
+    """Background pool that fills a FilterCache with the summaries of tabs nobody is looking at yet
+
+    Each owner (one browser session) has at most one batch queued: submitting
+    a new batch cancels the owner's tasks that have not started, so stale filter
+    states are not warmed after the user has moved on. Summaries already cached
+    or already being computed are skipped.
+    """
+
+    def __init__(self, workers=PREWARM_WORKERS):
+        self._pool = ThreadPoolExecutor(max(1, workers), thread_name_prefix="tab-prewarm")
+        self._lock = threading.Lock()
+        self._running = set()
+        self._queued = {}
+        self.completed = self.failed = self.cancelled = 0
+
+    def submit(self, owner, filter_cache, key, tasks):
+        """Queue ``(name, compute)`` tasks for filter state ``key`` on behalf of ``owner``"""
+        # Cancelling runs the done callbacks, which take the lock, so cancel outside it
+        with self._lock:
+            stale = self._queued.pop(owner, ())
+        cancelled = sum(future.cancel() for future in stale)
+        with self._lock:
+            self.cancelled += cancelled
+            # Forget sessions whose batches have all finished
+            for done in [other for other, futures in self._queued.items() if all(f.done() for f in futures)]:
+                del self._queued[done]
+            submitted = []
+            for name, compute in tasks:
+                token = (key, name)
+                if token in self._running or filter_cache.cached(key, name):
+                    continue
+                self._running.add(token)
+                submitted.append((token, self._pool.submit(self._warm, filter_cache, key, name, compute)))
+            self._queued[owner] = [future for _, future in submitted]
+        # Release each slot when its task ends, including cancelled tasks that never ran
+        for token, future in submitted:
+            future.add_done_callback(lambda future, token=token: self._release(token))
+
+    def _warm(self, filter_cache, key, name, compute):
+        try:
+            filter_cache.get(key, name, compute)
+        except Exception:
+            # The tab recomputes in the foreground when opened and reports the error there
+            with self._lock:
+                self.failed += 1
+            raise
+        with self._lock:
+            self.completed += 1
+
+    def _release(self, token):
+        with self._lock:
+            self._running.discard(token)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "running": len(self._running), "completed": self.completed,
+                "failed": self.failed, "cancelled": self.cancelled
+            }
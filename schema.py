@@ -0,0 +1,156 @@
+"""Compact column schema for the opportunities and policies frames.
+
+Low-cardinality strings become categoricals (one small integer code per row
+plus a shared dictionary), integers are downcast to the narrowest type that
+holds their range, floats to float32, and date columns are datetime64.
+Applying a schema is idempotent, so it is safe on frames read back from a
+snapshot that were already compacted before they were written.
+"""
+
+import pandas as pd
+
+OPPORTUNITY_CATEGORICALS = [
+    "opportunity_name", "sales_rep_name",
+    "product_line", "product_complexity", "sales_stage", "lead_source",
+    "risk_level", "priority", "decision_maker", "decision_maker_title",
+    "competitive_advantage", "forecast_category", "next_best_action"
+]
+OPPORTUNITY_DATETIMES = [
+    "created_date", "expected_close_date", "last_activity_date",
+    "next_activity_date", "proposal_sent_date", "contract_sent_date"
+]
+
+# Star schema: opportunity rows carry only sales_rep_id/company_id; these attributes live on
+# the sales_team and companies dimension frames, keyed by fact column name -> dimension column
+REP_DIMENSION_COLUMNS = {
+    "sales_rep_region": "region",
+    "sales_rep_specialty": "specialty",
+    "sales_rep_experience": "experience_years",
+    "sales_rep_tier": "tier",
+    "sales_rep_quota": "quota_annual",
+    "sales_rep_performance": "performance_score",
+    "rep_avg_activities_per_week": "avg_activities_per_week",
+    "rep_emails_per_opp": "emails_per_opp",
+    "rep_calls_per_opp": "calls_per_opp",
+    "rep_meetings_per_opp": "meetings_per_opp",
+    "rep_avg_response_time_hours": "avg_response_time_hours",
+    "rep_decision_maker_access_rate": "decision_maker_access_rate",
+    "rep_proposal_win_rate": "proposal_win_rate",
+    "rep_avg_deal_size": "avg_deal_size",
+    "rep_avg_sales_cycle_days": "avg_sales_cycle_days",
+    "rep_lead_conversion_rate": "lead_conversion_rate",
+    "rep_cross_sell_rate": "cross_sell_rate",
+    "rep_referral_generation_rate": "referral_generation_rate",
+    "rep_linkedin_connections": "linkedin_connections",
+    "rep_industry_expertise_score": "industry_expertise_score",
+    "rep_negotiation_success_rate": "negotiation_success_rate",
+    "rep_client_satisfaction": "client_satisfaction"
+}
+COMPANY_DIMENSION_COLUMNS = {
+    "company_name": "name",
+    "company_industry": "industry",
+    "company_size": "size",
+    "company_employees": "employees",
+    "company_revenue": "annual_revenue",
+    "company_risk_profile": "risk_profile",
+    "company_credit_rating": "credit_rating",
+    "company_growth_rate": "growth_rate"
+}
+
+POLICY_CATEGORICALS = [
+    "producer_name", "producer_region", "producer_tier", "producer_specialty",
+    "company_name", "company_industry", "company_size",
+    "policy_type", "carrier", "referral_source", "status"
+]
+POLICY_DATETIMES = ["created_date", "effective_date", "expiration_date"]
+
+
+def compact_frame(df, categoricals=(), datetimes=()):
+    """Return a copy of ``df`` with categoricals, downcast numerics and datetime64 columns"""
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if column in categoricals:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype("category")
+        elif column in datetimes:
+            values = pd.to_datetime(values)
+        elif pd.api.types.is_bool_dtype(values.dtype):
+            pass
+        elif pd.api.types.is_integer_dtype(values.dtype):
+            values = pd.to_numeric(values, downcast="integer")
+        elif pd.api.types.is_float_dtype(values.dtype):
+            values = pd.to_numeric(values, downcast="float")
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def apply_opportunity_schema(opportunities_df, sales_team_df, companies_df):
+    """Compact the opportunities fact frame; the small dimension frames only get numeric downcasts"""
+    return (
+        compact_frame(opportunities_df, OPPORTUNITY_CATEGORICALS, OPPORTUNITY_DATETIMES),
+        compact_frame(sales_team_df),
+        compact_frame(companies_df)
+    )
+
+
+def apply_policy_schema(policies_df, producers_df, companies_df):
+    """Compact the policies frame; producers and companies only get numeric downcasts"""
+    return (
+        compact_frame(policies_df, POLICY_CATEGORICALS, POLICY_DATETIMES),
+        compact_frame(producers_df),
+        compact_frame(companies_df)
+    )
+
+
+def _dimension_values(dimension_df, keys, column):
+    """Look up ``column`` for each key in ``keys`` (matched against ``dimension_df['id']``)"""
+    positions = pd.Index(dimension_df["id"]).get_indexer(keys)
+    values = dimension_df[column]
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.to_numpy()[positions]
+    # Strings come back as categoricals over the dimension's values, one code per fact row
+    categories = values.astype("category")
+    return pd.Categorical.from_codes(categories.cat.codes.to_numpy()[positions], categories.cat.categories)
+
+
+def join_dimensions(opportunities_df, sales_team_df, companies_df, columns):
+    """Return ``opportunities_df`` with the requested rep/company attributes looked up by id.
+
+    ``columns`` uses the wide fact-table names (``sales_rep_tier``,
+    ``rep_proposal_win_rate``, ``company_industry`` ...). Join on the filtered
+    rows a tab actually shows rather than the whole fact table.
+    """
+    attributes = {}
+    for column in columns:
+        if column in REP_DIMENSION_COLUMNS:
+            attributes[column] = _dimension_values(
+                sales_team_df, opportunities_df["sales_rep_id"], REP_DIMENSION_COLUMNS[column]
+            )
+        elif column in COMPANY_DIMENSION_COLUMNS:
+            attributes[column] = _dimension_values(
+                companies_df, opportunities_df["company_id"], COMPANY_DIMENSION_COLUMNS[column]
+            )
+        else:
+            raise KeyError(f"{column} is not a sales_team or companies attribute")
+    return opportunities_df.assign(**attributes)
+
+
+def rep_profiles(sales_team_df):
+    """Sales team dimension indexed by rep name, with columns renamed to their fact-table names"""
+    renamed = {dimension: fact for fact, dimension in REP_DIMENSION_COLUMNS.items()}
+    return sales_team_df.rename(columns=renamed).set_index("name")
+
+
+def memory_report(before, after):
+    """Per-column deep memory usage and dtype before and after applying a schema, largest savings first"""
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_before": before.memory_usage(deep=True, index=False),
+        "bytes_after": after.memory_usage(deep=True, index=False)
+    })
+    report["saved"] = report["bytes_before"] - report["bytes_after"]
+    report = report.sort_values("saved", ascending=False)
+    report.loc["TOTAL"] = ["", "", report["bytes_before"].sum(), report["bytes_after"].sum(), report["saved"].sum()]
+    return report
@@ -0,0 +1,186 @@
+"""Versioned on-disk snapshot store for the generated datasets.
+
+Each snapshot is a directory of uncompressed Arrow IPC (Feather v2) files, one
+per frame, plus a ``manifest.json``. Snapshots are keyed by dataset name,
+format version, seed, row count and as-of date, so a restarted server
+memory-maps the files it wrote earlier instead of regenerating the data.
+A snapshot that fails to read is regenerated and replaced. After each
+write, only the ``HUB_SNAPSHOT_KEEP`` newest as-of dates of the same
+dataset, version, seed and row count are kept.
+
+pyarrow is optional: without it every call falls through to the generator.
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = feather = None
+
+from datagen import resolve_as_of
+
+# Bump when the generators or the stored schema change so stale snapshots are ignored
+SNAPSHOT_FORMAT_VERSION = 3
+
+SNAPSHOT_DIR = os.environ.get(
+    "HUB_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshots")
+)
+
+MANIFEST_NAME = "manifest.json"
+
+# As-of dates kept per dataset, version, seed and row count; older snapshots are deleted after a write
+SNAPSHOT_KEEP = int(os.environ.get("HUB_SNAPSHOT_KEEP", "2"))
+
+
+def snapshots_enabled():
+    """Snapshots need pyarrow and can be switched off with HUB_SNAPSHOTS=0"""
+    return feather is not None and os.environ.get("HUB_SNAPSHOTS", "1") != "0"
+
+
+def snapshot_key(dataset, seed, n_rows, as_of):
+    """Directory name identifying one generated dataset"""
+    return f"{_series_prefix(dataset, seed, n_rows)}{as_of:%Y%m%d}"
+
+
+def _series_prefix(dataset, seed, n_rows):
+    """Key shared by every as-of date of one dataset, version, seed and row count"""
+    return f"{dataset}-v{SNAPSHOT_FORMAT_VERSION}-seed{seed}-rows{n_rows}-"
+
+
+def snapshot_path(dataset, seed, n_rows, as_of=None, directory=None):
+    """Absolute path of the snapshot directory for these parameters"""
+    return os.path.join(directory or SNAPSHOT_DIR, snapshot_key(dataset, seed, n_rows, resolve_as_of(as_of)))
+
+
+def read_snapshot(path, frame_names):
+    """Memory-map every frame of a snapshot, or return None if it is missing, unreadable or from another format version"""
+    try:
+        with open(os.path.join(path, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION or manifest.get("frames") != list(frame_names):
+        return None
+
+    frames = []
+    for name in frame_names:
+        try:
+            table = feather.read_table(os.path.join(path, f"{name}.arrow"), memory_map=True)
+        except (OSError, pa.ArrowInvalid):
+            # Missing or truncated frame file; the caller regenerates and replaces the snapshot
+            return None
+        if table.num_rows != manifest.get("rows", {}).get(name):
+            return None
+        frames.append(table.to_pandas(split_blocks=True, types_mapper=_keep_lists_in_arrow))
+    return tuple(frames)
+
+
+def _keep_lists_in_arrow(arrow_type):
+    """Leave list columns (risk_factors, competitors) Arrow-backed; rows still read back as Python lists"""
+    if pa.types.is_list(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def write_snapshot(path, frame_names, frames, metadata):
+    """Write frames to a temporary directory and atomically move it into place"""
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=parent)
+    try:
+        for name, frame in zip(frame_names, frames):
+            feather.write_feather(
+                frame.reset_index(drop=True), os.path.join(staging, f"{name}.arrow"), compression="uncompressed"
+            )
+
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "frames": list(frame_names),
+            "rows": {name: len(frame) for name, frame in zip(frame_names, frames)},
+            "written_at": datetime.now().isoformat(timespec="seconds"),
+            **metadata
+        }
+        with open(os.path.join(staging, MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        try:
+            os.rename(staging, path)
+        except OSError:
+            if read_snapshot(path, frame_names) is not None:
+                # Another process published the same snapshot first; theirs is equivalent
+                shutil.rmtree(staging, ignore_errors=True)
+                return
+            # The snapshot in place is broken: move it aside and publish ours instead
+            _discard(path)
+            try:
+                os.rename(staging, path)
+            except OSError:
+                # Another process replaced it in the meantime
+                shutil.rmtree(staging, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _discard(path):
+    """Rename a snapshot directory out of the way, then delete it; readers that map its files keep them"""
+    aside = f"{path}.discard-{os.getpid()}"
+    try:
+        os.rename(path, aside)
+    except OSError:
+        return
+    shutil.rmtree(aside, ignore_errors=True)
+
+
+def prune_snapshots(dataset, seed, n_rows, keep=SNAPSHOT_KEEP, current=None, directory=None):
+    """Delete all but the ``keep`` newest as-of snapshots of one dataset, version, seed and row count
+
+    ``current`` (a snapshot path) is never deleted, even when its as-of date is older.
+    """
+    directory = directory or SNAPSHOT_DIR
+    pattern = re.compile(re.escape(_series_prefix(dataset, seed, n_rows)) + r"\d{8}$")
+    try:
+        names = sorted((name for name in os.listdir(directory) if pattern.match(name)), reverse=True)
+    except OSError:
+        return
+    for name in names[max(keep, 0):]:
+        path = os.path.join(directory, name)
+        if current is None or os.path.abspath(path) != os.path.abspath(current):
+            _discard(path)
+
+
+def load_or_generate(dataset, generator, frame_names, n_rows, seed, as_of=None, directory=None):
+    """Return the dataset's frames from the snapshot store, generating and persisting them on a miss.
+
+    ``generator(n_rows, seed=..., as_of=...)`` must return one DataFrame per
+    entry in ``frame_names``.
+    """
+    as_of = resolve_as_of(as_of)
+    if not snapshots_enabled():
+        return generator(n_rows, seed=seed, as_of=as_of)
+
+    path = snapshot_path(dataset, seed, n_rows, as_of, directory)
+    frames = read_snapshot(path, frame_names)
+    if frames is not None:
+        return frames
+
+    frames = generator(n_rows, seed=seed, as_of=as_of)
+    try:
+        write_snapshot(path, frame_names, frames, {
+            "dataset": dataset, "seed": seed, "n_rows": n_rows, "as_of": as_of.isoformat()
+        })
+        prune_snapshots(dataset, seed, n_rows, current=path, directory=directory)
+    except OSError:
+        # A read-only or full disk only costs us the next cold start
+        pass
+    return frames
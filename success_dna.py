@@ -0,0 +1,139 @@
+"""Success DNA: compare two reps or rep cohorts across every rep pattern metric.
+
+A cohort is a ``(kind, value)`` pair — one rep, a tier, a region, the top N
+reps by pattern score, or the rest of the team — so it can key a cache
+directly. ``compare_cohorts`` reports both cohort means and their difference
+for each ``rep_*`` metric, with a bootstrap confidence interval. The
+resamples are drawn as a count matrix (how often each rep lands in each
+resample, from one ``bincount``) and turned into resample means with a
+single matrix product, a chunk of resamples at a time.
+"""
+
+import numpy as np
+import pandas as pd
+
+from leaderboard import pattern_scores
+from schema import REP_DIMENSION_COLUMNS
+
+REP_METRICS = tuple(column for column in REP_DIMENSION_COLUMNS if column.startswith("rep_"))
+
+COHORT_KINDS = ("Rep", "Tier", "Region", "Top N", "Rest of Team")
+REST_OF_TEAM = ("Rest of Team", None)
+
+# Metrics where the smaller value is the better one
+LOWER_IS_BETTER = ("rep_avg_response_time_hours", "rep_avg_sales_cycle_days")
+
+# Radar axes of dna_scores, each scored 0-100
+DNA_AXES = ("Activity Level", "Response Speed", "Decision Access", "Win Rate", "Deal Size", "Client Satisfaction")
+
+# Resamples per count matrix; keeps the matrix around 10-20 MB for a 5,000-rep team
+RESAMPLE_CHUNK = 1000
+
+
+def metric_label(metric):
+    """'rep_avg_deal_size' -> 'Avg Deal Size'"""
+    return metric.removeprefix("rep_").replace("_", " ").title()
+
+
+def cohort_label(cohort):
+    kind, value = cohort
+    if kind == "Rep":
+        return value
+    if kind in ("Tier", "Region"):
+        return f"{value} {kind}"
+    if kind == "Top N":
+        return f"Top {value} Reps"
+    return kind
+
+
+def cohort_mask(profiles, cohort, other=None):
+    """Boolean array of the reps in ``cohort``; "Rest of Team" is everyone outside ``other``"""
+    kind, value = cohort
+    if kind == "Rep":
+        return (profiles.index == value)
+    if kind == "Tier":
+        return (profiles['sales_rep_tier'] == value).to_numpy()
+    if kind == "Region":
+        return (profiles['sales_rep_region'] == value).to_numpy()
+    if kind == "Top N":
+        scores = pattern_scores(profiles)['pattern_score']
+        return profiles.index.isin(scores.nlargest(value, keep="first").index)
+    if kind == "Rest of Team":
+        if other is None or other[0] == "Rest of Team":
+            raise ValueError("Rest of Team needs another cohort to compare against")
+        return ~cohort_mask(profiles, other)
+    raise ValueError(f"unknown cohort kind {kind!r}")
+
+
+def bootstrap_means(values, resamples, rng):
+    """Column means of ``resamples`` with-replacement resamples of the rows of ``values``, one row per resample"""
+    n_rows = len(values)
+    # float32 halves the count matrix and the product; resample means need nowhere near float64 precision
+    values = np.asarray(values, dtype=np.float32)
+    means = np.empty((resamples, values.shape[1]))
+    for first in range(0, resamples, RESAMPLE_CHUNK):
+        size = min(RESAMPLE_CHUNK, resamples - first)
+        picks = rng.integers(0, n_rows, (size, n_rows))
+        picks += (np.arange(size) * n_rows)[:, None]
+        counts = np.bincount(picks.ravel(), minlength=size * n_rows).reshape(size, n_rows).astype(np.float32)
+        means[first:first + size] = counts @ values / n_rows
+    return means
+
+
+def compare_cohorts(profiles, cohort_a, cohort_b, resamples=10000, confidence=0.95, seed=None, metrics=REP_METRICS):
+    """Per-metric means of two cohorts, their difference (A - B) and its bootstrap confidence interval.
+
+    The interval is NaN when either cohort has a single rep, since resampling
+    one value cannot show any spread; ``significant`` marks intervals that
+    exclude zero.
+    """
+    in_a = cohort_mask(profiles, cohort_a, cohort_b)
+    in_b = cohort_mask(profiles, cohort_b, cohort_a)
+    for cohort, members in ((cohort_a, in_a), (cohort_b, in_b)):
+        if not members.any():
+            raise ValueError(f"cohort {cohort_label(cohort)!r} has no reps")
+
+    values = profiles[list(metrics)].to_numpy(dtype=np.float64)
+    values_a, values_b = values[in_a], values[in_b]
+    mean_a, mean_b = values_a.mean(axis=0), values_b.mean(axis=0)
+    difference = mean_a - mean_b
+
+    low = high = np.full(len(metrics), np.nan)
+    if len(values_a) > 1 and len(values_b) > 1:
+        rng = np.random.default_rng(seed)
+        resampled = bootstrap_means(values_a, resamples, rng) - bootstrap_means(values_b, resamples, rng)
+        tail = (1 - confidence) / 2 * 100
+        low, high = np.percentile(resampled, [tail, 100 - tail], axis=0)
+
+    comparison = pd.DataFrame({
+        "metric": [metric_label(metric) for metric in metrics],
+        "mean_a": mean_a,
+        "mean_b": mean_b,
+        "difference": difference,
+        "ci_low": low,
+        "ci_high": high
+    }, index=pd.Index(metrics, name="column"))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        comparison["relative_difference"] = np.where(mean_b != 0, difference / np.abs(mean_b), np.nan)
+    # Relative difference oriented so that positive always means cohort A does better
+    better = np.where(comparison.index.isin(LOWER_IS_BETTER), -1, 1)
+    comparison["advantage"] = comparison["relative_difference"] * better
+    comparison["significant"] = (comparison["ci_low"] > 0) | (comparison["ci_high"] < 0)
+    comparison.attrs["reps"] = (int(in_a.sum()), int(in_b.sum()))
+    return comparison
+
+
+def dna_scores(profiles, cohort, other=None):
+    """Cohort mean of each ``DNA_AXES`` score, every axis on a 0-100 scale"""
+    scores = pattern_scores(profiles)
+    axes = pd.DataFrame({
+        "Activity Level": scores["activity_score"],
+        "Response Speed": scores["response_score"],
+        "Decision Access": scores["access_score"],
+        "Win Rate": scores["win_score"],
+        # Relative to the team's largest average deal
+        "Deal Size": profiles['rep_avg_deal_size'] / profiles['rep_avg_deal_size'].max() * 100,
+        # Satisfaction is rated out of 5
+        "Client Satisfaction": profiles['rep_client_satisfaction'] / 5 * 100
+    })
+    return axes[cohort_mask(profiles, cohort, other)].mean()